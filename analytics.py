@@ -0,0 +1,1052 @@
+# ==============================================================================
+# 🌱 극지식물(나도수영) 최적 EC 농도 연구 - 분석 코어
+# UI(Streamlit) 의존성 없이 로딩 · 표준 스키마 · 집계 · 모델 적합을 수행
+# ==============================================================================
+
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import io
+import json
+import os
+import threading
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from profiling import timed
+
+DATA_DIR = Path(os.environ.get("DASHBOARD_DATA_DIR", "data"))
+# 수집 저장소 위치 - 대시보드가 ingest 모듈을 올리지 않고도 저장소 유무를 확인할 수 있게 여기 둠
+STORE_DIR = Path(os.environ.get("DASHBOARD_STORE_DIR", "store"))
+
+# ==============================================================================
+# 1. 실험군(학교) 레지스트리 - 설정 파일에서 한 번 읽어 색인 (EC 오름차순 정렬)
+# ==============================================================================
+# 항목 형식 (schools.json 의 "schools" 목록)
+#   name       실험군 이름 (필수, 그래프 · 표에 쓰이는 키)
+#   ec_target  목표 EC (필수)
+#   school     소속 학교 (기본: name) - 한 학교에 EC 반복구가 여러 개일 때 사용
+#   replicate  반복구 번호 (선택)
+#   match      데이터 파일명에서 찾을 문자열 (기본: name, 긴 것부터 비교)
+#   color / emoji / gradient / highlight / condition / note   표시용 속성
+SCHOOLS_CONFIG = Path(os.environ.get("DASHBOARD_SCHOOLS", Path(__file__).with_name("schools.json")))
+DATASET_SCHOOLS_FILE = "bench_schools.json"   # 데이터 디렉터리의 추가 실험군 목록 (bench.py generate 가 생성)
+SCHOOL_DEFAULTS = {"color": "#b2bec3", "emoji": "⚪", "highlight": False, "condition": "", "note": "", "replicate": None}
+
+SCHOOL_INFO: dict[str, dict] = {}
+SCHOOL_NAMES_BY_EC: list[str] = []
+SCHOOL_NAMES: list[str] = []
+_match_keywords: list[tuple[str, str]] = []   # (NFC 파일명 키워드, 실험군) - 긴 키워드 우선
+
+
+def _school_entry(name: str, ec_target: float, defaults: dict, **attrs) -> dict:
+    info = {**defaults, **attrs, "ec_target": float(ec_target), "order": len(SCHOOL_INFO) + 1}
+    info.setdefault("school", name)
+    info.setdefault("match", name)
+    info.setdefault("gradient", [info["color"], info["color"]])
+    return info
+
+
+def _reindex_schools():
+    # 다른 모듈이 이름 목록을 import 해 쓰므로 제자리에서 갱신
+    SCHOOL_NAMES[:] = list(SCHOOL_INFO.keys())
+    SCHOOL_NAMES_BY_EC[:] = sorted(SCHOOL_INFO, key=lambda x: (SCHOOL_INFO[x]["ec_target"], SCHOOL_INFO[x]["order"]))
+    _match_keywords[:] = sorted(
+        ((unicodedata.normalize("NFC", info["match"]), name) for name, info in SCHOOL_INFO.items()),
+        key=lambda item: -len(item[0]),
+    )
+
+
+def load_school_registry(path: Path = SCHOOLS_CONFIG):
+    config = json.loads(Path(path).read_text(encoding="utf-8"))
+    defaults = {**SCHOOL_DEFAULTS, **config.get("defaults", {})}
+    SCHOOL_INFO.clear()
+    for i, entry in enumerate(config.get("schools", [])):
+        entry = dict(entry)
+        if "name" not in entry or "ec_target" not in entry:
+            raise ValueError(f"{path}: {i + 1}번째 항목에 name 과 ec_target 이 필요합니다")
+        name = entry.pop("name")
+        if name in SCHOOL_INFO:
+            raise ValueError(f"{path}: 실험군 이름이 중복되었습니다: {name}")
+        SCHOOL_INFO[name] = _school_entry(name, entry.pop("ec_target"), defaults, **entry)
+    _reindex_schools()
+
+
+def register_school(name: str, ec_target: float, color: str = "#b2bec3", emoji: str = "⚪", **attrs):
+    # 합성 데이터 등 설정 파일에 없는 실험군을 실행 중에 추가
+    SCHOOL_INFO[name] = _school_entry(name, ec_target, SCHOOL_DEFAULTS, color=color, emoji=emoji, **attrs)
+    _reindex_schools()
+
+
+def register_dataset_schools(data_dir: Path):
+    # 합성 데이터셋(bench.py generate)이 함께 저장한 {실험군: EC 목표} 중 등록되지 않은 것을 추가
+    schools_file = data_dir / DATASET_SCHOOLS_FILE
+    if not schools_file.exists():
+        return
+    for school, ec_target in json.loads(schools_file.read_text(encoding="utf-8")).items():
+        if school not in SCHOOL_INFO:
+            register_school(school, ec_target)
+
+
+def school_institutions() -> list[str]:
+    # 반복구를 묶은 소속 학교 목록 (등록 순서)
+    return list(dict.fromkeys(info["school"] for info in SCHOOL_INFO.values()))
+
+
+load_school_registry()
+
+# ==============================================================================
+# 2. 한글 파일명 안전 인식 함수
+# ==============================================================================
+def normalize_match(target: str, candidate: str) -> bool:
+    target_nfc = unicodedata.normalize("NFC", target)
+    target_nfd = unicodedata.normalize("NFD", target)
+    candidate_nfc = unicodedata.normalize("NFC", candidate)
+    candidate_nfd = unicodedata.normalize("NFD", candidate)
+    return target_nfc == candidate_nfc or target_nfd == candidate_nfd
+
+
+def find_file(directory: Path, keyword: str, extension: str) -> Path | None:
+    if not directory.exists():
+        return None
+    for file_path in directory.iterdir():
+        if file_path.suffix.lower() == extension:
+            file_name = file_path.stem
+            keyword_nfc = unicodedata.normalize("NFC", keyword)
+            keyword_nfd = unicodedata.normalize("NFD", keyword)
+            file_name_nfc = unicodedata.normalize("NFC", file_name)
+            file_name_nfd = unicodedata.normalize("NFD", file_name)
+            if keyword_nfc in file_name_nfc or keyword_nfd in file_name_nfd:
+                return file_path
+    return None
+
+# ==============================================================================
+# 3. 데이터 로딩 및 표준 스키마
+# ==============================================================================
+# 압축 파일은 임시 파일 없이 pandas 가 스트림으로 풀어서 읽음 (.zst 는 zstandard 패키지 필요)
+# XLSX 는 openpyxl 읽기 전용 모드로 행을 흘려 읽음 - 파일명에 실험군이 없으면 시트 이름으로 실험군을 찾음
+CSV_SUFFIXES = (".csv", ".csv.gz", ".csv.zst")
+WORKBOOK_SUFFIXES = (".xlsx", ".xlsm")
+SOURCE_SUFFIXES = CSV_SUFFIXES + WORKBOOK_SUFFIXES
+XLSX_BLOCK_ROWS = 20_000   # 행 튜플을 이만큼 모을 때마다 DataFrame 블록으로 변환
+
+
+def source_suffix(file_path: Path) -> str | None:
+    name = file_path.name.lower()
+    return next((suffix for suffix in SOURCE_SUFFIXES if name.endswith(suffix)), None)
+
+
+def match_school(file_name: str) -> str | None:
+    # "하늘고" 와 "하늘고-A" 처럼 겹치는 키워드는 가장 긴 것에 배정
+    file_name_nfc = unicodedata.normalize("NFC", file_name)
+    return next((school for keyword, school in _match_keywords if keyword in file_name_nfc), None)
+
+
+def discover_school_files(data_dir: Path, kind: str) -> dict[str, Path]:
+    # 파일명에 kind("환경"/"생육")와 실험군 키워드가 들어간 원본 파일을 실험군별로 하나씩 찾음
+    found = {}
+
+    if not data_dir.exists():
+        return found
+
+    for file_path in sorted(data_dir.iterdir()):
+        suffix = source_suffix(file_path)
+        if suffix is None or file_path.name.startswith("~$"):   # ~$ 는 Excel 잠금 파일
+            continue
+        file_name_nfc = unicodedata.normalize("NFC", file_path.name[:-len(suffix)])
+        if kind not in file_name_nfc:
+            continue
+        school = match_school(file_name_nfc)
+        if school is not None:
+            found.setdefault(school, file_path)
+        elif suffix in WORKBOOK_SUFFIXES:
+            for sheet_school in workbook_schools(file_path).values():
+                found.setdefault(sheet_school, file_path)
+
+    return found
+
+
+def _open_workbook(file_path: Path):
+    from openpyxl import load_workbook   # 첫 화면에 필요 없으므로 지연 로드
+
+    # read_only: 시트를 셀 객체로 전부 만들지 않고 XML 을 순차 파싱 / data_only: 수식 대신 저장된 값
+    return load_workbook(file_path, read_only=True, data_only=True)
+
+
+def workbook_schools(file_path: Path) -> dict[str, str]:
+    # 시트 이름 -> 실험군 (시트 목록은 workbook.xml 만 읽으므로 시트 크기와 무관)
+    workbook = _open_workbook(file_path)
+    try:
+        sheets = {name: match_school(name) for name in workbook.sheetnames}
+    finally:
+        workbook.close()
+    return {name: school for name, school in sheets.items() if school is not None}
+
+
+def _typed_block(rows: list[tuple], columns: list[str]) -> pd.DataFrame:
+    # read_csv 와 같은 타입이 되도록 전부 숫자로 바뀌는 object 컬럼만 숫자형으로 변환
+    # (결측이 있는 정수 컬럼은 read_csv 처럼 float64 가 됨)
+    return _align_types(pd.DataFrame.from_records(rows, columns=columns))
+
+
+def _align_types(block: pd.DataFrame) -> pd.DataFrame:
+    # 블록을 이어 붙여 object 가 된 컬럼(예: 한 블록은 전부 빈 칸, 다른 블록은 문자열)도 다시 추론
+    for col in block.columns[block.dtypes == object]:
+        numeric = pd.to_numeric(block[col], errors="coerce")
+        if numeric.notna().sum() == block[col].notna().sum():
+            block[col] = numeric.astype(float) if numeric.isna().any() else numeric
+        else:
+            block[col] = pd.Series(block[col].tolist(), index=block.index, name=col)
+    return block
+
+
+def _is_blank(values: tuple) -> bool:
+    return all(v is None or (isinstance(v, str) and not v.strip()) for v in values)
+
+
+def iter_xlsx_blocks(file_path: Path, sheet: str | None = None, block_rows: int = XLSX_BLOCK_ROWS):
+    # 첫 번째 비어 있지 않은 행을 헤더로 보고 block_rows 행씩 DataFrame 으로 내보냄
+    # 헤더 아래의 빈 행은 CSV 의 ",,,," 행을 read_csv 가 결측 행으로 남기는 것과 같게 모두 결측 행으로 유지
+    workbook = _open_workbook(file_path)
+    try:
+        worksheet = workbook[sheet] if sheet else workbook.worksheets[0]
+        columns, rows, emitted = None, [], False
+        for values in worksheet.iter_rows(values_only=True):
+            if columns is None:
+                if not _is_blank(values):
+                    columns = [str(v).strip() if v is not None else f"Unnamed: {i}" for i, v in enumerate(values)]
+                continue
+            values = tuple(None if isinstance(v, str) and not v.strip() else v for v in values[:len(columns)])
+            rows.append(values + (None,) * (len(columns) - len(values)))
+            if len(rows) >= block_rows:
+                yield _typed_block(rows, columns)
+                rows, emitted = [], True
+        if columns is not None and (rows or not emitted):
+            yield _typed_block(rows, columns)
+    finally:
+        workbook.close()
+
+
+def school_sheet(file_path: Path, school: str) -> str | None:
+    # 파일명이 실험군을 가리키면 첫 시트(None), 아니면 실험군 이름의 시트
+    if match_school(file_path.stem) == school:
+        return None
+    sheet = next((name for name, s in workbook_schools(file_path).items() if s == school), None)
+    if sheet is None:
+        raise KeyError(f"{file_path.name}: {school} 시트가 없습니다")
+    return sheet
+
+
+def read_xlsx_sheet(file_path: Path, school: str) -> pd.DataFrame:
+    blocks = list(iter_xlsx_blocks(file_path, school_sheet(file_path, school), XLSX_BLOCK_ROWS))
+    if not blocks:
+        return pd.DataFrame()
+    return _align_types(pd.concat(blocks, ignore_index=True)) if len(blocks) > 1 else blocks[0]
+
+
+@timed
+def read_school_file(file_path: Path, lower_columns: bool, school: str | None = None) -> pd.DataFrame:
+    if source_suffix(file_path) in WORKBOOK_SUFFIXES:
+        df = read_xlsx_sheet(file_path, school or match_school(file_path.stem))
+    else:
+        df = pd.read_csv(file_path, encoding="utf-8-sig")
+    df.columns = [
+        unicodedata.normalize("NFC", col.strip().lower() if lower_columns else col.strip())
+        for col in df.columns
+    ]
+    stat = file_path.stat()
+    df.attrs[SOURCE_TOKEN] = f"{file_path.resolve()}|{school or ''}|{stat.st_mtime_ns}|{stat.st_size}|{_sample_digest(df)}"
+    return df
+
+
+def _load_school_files(data_dir: Path, kind: str, lower_columns: bool) -> dict[str, pd.DataFrame]:
+    school_data = {}
+    for school, file_path in discover_school_files(data_dir, kind).items():
+        try:
+            school_data[school] = read_school_file(file_path, lower_columns, school)
+        except Exception as e:
+            pass
+    return school_data
+
+
+def dataset_fingerprint(data_dir: Path = DATA_DIR) -> str:
+    # 파일 내용을 읽지 않고 이름 · 크기 · 수정 시각만으로 데이터셋 버전을 식별 (ETag 등에 사용)
+    digest = hashlib.blake2b(digest_size=16)
+    for kind in ("환경", "생육"):
+        for school, file_path in sorted(discover_school_files(data_dir, kind).items()):
+            stat = file_path.stat()
+            digest.update(f"{kind}|{school}|{file_path.name}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_environment_data(data_dir: Path = DATA_DIR) -> dict[str, pd.DataFrame]:
+    return _load_school_files(data_dir, "환경", lower_columns=True)
+
+
+def load_growth_data(data_dir: Path = DATA_DIR) -> dict[str, pd.DataFrame]:
+    return _load_school_files(data_dir, "생육", lower_columns=False)
+
+
+# ------------------------------------------------------------------------------
+# 데이터셋 파티션 (실험 / 시즌별 하위 디렉터리)
+#   data/                      루트에 파일이 있으면 기본 파티션 ("")
+#   data/<실험>/<시즌>/        환경 · 생육 CSV 가 있는 디렉터리 하나가 파티션 하나
+#   data/.../partition.json    선택 사항: {"label": ..., "experiment": ..., "season": ...}
+#   data/manifest.json         파티션 색인 (없으면 디렉터리를 훑고, 기록된 파일이 바뀌었으면 다시 만듦)
+# ------------------------------------------------------------------------------
+MANIFEST_FILE = "manifest.json"
+PARTITION_META_FILE = "partition.json"
+PARTITION_MAX_DEPTH = 2
+
+
+def _partition_entry(data_dir: Path, part_dir: Path) -> dict | None:
+    env_files = discover_school_files(part_dir, "환경")
+    growth_files = discover_school_files(part_dir, "생육")
+    if not env_files and not growth_files:
+        return None
+    part_id = part_dir.relative_to(data_dir).as_posix() if part_dir != data_dir else ""
+    meta_file = part_dir / PARTITION_META_FILE
+    meta = json.loads(meta_file.read_text(encoding="utf-8")) if meta_file.exists() else {}
+    return {
+        "id": part_id,
+        "label": meta.get("label") or part_id or f"기본 ({data_dir.name}/)",
+        "experiment": meta.get("experiment"),
+        "season": meta.get("season"),
+        "schools": sorted(set(env_files) | set(growth_files), key=SCHOOL_NAMES_BY_EC.index),
+        "fingerprint": dataset_fingerprint(part_dir),
+    }
+
+
+def discover_partitions(data_dir: Path = DATA_DIR) -> list[dict]:
+    if not data_dir.exists():
+        return []
+    partitions = []
+    pending = [(data_dir, 0)]
+    while pending:
+        part_dir, depth = pending.pop(0)
+        entry = _partition_entry(data_dir, part_dir)
+        if entry is not None:
+            partitions.append(entry)
+        if depth < PARTITION_MAX_DEPTH:
+            pending += [(d, depth + 1) for d in sorted(part_dir.iterdir()) if d.is_dir() and not d.name.startswith(".")]
+    return partitions
+
+
+def _manifest_stats(data_dir: Path) -> dict:
+    # 파티션을 찾는 범위의 디렉터리 수정 시각(파일 · 하위 디렉터리 추가 · 삭제)과 그 안 파일의 크기 · 수정 시각
+    dirs, files = {}, {}
+    pending = [(data_dir, 0)]
+    while pending:
+        current, depth = pending.pop(0)
+        dirs[current.relative_to(data_dir).as_posix()] = current.stat().st_mtime_ns
+        for child in sorted(current.iterdir()):
+            if child.name.startswith(".") or child == data_dir / MANIFEST_FILE:
+                continue
+            if child.is_dir():
+                if depth < PARTITION_MAX_DEPTH:
+                    pending.append((child, depth + 1))
+            else:
+                stat = child.stat()
+                files[child.relative_to(data_dir).as_posix()] = [stat.st_size, stat.st_mtime_ns]
+    return {"dirs": dirs, "files": files}
+
+
+def _manifest_is_current(data_dir: Path, stats: dict | None) -> bool:
+    # 디렉터리를 다시 훑지 않고 기록해 둔 경로만 stat 해서 비교
+    if not stats:
+        return False
+    try:
+        for rel, mtime in stats["dirs"].items():
+            if (data_dir / rel).stat().st_mtime_ns != mtime:
+                return False
+        for rel, (size, mtime) in stats["files"].items():
+            stat = (data_dir / rel).stat()
+            if stat.st_size != size or stat.st_mtime_ns != mtime:
+                return False
+    except FileNotFoundError:
+        return False
+    return True
+
+
+def write_manifest(data_dir: Path = DATA_DIR) -> list[dict]:
+    manifest_file = data_dir / MANIFEST_FILE
+    manifest_file.touch(exist_ok=True)   # 색인 파일 생성으로 바뀌는 디렉터리 수정 시각을 기록 전에 반영
+    partitions = discover_partitions(data_dir)
+    manifest = {"version": 2, "partitions": partitions, "stats": _manifest_stats(data_dir)}
+    manifest_file.write_text(json.dumps(manifest, ensure_ascii=False, indent=2), encoding="utf-8")
+    return partitions
+
+
+def load_manifest(data_dir: Path = DATA_DIR) -> list[dict]:
+    # 색인이 있고 기록된 디렉터리 · 파일이 그대로면 디렉터리를 훑지 않음. 바뀌었으면 다시 훑어 색인을 갱신
+    manifest_file = data_dir / MANIFEST_FILE
+    if not manifest_file.exists():
+        return discover_partitions(data_dir)
+    manifest = json.loads(manifest_file.read_text(encoding="utf-8"))
+    if _manifest_is_current(data_dir, manifest.get("stats")):
+        return manifest["partitions"]
+    try:
+        return write_manifest(data_dir)
+    except OSError:
+        return discover_partitions(data_dir)   # 읽기 전용 데이터 디렉터리
+
+
+def partition_dir(data_dir: Path, partition_id: str) -> Path:
+    target = (data_dir / partition_id).resolve() if partition_id else data_dir.resolve()
+    if target != data_dir.resolve() and data_dir.resolve() not in target.parents:
+        raise ValueError(f"데이터 디렉터리 밖의 파티션입니다: {partition_id}")
+    return target
+
+
+def merge_live_readings(env_data: dict[str, pd.DataFrame], live: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    # 수집 서비스 저장소의 표준 컬럼(time + 측정값)을 학교별 원본 CSV 컬럼 이름에 맞춰 이어 붙임
+    merged = dict(env_data)
+    for school, readings in live.items():
+        if school not in SCHOOL_INFO or readings.empty:
+            continue
+        base = env_data.get(school)
+        rename = {"time": "time"}
+        if base is not None:
+            rename["time"] = get_column_safe(base, ["time", "시간", "날짜"]) or "time"
+            rename.update({metric: get_column_safe(base, keywords) or metric for metric, keywords in ENV_METRICS.items()})
+        extra = readings.rename(columns=rename)
+        extra[rename["time"]] = extra[rename["time"]].dt.strftime("%Y-%m-%d %H:%M:%S")
+        merged[school] = extra if base is None else pd.concat([base, extra], ignore_index=True)
+    return merged
+
+
+def get_column_safe(df: pd.DataFrame, keywords: list[str]) -> str | None:
+    for col in df.columns:
+        col_lower = col.lower()
+        for kw in keywords:
+            if kw in col_lower:
+                return col
+    return None
+
+
+def parse_time_column(series: pd.Series) -> pd.Series:
+    # "2025-05-26 13시" 같은 한글 시각 표기를 "13:00" 으로 바꾼 뒤 일괄 파싱
+    text = series.astype(str).str.strip().str.replace(r"\s+(\d{1,2})시$", r" \1:00", regex=True)
+    return pd.to_datetime(text, errors="coerce", format="mixed")
+
+
+ENV_METRICS = {
+    "temperature": ["temp", "온도"],
+    "humidity": ["humid", "습도"],
+    "ph": ["ph"],
+    "ec": ["ec"],
+}
+METRIC_LABELS = {"temperature": "온도", "humidity": "습도", "ph": "pH", "ec": "EC"}
+
+GROWTH_OUTCOMES = {
+    "생중량": ["생중량", "weight", "중량"],
+    "잎 수": ["잎", "leaf"],
+    "지상부 길이": ["지상부", "shoot"],
+    "지하부 길이": ["지하부", "root"],
+}
+
+# 내용 기반 메모이제이션 (같은 데이터면 재계산하지 않음, 오래된 항목부터 제거)
+# 세션 스레드와 사전 계산 스레드가 함께 쓰므로 조회 · 삽입 · 제거는 잠금 안에서, 계산은 잠금 밖에서 수행
+# 파티션 여러 개의 프레임이 쌓일 수 있으므로 항목 수와 함께 대략적인 총 바이트로도 제한
+_MEMO_SIZE = 512
+_MEMO_BYTES = int(os.environ.get("DASHBOARD_MEMO_MB", "256")) * 1024 * 1024
+_memo: OrderedDict[tuple, tuple[object, int]] = OrderedDict()   # 키 -> (값, 바이트)
+_memo_bytes = 0
+_memo_lock = threading.Lock()
+
+
+def _approx_bytes(value) -> int:
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    return int(getattr(value, "nbytes", 0)) or 1024   # 작은 dict · 스칼라 결과
+
+
+def _memoize(key: tuple, compute):
+    global _memo_bytes
+    with _memo_lock:
+        if key in _memo:
+            _memo.move_to_end(key)
+            return _memo[key][0]
+    value = compute()
+    size = _approx_bytes(value)
+    with _memo_lock:
+        if key in _memo:
+            _memo_bytes -= _memo.pop(key)[1]
+        _memo[key] = (value, size)
+        _memo_bytes += size
+        # 방금 넣은 항목은 남김 (한도보다 큰 결과도 이번 호출에는 재사용되도록)
+        while len(_memo) > 1 and (len(_memo) > _MEMO_SIZE or _memo_bytes > _MEMO_BYTES):
+            _memo_bytes -= _memo.popitem(last=False)[1][1]
+    return value
+
+
+# 로더가 원본 파일(경로 · 시트 · 수정 시각 · 크기)로 만든 식별자를 df.attrs 에 붙여 둠 - pickle(st.cache_data)을
+# 거쳐도 유지되므로 메모 키를 만들 때 행 전체를 해시하지 않아도 됨. attrs 는 필터링 · concat 결과에도 따라갈 수 있어
+# 행 수 · 표본 행 · 기본 인덱스가 로드 당시 그대로인 프레임에만 식별자를 인정하고, 나머지는 내용 해시로 돌아감
+SOURCE_TOKEN = "source_token"
+
+
+def _sample_digest(df: pd.DataFrame) -> str:
+    # 처음 · 가운데 · 끝 행만 해시 (행 수와 무관한 상수 비용)
+    sample = df.iloc[sorted({0, len(df) // 2, len(df) - 1})] if len(df) else df
+    digest = hashlib.blake2b(pd.util.hash_pandas_object(sample, index=False).to_numpy().tobytes(), digest_size=8)
+    return f"{len(df)}:{digest.hexdigest()}"
+
+
+def source_token(df: pd.DataFrame) -> str | None:
+    token = df.attrs.get(SOURCE_TOKEN)
+    if not token or not token.endswith(f"|{_sample_digest(df)}"):
+        return None
+    index = df.index
+    if not (isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1):
+        return None
+    return f"{token}|{'|'.join(map(str, df.columns))}"
+
+
+def frame_key(df: pd.DataFrame) -> str:
+    return source_token(df) or frame_fingerprint(df)
+
+
+def frame_fingerprint(df: pd.DataFrame) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("|".join(map(str, df.columns)).encode("utf-8"))
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def array_fingerprint(*arrays: np.ndarray) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for arr in arrays:
+        digest.update(np.ascontiguousarray(arr).tobytes())
+    return digest.hexdigest()
+
+
+@timed
+def prepare_env_frame(df: pd.DataFrame) -> pd.DataFrame:
+    # 학교별 원본을 time(datetime) + 표준 측정 컬럼으로 정리 (시간순 정렬, 반환값은 공유되므로 수정 금지)
+    def compute():
+        time_col = get_column_safe(df, ["time", "시간", "날짜"])
+        frame = pd.DataFrame(index=df.index)
+        frame["time"] = parse_time_column(df[time_col]) if time_col else pd.NaT
+        for metric, keywords in ENV_METRICS.items():
+            col = get_column_safe(df, keywords)
+            frame[metric] = pd.to_numeric(df[col], errors="coerce") if col else np.nan
+        frame = frame.dropna(subset=["time"]).sort_values("time").reset_index(drop=True)
+        frame.attrs = {SOURCE_TOKEN: f"env|{key}|{_sample_digest(frame)}"} if source_token(df) else {}
+        return frame
+
+    key = frame_key(df)
+    return _memoize(("env_frame", key), compute)
+
+# ==============================================================================
+# 4. 학교별 집계 및 모델 적합
+# ==============================================================================
+@timed
+def build_env_summary(env_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    env_summary = []
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in env_data:
+            df = env_data[school]
+            temp_col = get_column_safe(df, ["temp", "온도"])
+            humid_col = get_column_safe(df, ["humid", "습도"])
+            ph_col = get_column_safe(df, ["ph"])
+            ec_col = get_column_safe(df, ["ec"])
+
+            env_summary.append({
+                "학교": school,
+                "EC": SCHOOL_INFO[school]["ec_target"],
+                "평균 온도": df[temp_col].mean() if temp_col else 0,
+                "평균 습도": df[humid_col].mean() if humid_col else 0,
+                "평균 pH": df[ph_col].mean() if ph_col else 0,
+                "실측 EC": df[ec_col].mean() if ec_col else 0,
+                "목표 EC": SCHOOL_INFO[school]["ec_target"],
+                "색상": SCHOOL_INFO[school]["color"]
+            })
+
+    return pd.DataFrame(env_summary)
+
+
+@timed
+def compute_overview_metrics(env_data: dict[str, pd.DataFrame], growth_data: dict[str, pd.DataFrame]) -> dict[str, float]:
+    total_count = sum(len(growth_data.get(s, pd.DataFrame())) for s in SCHOOL_NAMES)
+
+    all_temps, all_humid = [], []
+    for school, df in env_data.items():
+        temp_col = get_column_safe(df, ["temp", "온도"])
+        humid_col = get_column_safe(df, ["humid", "습도"])
+        if temp_col:
+            all_temps.append(df[temp_col].dropna())
+        if humid_col:
+            all_humid.append(df[humid_col].dropna())
+
+    avg_temp = pd.concat(all_temps).mean() if all_temps else 0
+    avg_humid = pd.concat(all_humid).mean() if all_humid else 0
+    return {"total_count": total_count, "avg_temp": avg_temp, "avg_humid": avg_humid}
+
+
+@timed
+def build_ec_weight_table(growth_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    ec_weight_data = []
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in growth_data:
+            df = growth_data[school]
+            weight_col = get_column_safe(df, ["생중량", "weight", "중량"])
+            if weight_col:
+                ec_weight_data.append({
+                    "학교": school,
+                    "EC": SCHOOL_INFO[school]["ec_target"],
+                    "평균 생중량": df[weight_col].mean(),
+                    "색상": SCHOOL_INFO[school]["color"]
+                })
+
+    if not ec_weight_data:
+        return pd.DataFrame()
+    return pd.DataFrame(ec_weight_data).sort_values("EC")
+
+
+def optimal_school(ec_weight_df: pd.DataFrame | None = None) -> str | None:
+    # 설정에서 highlight 로 표시한 실험군, 없으면 평균 생중량이 가장 큰 실험군 (표가 없거나 비었으면 None)
+    highlighted = [name for name in SCHOOL_NAMES_BY_EC if SCHOOL_INFO[name]["highlight"]]
+    if highlighted:
+        return highlighted[0]
+    if ec_weight_df is None or ec_weight_df.empty or ec_weight_df["평균 생중량"].isna().all():
+        return None
+    return ec_weight_df.loc[ec_weight_df["평균 생중량"].idxmax(), "학교"]
+
+
+@timed
+def fit_weight_trend(ec_weight_df: pd.DataFrame, n_points: int = 50) -> tuple[np.ndarray, np.ndarray] | None:
+    # EC-생중량 2차 추세선 (학교가 3곳 미만이면 적합하지 않음)
+    x_vals = ec_weight_df["EC"].values
+    y_vals = ec_weight_df["평균 생중량"].values
+    if len(x_vals) < 3:
+        return None
+    z = np.polyfit(x_vals, y_vals, 2)
+    p = np.poly1d(z)
+    x_trend = np.linspace(x_vals.min(), x_vals.max(), n_points)
+    return x_trend, p(x_trend)
+
+
+@timed
+def build_length_table(growth_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    length_data = []
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in growth_data:
+            df = growth_data[school]
+            shoot_col = get_column_safe(df, ["지상부", "shoot"])
+            root_col = get_column_safe(df, ["지하부", "root"])
+
+            shoot_avg = df[shoot_col].mean() if shoot_col else 0
+            root_avg = df[root_col].mean() if root_col else 0
+
+            length_data.append({
+                "학교": school,
+                "EC": SCHOOL_INFO[school]["ec_target"],
+                "지상부": shoot_avg,
+                "지하부": root_avg,
+                "T/R율": shoot_avg / root_avg if root_avg > 0 else 0
+            })
+
+    if not length_data:
+        return pd.DataFrame()
+    return pd.DataFrame(length_data).sort_values("EC")
+
+
+@timed
+def build_growth_long(growth_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    # 학교별 생육 데이터를 하나로 합치고 학교/EC/라벨 컬럼을 붙임 (EC 오름차순)
+    all_growth = []
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in growth_data:
+            df = growth_data[school].copy()
+            df["학교"] = school
+            df["EC"] = SCHOOL_INFO[school]["ec_target"]
+            df["label"] = f"{school}\n(EC {SCHOOL_INFO[school]['ec_target']})"
+            all_growth.append(df)
+
+    if not all_growth:
+        return pd.DataFrame()
+    return pd.concat(all_growth, ignore_index=True).sort_values("EC", kind="stable")
+
+@timed
+def export_env_csv(df: pd.DataFrame) -> bytes:
+    return df.to_csv(index=False).encode("utf-8-sig")
+
+
+@timed
+def export_growth_xlsx(growth_data: dict[str, pd.DataFrame]) -> bytes:
+    xlsx_buffer = io.BytesIO()
+    with pd.ExcelWriter(xlsx_buffer, engine="openpyxl") as writer:
+        for school in SCHOOL_NAMES_BY_EC:
+            if school in growth_data:
+                growth_data[school].to_excel(writer, sheet_name=school, index=False)
+    return xlsx_buffer.getvalue()
+
+# ==============================================================================
+# 5. 환경 특성 추출 (Feature Engineering)
+# ==============================================================================
+BASE_TEMP = 5.0            # 적산온도 기준온도(°C) - 저온성 식물 기준
+EC_BAND_TOLERANCE = 0.2    # 목표 EC ±20% 이내를 목표 구간으로 간주
+PH_RANGE = (5.5, 6.5)      # 수경재배 적정 pH 범위
+
+
+def sample_weights(hours: np.ndarray) -> np.ndarray:
+    # 각 측정값이 대표하는 시간(h) - 측정 간격이 학교마다 달라(10분~1일) 시간 가중이 필요
+    if len(hours) < 2:
+        return np.ones(len(hours))
+    dt = np.diff(hours)
+    return np.append(dt, np.median(dt))
+
+
+def compute_metric_features(metric: str, hours: np.ndarray, values: np.ndarray, ec_target: float,
+                            token: str | None = None) -> dict[str, float]:
+    # token 은 hours / values 를 만든 프레임의 식별자 (없으면 배열 내용을 해시)
+    def compute():
+        label = METRIC_LABELS[metric]
+        valid = ~np.isnan(values)
+        if not valid.any():
+            return {}
+        h, v = hours[valid], values[valid]
+        w = sample_weights(h)
+
+        features = {
+            f"{label} 평균": float(v.mean()),
+            f"{label} 분산": float(v.var()),
+        }
+        if metric == "ec":
+            in_band = np.abs(v - ec_target) <= ec_target * EC_BAND_TOLERANCE
+            features["EC 목표구간 비율"] = float(w[in_band].sum() / w.sum())
+        elif metric == "ph":
+            excursion = (v < PH_RANGE[0]) | (v > PH_RANGE[1])
+            features["pH 이탈 비율"] = float(w[excursion].sum() / w.sum())
+        return features
+
+    return _memoize(("metric_features", metric, ec_target, token or array_fingerprint(hours, values)), compute)
+
+
+# ------------------------------------------------------------------------------
+# 누적 노출 지수 (사다리꼴 적분)
+# ------------------------------------------------------------------------------
+CUMULATIVE_INDICES = {
+    "적산온도(°C·h)": "#ff6b6b",
+    "EC 누적 노출량(dS/m·h)": "#00ff88",
+    "누적 포차(kPa·h)": "#00d4ff",
+}
+
+
+def index_rates(frame: pd.DataFrame) -> np.ndarray:
+    # 시점별 순간 노출량 (결측은 직전 값 유지 - 뒤쪽 행이 추가되어도 앞부분 결과가 변하지 않음)
+    temp = frame["temperature"].ffill().fillna(BASE_TEMP).to_numpy(dtype=float)
+    humid = frame["humidity"].ffill().fillna(100.0).to_numpy(dtype=float)
+    ec = frame["ec"].ffill().fillna(0.0).to_numpy(dtype=float)
+    saturation_vp = 0.6108 * np.exp(17.27 * temp / (temp + 237.3))  # Tetens 식 (kPa)
+    vpd = np.clip(saturation_vp * (1 - humid / 100), 0, None)
+    return np.column_stack([np.clip(temp - BASE_TEMP, 0, None), ec, vpd])
+
+
+def cumulative_trapezoid(hours: np.ndarray, rates: np.ndarray) -> np.ndarray:
+    steps = 0.5 * (rates[1:] + rates[:-1]) * np.diff(hours)[:, None]
+    return np.vstack([np.zeros((1, rates.shape[1])), np.cumsum(steps, axis=0)])
+
+
+def compute_cumulative_indices(frame: pd.DataFrame, previous: pd.DataFrame | None = None) -> pd.DataFrame:
+    # previous 가 frame 의 앞부분과 일치하면 마지막 행부터 이어서 새로 추가된 구간만 적분
+    start = 0
+    if previous is not None and 0 < len(previous) <= len(frame) \
+            and previous["time"].iloc[-1] == frame["time"].iloc[len(previous) - 1]:
+        start = len(previous) - 1
+
+    tail = frame.iloc[start:]
+    hours = ((tail["time"] - frame["time"].iloc[0]) / pd.Timedelta(hours=1)).to_numpy()
+    cumulative = cumulative_trapezoid(hours, index_rates(tail))
+    result = pd.DataFrame(cumulative, columns=list(CUMULATIVE_INDICES))
+    result.insert(0, "time", tail["time"].to_numpy())
+
+    if start == 0:
+        return result
+    result[list(CUMULATIVE_INDICES)] += previous[list(CUMULATIVE_INDICES)].iloc[-1].to_numpy()
+    return pd.concat([previous, result.iloc[1:]], ignore_index=True)
+
+
+# (파티션 범위, 학교) -> (원본 식별자, 계산에 쓴 구간의 내용 지문, 누적 결과)
+# 식별자가 같으면 해시 없이 재사용하고, 식별자가 없으면(실시간 병합) 앞부분 내용이 같을 때만 이어 붙임
+_cumulative_store: dict[tuple[str, str], tuple[str | None, str | None, pd.DataFrame]] = {}
+
+
+def clear_caches():
+    global _memo_bytes
+    with _memo_lock:
+        _memo.clear()
+        _memo_bytes = 0
+    _cumulative_store.clear()
+
+
+def _prefix_fingerprints(frame: pd.DataFrame, prefix_rows: int) -> tuple[str, str]:
+    # 행 해시를 한 번만 계산해 앞부분 지문과 전체 지문을 함께 만듦 (앞부분 지문 = 그 길이였을 때의 전체 지문)
+    source = frame[["time", *ENV_METRICS]]
+    hashes = pd.util.hash_pandas_object(source, index=True).to_numpy()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("|".join(source.columns).encode("utf-8"))
+    digest.update(hashes[:prefix_rows].tobytes())
+    prefix = digest.hexdigest()
+    digest.update(hashes[prefix_rows:].tobytes())
+    return prefix, digest.hexdigest()
+
+
+@timed
+def get_cumulative_indices(school: str, frame: pd.DataFrame, scope: str = "") -> pd.DataFrame:
+    # scope 는 데이터 출처(파티션 경로 등) - 다른 데이터셋의 같은 학교 결과를 재사용하지 않도록 구분
+    key = (scope, school)
+    token = source_token(frame)
+    entry = _cumulative_store.get(key)
+    if token is not None:
+        if entry is not None and entry[0] == token:
+            return entry[2]
+        result = compute_cumulative_indices(frame)
+        _cumulative_store[key] = (token, None, result)
+        return result
+
+    previous = None
+    cached_rows = len(entry[2]) if entry is not None and entry[1] is not None and len(entry[2]) <= len(frame) else 0
+    prefix, full = _prefix_fingerprints(frame, cached_rows)
+    if cached_rows and prefix == entry[1]:
+        if cached_rows == len(frame):
+            return entry[2]
+        previous = entry[2]
+    result = compute_cumulative_indices(frame, previous)
+    _cumulative_store[key] = (None, full, result)
+    return result
+
+
+# ------------------------------------------------------------------------------
+# 일주기 / 주간 프로필 (정수 버킷 코드 + bincount 단일 집계)
+# ------------------------------------------------------------------------------
+PROFILE_LAYOUTS = ["시간 × 요일", "시간 × 날짜"]
+WEEKDAY_LABELS = ["월", "화", "수", "목", "금", "토", "일"]
+
+
+@timed
+def compute_profile_grid(frame: pd.DataFrame, metric: str, layout: str) -> pd.DataFrame:
+    values = frame[metric].to_numpy(dtype=float)
+    times = pd.DatetimeIndex(frame["time"])
+    valid = ~np.isnan(values)
+    hour = times.hour.to_numpy()
+
+    if layout == "시간 × 요일":
+        row_code = times.weekday.to_numpy()
+        row_labels = WEEKDAY_LABELS
+    else:
+        days = times.normalize()
+        row_code = ((days - days.min()) // pd.Timedelta(days=1)).to_numpy() if len(days) else np.array([], dtype=int)
+        row_labels = pd.date_range(days.min(), days.max(), freq="D").strftime("%m-%d").tolist() if len(days) else []
+
+    n_cells = len(row_labels) * 24
+    code = (row_code * 24 + hour)[valid]
+    sums = np.bincount(code, weights=values[valid], minlength=n_cells)
+    counts = np.bincount(code, minlength=n_cells)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        grid = np.where(counts > 0, sums / counts, np.nan)
+    return pd.DataFrame(grid.reshape(len(row_labels), 24), index=row_labels, columns=range(24))
+
+
+@timed
+def build_feature_table(env_data: dict[str, pd.DataFrame], scope: str = "") -> pd.DataFrame:
+    # 학교 x 지표 단위로 메모이즈되므로 학교/지표가 추가되어도 새 조합만 계산됨
+    rows = {}
+    for school in SCHOOL_NAMES_BY_EC:
+        if school not in env_data:
+            continue
+        frame = prepare_env_frame(env_data[school])
+        if frame.empty:
+            continue
+        hours = ((frame["time"] - frame["time"].iloc[0]) / pd.Timedelta(hours=1)).to_numpy()
+        row = {}
+        for metric in ENV_METRICS:
+            row.update(compute_metric_features(
+                metric, hours, frame[metric].to_numpy(dtype=float), SCHOOL_INFO[school]["ec_target"],
+                source_token(frame)
+            ))
+        row.update(get_cumulative_indices(school, frame, scope)[list(CUMULATIVE_INDICES)].iloc[-1].to_dict())
+        rows[school] = row
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+@timed
+def build_growth_outcomes(growth_data: dict[str, pd.DataFrame]) -> pd.DataFrame:
+    rows = {}
+    for school in SCHOOL_NAMES_BY_EC:
+        if school not in growth_data:
+            continue
+        df = growth_data[school]
+        row = {}
+        for name, keywords in GROWTH_OUTCOMES.items():
+            col = get_column_safe(df, keywords)
+            if col:
+                row[f"평균 {name}"] = pd.to_numeric(df[col], errors="coerce").mean()
+        if row.get("평균 지하부 길이"):
+            row["T/R율"] = row.get("평균 지상부 길이", 0) / row["평균 지하부 길이"]
+        rows[school] = row
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+@timed
+def build_feature_correlation(features: pd.DataFrame, outcomes: pd.DataFrame) -> pd.DataFrame:
+    joined = features.join(outcomes, how="inner")
+    # 학교 간 변동이 없는 특성은 상관계수가 정의되지 않으므로 제외
+    joined = joined.loc[:, joined.nunique() > 1]
+    feature_cols = [c for c in features.columns if c in joined.columns]
+    outcome_cols = [c for c in outcomes.columns if c in joined.columns]
+    if len(joined) < 3 or not feature_cols or not outcome_cols:
+        return pd.DataFrame()
+    return joined.corr().loc[feature_cols, outcome_cols]
+
+# ==============================================================================
+# 6. 개체별 탐색 (속성별 정렬 인덱스 - 범위 필터는 이진 탐색, 정렬 · 상위 k 는 정렬 순서 재사용)
+# ==============================================================================
+PLANT_ATTRIBUTES = list(GROWTH_OUTCOMES)
+OUTLIER_IQR = 1.5   # 학교별 Q1 - 1.5·IQR ~ Q3 + 1.5·IQR 밖이면 이상치
+
+
+class PlantIndex:
+    def __init__(self, growth_data: dict[str, pd.DataFrame]):
+        parts = []
+        for school in SCHOOL_NAMES_BY_EC:
+            df = growth_data.get(school)
+            if df is None or df.empty:
+                continue
+            no_col = get_column_safe(df, ["개체", "no", "id"])
+            part = pd.DataFrame({"학교": school, "EC": SCHOOL_INFO[school]["ec_target"]}, index=df.index)
+            part["개체번호"] = pd.to_numeric(df[no_col], errors="coerce") if no_col else np.arange(1, len(df) + 1)
+            for attr, keywords in GROWTH_OUTCOMES.items():
+                col = get_column_safe(df, keywords)
+                part[attr] = pd.to_numeric(df[col], errors="coerce") if col else np.nan
+            parts.append(part.dropna(subset=PLANT_ATTRIBUTES, how="all"))   # 원본 CSV 의 빈 행 제외
+
+        # 생육 파일이 하나도 없어도 수치 컬럼은 float 로 유지 (object 면 quantile 이 실패)
+        frame = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(
+            {"학교": pd.Series(dtype=object), **{col: pd.Series(dtype=float) for col in ["EC", "개체번호"] + PLANT_ATTRIBUTES}})
+        frame["학교"] = pd.Categorical(frame["학교"], categories=SCHOOL_NAMES_BY_EC)
+        self.frame = frame
+        self._codes = frame["학교"].cat.codes.to_numpy()
+
+        # 속성마다 정렬 순서(NaN 은 뒤) · 정렬된 유효값 · 학교별 IQR 이상치 마스크를 한 번만 계산
+        self._order, self._sorted, self.outliers = {}, {}, {}
+        for attr in PLANT_ATTRIBUTES:
+            values = frame[attr].to_numpy(dtype=float)
+            order = np.argsort(values, kind="stable")
+            n_valid = int((~np.isnan(values)).sum())
+            self._order[attr] = order
+            self._sorted[attr] = values[order[:n_valid]]
+
+            quartiles = frame.groupby("학교", observed=False)[attr].quantile([0.25, 0.75]).unstack()
+            q1 = quartiles[0.25].to_numpy()[self._codes]
+            q3 = quartiles[0.75].to_numpy()[self._codes]
+            iqr = q3 - q1
+            with np.errstate(invalid="ignore"):
+                self.outliers[attr] = (values < q1 - OUTLIER_IQR * iqr) | (values > q3 + OUTLIER_IQR * iqr)
+        self.any_outlier = np.logical_or.reduce(list(self.outliers.values())) if len(frame) \
+            else np.zeros(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    @property
+    def nbytes(self) -> int:
+        arrays = [self._codes, self.any_outlier, *self._order.values(), *self._sorted.values(), *self.outliers.values()]
+        return int(self.frame.memory_usage(index=True).sum()) + sum(a.nbytes for a in arrays)
+
+    def bounds(self, attr: str) -> tuple[float, float] | None:
+        values = self._sorted[attr]
+        return (float(values[0]), float(values[-1])) if len(values) else None
+
+    def range_mask(self, attr: str, lo: float, hi: float) -> np.ndarray:
+        # 정렬된 값에서 양 끝 위치만 이진 탐색 - 구간 안 개체 수에 비례하는 비용
+        start = np.searchsorted(self._sorted[attr], lo, side="left")
+        stop = np.searchsorted(self._sorted[attr], hi, side="right")
+        mask = np.zeros(len(self.frame), dtype=bool)
+        mask[self._order[attr][start:stop]] = True
+        return mask
+
+    def select(self, ranges: dict[str, tuple[float, float]] | None = None, schools: list[str] | None = None,
+               outlier_attr: str | None = None) -> np.ndarray:
+        # 전체 범위를 덮는 조건은 건너뜀 (값이 없는 개체를 불필요하게 빼지 않도록)
+        mask = np.ones(len(self.frame), dtype=bool)
+        for attr, (lo, hi) in (ranges or {}).items():
+            full = self.bounds(attr)
+            if full is not None and (lo > full[0] or hi < full[1]):
+                mask &= self.range_mask(attr, lo, hi)
+        if schools is not None:
+            mask &= np.isin(self._codes, [SCHOOL_NAMES_BY_EC.index(s) for s in schools if s in SCHOOL_NAMES_BY_EC])
+        if outlier_attr is not None:
+            mask &= self.any_outlier if outlier_attr == "전체" else self.outliers[outlier_attr]
+        return mask
+
+    def sorted_ids(self, mask: np.ndarray, by: str, descending: bool = False) -> np.ndarray:
+        # 미리 정렬해 둔 순서에서 선택된 개체만 남기면 정렬 결과 (값이 없는 개체는 항상 마지막)
+        order = self._order[by]
+        ids = order[mask[order]]
+        if descending:
+            n_valid = int(mask[order[:len(self._sorted[by])]].sum())
+            ids = np.concatenate([ids[:n_valid][::-1], ids[n_valid:]])
+        return ids
+
+    def rows(self, ids: np.ndarray) -> pd.DataFrame:
+        rows = self.frame.iloc[ids].copy()
+        rows["이상치"] = self.any_outlier[ids]
+        return rows
+
+    def top_k(self, mask: np.ndarray, by: str, k: int = 10, largest: bool = True) -> pd.DataFrame:
+        ids = self.sorted_ids(mask, by, descending=largest)
+        return self.rows(ids[:min(k, int(mask[self._order[by][:len(self._sorted[by])]].sum()))])
+
+    def page(self, mask: np.ndarray, by: str, descending: bool, page: int, page_size: int) -> pd.DataFrame:
+        ids = self.sorted_ids(mask, by, descending)
+        start = (page - 1) * page_size
+        return self.rows(ids[start:start + page_size])
+
+
+@timed
+def build_plant_index(growth_data: dict[str, pd.DataFrame]) -> PlantIndex:
+    key = ("plant_index",) + tuple((school, frame_key(df)) for school, df in sorted(growth_data.items()))
+    return _memoize(key, lambda: PlantIndex(growth_data))
+
+# ==============================================================================
+# 7. 일괄 사전 계산 (cron / 프로파일링용 진입점)
+# ==============================================================================
+def precompute(data_dir: Path = DATA_DIR) -> dict[str, pd.DataFrame]:
+    env_data = load_environment_data(data_dir)
+    growth_data = load_growth_data(data_dir)
+    features = build_feature_table(env_data)
+    outcomes = build_growth_outcomes(growth_data)
+    return {
+        "env_summary": build_env_summary(env_data),
+        "ec_weight": build_ec_weight_table(growth_data),
+        "length": build_length_table(growth_data),
+        "features": features,
+        "outcomes": outcomes,
+        "correlation": build_feature_correlation(features, outcomes),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="대시보드 집계 결과를 UI 없이 계산해 CSV로 저장")
+    parser.add_argument("--data-dir", type=Path, default=DATA_DIR)
+    parser.add_argument("--out", type=Path, default=Path("precomputed"))
+    parser.add_argument("--write-manifest", action="store_true", help="파티션 색인(manifest.json)만 갱신")
+    args = parser.parse_args()
+
+    if args.write_manifest:
+        for part in write_manifest(args.data_dir):
+            print(f"{part['id'] or '(root)'}: {part['label']} · {len(part['schools'])}개 실험군")
+        raise SystemExit(0)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    for name, table in precompute(args.data_dir).items():
+        table.to_csv(args.out / f"{name}.csv", encoding="utf-8-sig")
+        print(f"{name}: {table.shape[0]} rows -> {args.out / f'{name}.csv'}")
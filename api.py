@@ -0,0 +1,317 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 읽기 전용 JSON API (표준 라이브러리 HTTP 서버)
+# 대시보드와 같은 분석 코어 · 메모이제이션을 거쳐 집계 결과를 다른 도구에 제공
+#
+#   python api.py --port 8600                     # 단독 실행
+#   DASHBOARD_API_PORT=8600 streamlit run main.py # 대시보드 프로세스 안에서 실행 (캐시 공유)
+#
+#   GET /api/v1/schools
+#   GET /api/v1/env-summary
+#   GET /api/v1/ec-weight
+#   GET /api/v1/tr-ratio
+#   GET /api/v1/timeseries/<학교>?metric=ec&start=2025-05-26&end=2025-05-28&limit=500&cursor=0
+#
+# 모든 응답은 데이터셋 지문 기반 ETag 를 달고, If-None-Match 가 일치하면 304 로 본문 없이 응답
+# ==============================================================================
+
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+import argparse
+import gzip
+import json
+import logging
+import threading
+
+import pandas as pd
+
+import analytics
+from analytics import SCHOOL_INFO, SCHOOL_NAMES_BY_EC, ENV_METRICS
+
+API_PREFIX = "/api/v1"
+DEFAULT_PAGE_SIZE = 1000
+MAX_PAGE_SIZE = 10000
+GZIP_MIN_BYTES = 1024      # 이보다 작은 응답은 압축 이득보다 비용이 큼
+_RESPONSE_CACHE_SIZE = 256
+DATA_TIMEZONE = "Asia/Seoul"   # 측정 시각은 시간대 없는 현지 시각으로 저장됨
+
+logger = logging.getLogger("dashboard.api")
+
+
+class ApiError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+# ==============================================================================
+# 1. 데이터셋 캐시 (지문이 바뀔 때만 CSV 를 다시 읽음)
+# ==============================================================================
+class DatasetCache:
+    def __init__(self, data_dir: Path):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._fingerprint = None
+        self._env_data: dict[str, pd.DataFrame] = {}
+        self._growth_data: dict[str, pd.DataFrame] = {}
+        self._responses: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def fingerprint(self) -> str:
+        # 파일 목록 · 크기 · 수정 시각만 봄 - 본문을 만들기 전에 If-None-Match 를 비교하는 데 사용
+        return analytics.dataset_fingerprint(self.data_dir)
+
+    def snapshot(self, fingerprint: str | None = None) -> tuple[str, dict[str, pd.DataFrame], dict[str, pd.DataFrame]]:
+        fingerprint = fingerprint or self.fingerprint()
+        with self._lock:
+            if fingerprint != self._fingerprint:
+                self._env_data = analytics.load_environment_data(self.data_dir)
+                self._growth_data = analytics.load_growth_data(self.data_dir)
+                self._responses.clear()
+                self._fingerprint = fingerprint
+            return self._fingerprint, self._env_data, self._growth_data
+
+    def response(self, key: tuple, build) -> bytes:
+        # 같은 지문 · 경로 · 쿼리의 JSON 본문은 재직렬화하지 않음
+        with self._lock:
+            if key in self._responses:
+                self._responses.move_to_end(key)
+                return self._responses[key]
+        body = build()
+        with self._lock:
+            self._responses[key] = body
+            if len(self._responses) > _RESPONSE_CACHE_SIZE:
+                self._responses.popitem(last=False)
+        return body
+
+# ==============================================================================
+# 2. 엔드포인트
+# ==============================================================================
+def _records(df: pd.DataFrame) -> list[dict]:
+    if df.empty:
+        return []
+    return json.loads(df.to_json(orient="records", date_format="iso", force_ascii=False))
+
+
+def schools_payload(env_data: dict, growth_data: dict) -> dict:
+    return {"schools": [
+        {"name": school, "school": SCHOOL_INFO[school]["school"], "replicate": SCHOOL_INFO[school]["replicate"],
+         "ec_target": SCHOOL_INFO[school]["ec_target"], "color": SCHOOL_INFO[school]["color"],
+         "has_environment": school in env_data, "has_growth": school in growth_data}
+        for school in SCHOOL_NAMES_BY_EC
+    ]}
+
+
+def env_summary_payload(env_data: dict, growth_data: dict) -> dict:
+    return {"items": _records(analytics.build_env_summary(env_data).drop(columns=["색상"], errors="ignore"))}
+
+
+def ec_weight_payload(env_data: dict, growth_data: dict) -> dict:
+    table = analytics.build_ec_weight_table(growth_data)
+    trend = analytics.fit_weight_trend(table) if not table.empty else None
+    return {
+        "items": _records(table.drop(columns=["색상"], errors="ignore")),
+        "trend": None if trend is None else {"ec": trend[0].tolist(), "weight": trend[1].tolist()},
+    }
+
+
+def tr_ratio_payload(env_data: dict, growth_data: dict) -> dict:
+    return {"items": _records(analytics.build_length_table(growth_data))}
+
+
+def _query_value(query: dict, name: str, default: str | None = None) -> str | None:
+    values = query.get(name)
+    return values[0] if values else default
+
+
+def _query_int(query: dict, name: str, default: int, lo: int, hi: int) -> int:
+    raw = _query_value(query, name)
+    if raw is None:
+        return default
+    try:
+        value = int(raw)
+    except ValueError:
+        raise ApiError(400, f"{name} 는 정수여야 합니다: {raw}")
+    if not lo <= value <= hi:
+        raise ApiError(400, f"{name} 범위는 {lo}~{hi} 입니다: {value}")
+    return value
+
+
+def _query_time(query: dict, name: str) -> pd.Timestamp | None:
+    raw = _query_value(query, name)
+    if raw is None:
+        return None
+    value = pd.to_datetime(raw, errors="coerce")
+    if pd.isna(value):
+        raise ApiError(400, f"{name} 시각을 해석할 수 없습니다: {raw}")
+    # "...Z" / "+09:00" 처럼 시간대가 붙은 값은 현지 시각으로 바꾼 뒤 시간대를 떼어 프레임과 비교 가능하게 함
+    if value.tzinfo is not None:
+        value = value.tz_convert(DATA_TIMEZONE).tz_localize(None)
+    return value
+
+
+def timeseries_payload(env_data: dict, school: str, query: dict) -> dict:
+    if school not in env_data:
+        raise ApiError(404, f"환경 데이터가 없는 학교입니다: {school}")
+
+    metrics = [m for m in (_query_value(query, "metric") or ",".join(ENV_METRICS)).split(",") if m]
+    unknown = [m for m in metrics if m not in ENV_METRICS]
+    if unknown:
+        raise ApiError(400, f"알 수 없는 지표: {', '.join(unknown)} (가능: {', '.join(ENV_METRICS)})")
+    limit = _query_int(query, "limit", DEFAULT_PAGE_SIZE, 1, MAX_PAGE_SIZE)
+    cursor = _query_int(query, "cursor", 0, 0, 2**31)
+    start, end = _query_time(query, "start"), _query_time(query, "end")
+
+    # 표준 프레임은 시간순 정렬이므로 구간 경계는 이진 탐색으로 찾음
+    frame = analytics.prepare_env_frame(env_data[school])
+    times = frame["time"]
+    lo = int(times.searchsorted(start, side="left")) if start is not None else 0
+    hi = int(times.searchsorted(end, side="right")) if end is not None else len(frame)
+    hi = max(lo, hi)
+
+    page_start = min(lo + cursor, hi)
+    page_end = min(page_start + limit, hi)
+    page = frame.iloc[page_start:page_end][["time"] + metrics]
+    next_cursor = page_end - lo if page_end < hi else None
+
+    return {
+        "school": school,
+        "metrics": metrics,
+        "total": hi - lo,
+        "cursor": cursor,
+        "limit": limit,
+        "next_cursor": next_cursor,
+        "items": _records(page),
+    }
+
+
+AGGREGATE_ENDPOINTS = {
+    "schools": schools_payload,
+    "env-summary": env_summary_payload,
+    "ec-weight": ec_weight_payload,
+    "tr-ratio": tr_ratio_payload,
+}
+
+
+def route_parts(path: str) -> list[str]:
+    # 데이터를 읽지 않고 경로 모양만 확인 (없는 경로는 ETag 비교 전에 404)
+    if not path.startswith(API_PREFIX + "/"):
+        raise ApiError(404, f"없는 경로입니다: {path}")
+    parts = [unquote(p) for p in path[len(API_PREFIX) + 1:].split("/") if p]
+    if not ((len(parts) == 1 and parts[0] in AGGREGATE_ENDPOINTS) or (len(parts) == 2 and parts[0] == "timeseries")):
+        raise ApiError(404, f"없는 경로입니다: {path}")
+    return parts
+
+
+def route(cache: DatasetCache, path: str, query: dict, fingerprint: str | None = None) -> tuple[str, bytes]:
+    parts = route_parts(path)
+    fingerprint, env_data, growth_data = cache.snapshot(fingerprint)
+    key = (fingerprint, tuple(parts), tuple(sorted((k, tuple(v)) for k, v in query.items())))
+
+    if parts[0] == "timeseries":
+        build = lambda: timeseries_payload(env_data, parts[1], query)
+    else:
+        build = lambda: AGGREGATE_ENDPOINTS[parts[0]](env_data, growth_data)
+
+    body = cache.response(key, lambda: json.dumps(build(), ensure_ascii=False).encode("utf-8"))
+    return fingerprint, body
+
+# ==============================================================================
+# 3. HTTP 서버
+# ==============================================================================
+def _etag_matches(header: str | None, etag: str) -> bool:
+    # 약한 비교 - 압축 여부와 무관하게 같은 데이터면 일치
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or any(t.removeprefix("W/") == etag.removeprefix("W/") for t in tags)
+
+
+def _accepts_gzip(header: str | None) -> bool:
+    for part in (header or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        if coding.strip().lower() == "gzip":
+            return params.replace(" ", "") not in ("q=0", "q=0.0")
+    return False
+
+
+def make_handler(cache: DatasetCache):
+    class ApiHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            path = url.path.rstrip("/")
+            try:
+                # 지문이 같으면 본문을 만들거나 직렬화하지 않고 바로 304
+                route_parts(path)
+                fingerprint = cache.fingerprint()
+                if _etag_matches(self.headers.get("If-None-Match"), f'W/"{fingerprint}"'):
+                    self._send_not_modified(f'W/"{fingerprint}"')
+                    return
+                fingerprint, body = route(cache, path, parse_qs(url.query), fingerprint)
+            except ApiError as e:
+                self._send_json(e.status, json.dumps({"error": str(e)}, ensure_ascii=False).encode("utf-8"))
+                return
+            except Exception:
+                # 예상하지 못한 오류도 연결을 끊지 않고 JSON 500 으로 응답
+                logger.exception("unhandled error for %s", self.path)
+                self._send_json(500, json.dumps({"error": "내부 오류가 발생했습니다"}, ensure_ascii=False).encode("utf-8"))
+                return
+
+            self._send_json(200, body, f'W/"{fingerprint}"')
+
+        def _send_not_modified(self, etag: str):
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Vary", "Accept-Encoding")
+            self.end_headers()
+
+        def _send_json(self, status: int, body: bytes, etag: str | None = None):
+            encoding = None
+            if len(body) >= GZIP_MIN_BYTES and _accepts_gzip(self.headers.get("Accept-Encoding")):
+                body = gzip.compress(body, compresslevel=6)
+                encoding = "gzip"
+
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Vary", "Accept-Encoding")
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            if etag:
+                self.send_header("ETag", etag)
+                self.send_header("Cache-Control", "no-cache")  # 항상 재검증하되 바뀌지 않았으면 304
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ApiHandler
+
+
+def start_api_server(port: int, data_dir: Path = analytics.DATA_DIR, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), make_handler(DatasetCache(data_dir)))
+    threading.Thread(target=server.serve_forever, name="api-server", daemon=True).start()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 집계 결과 읽기 전용 JSON API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8600)
+    parser.add_argument("--data-dir", type=Path, default=analytics.DATA_DIR)
+    args = parser.parse_args()
+
+    analytics.register_dataset_schools(args.data_dir)
+
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(DatasetCache(args.data_dir)))
+    print(f"serving http://{args.host}:{args.port}{API_PREFIX}/ (data: {args.data_dir})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 벤치마크 (합성 데이터 생성 + 단계별 시간 측정)
+#
+#   python bench.py generate --out bench_data --schools 50 --env-rows 100000
+#   python bench.py run --data-dir bench_data --repeat 3 --save
+#   python bench.py run --data-dir bench_data --compare bench_results/<이전 결과>.json
+# ==============================================================================
+
+from datetime import datetime
+from pathlib import Path
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+import analytics
+import figures
+
+RESULTS_DIR = Path("bench_results")
+SCHOOLS_FILE = analytics.DATASET_SCHOOLS_FILE
+GROWTH_COLUMNS = ["개체번호", "잎 수(장)", "지상부 길이(mm)", "지하부길이(mm)", "생중량(g)"]
+STAGES = ["discovery", "parse", "column_resolution", "frame_parsing", "aggregation", "figure_build",
+          "json_serialization", "export"]
+
+# ==============================================================================
+# 1. 합성 데이터 생성 (실제 CSV 와 같은 형식)
+# ==============================================================================
+def synthetic_schools(n_schools: int) -> dict[str, float]:
+    # 앞 4곳은 실제 학교명, 이후는 "합성001고" 형식 (EC 목표는 0.5 간격)
+    schools = {name: analytics.SCHOOL_INFO[name]["ec_target"] for name in analytics.SCHOOL_NAMES_BY_EC[:n_schools]}
+    for i in range(len(schools), n_schools):
+        schools[f"합성{i:03d}고"] = round(0.5 + 0.5 * (i % 16), 1)
+    return schools
+
+
+def format_sensor_time(times: pd.DatetimeIndex) -> pd.Index:
+    # 원본 로거 형식 "2025-05-01 5:00:00" (시는 0 채움 없음)
+    return times.strftime("%Y-%m-%d ") + times.hour.astype(str) + times.strftime(":%M:%S")
+
+
+def generate_env_frame(rng: np.random.Generator, ec_target: float, n_rows: int, freq: str) -> pd.DataFrame:
+    times = pd.date_range("2025-05-01 05:00", periods=n_rows, freq=freq)
+    phase = 2 * np.pi * (times.hour.to_numpy() + times.minute.to_numpy() / 60 - 9) / 24
+    return pd.DataFrame({
+        "time": format_sensor_time(times),
+        "temperature": np.round(20 + 4 * np.sin(phase) + rng.normal(0, 0.8, n_rows), 2),
+        "humidity": np.round(np.clip(55 - 10 * np.sin(phase) + rng.normal(0, 3, n_rows), 0, 100), 2),
+        "ph": np.round(6.3 + rng.normal(0, 0.3, n_rows), 2),
+        "ec": np.round(np.clip(ec_target * (1 + rng.normal(0, 0.1, n_rows)), 0, None), 2),
+    })
+
+
+def generate_growth_frame(rng: np.random.Generator, ec_target: float, n_rows: int) -> pd.DataFrame:
+    # 역U자 반응 (EC 2 부근 최대) 을 흉내낸 개체별 생육 값
+    vigor = np.exp(-((np.log2(ec_target) - 1) ** 2) / 2)
+    shoot = np.clip(rng.normal(60 + 60 * vigor, 20, n_rows), 5, None)
+    root = np.clip(rng.normal(180 - 60 * vigor, 40, n_rows), 5, None)
+    return pd.DataFrame({
+        GROWTH_COLUMNS[0]: np.arange(1, n_rows + 1),
+        GROWTH_COLUMNS[1]: rng.poisson(8 + 15 * vigor, n_rows),
+        GROWTH_COLUMNS[2]: np.round(shoot),
+        GROWTH_COLUMNS[3]: np.round(root),
+        GROWTH_COLUMNS[4]: np.round(np.clip(rng.normal(3 + 15 * vigor, 3, n_rows), 0.1, None), 2),
+    })
+
+
+def generate_dataset(out_dir: Path, n_schools: int = 4, env_rows: int = 2000, growth_rows: int = 300,
+                     freq: str = "h", seed: int = 0) -> dict[str, float]:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    schools = synthetic_schools(n_schools)
+    for school, ec_target in schools.items():
+        generate_env_frame(rng, ec_target, env_rows, freq).to_csv(
+            out_dir / f"{school}_환경데이터.csv", index=False, encoding="utf-8-sig")
+        generate_growth_frame(rng, ec_target, growth_rows).to_csv(
+            out_dir / f"{school}_생육결과데이터.csv", index=False, encoding="utf-8-sig")
+    (out_dir / SCHOOLS_FILE).write_text(json.dumps(schools, ensure_ascii=False, indent=2), encoding="utf-8")
+    return schools
+
+
+# ==============================================================================
+# 2. 파이프라인 단계별 측정
+# ==============================================================================
+def run_pipeline(data_dir: Path) -> tuple[dict[str, float], dict[str, int]]:
+    timings = {}
+    stats = {}
+    analytics.clear_caches()
+
+    t = time.perf_counter()
+    env_files = analytics.discover_school_files(data_dir, "환경")
+    growth_files = analytics.discover_school_files(data_dir, "생육")
+    timings["discovery"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    env_data = {s: analytics.read_school_file(p, lower_columns=True, school=s) for s, p in env_files.items()}
+    growth_data = {s: analytics.read_school_file(p, lower_columns=False, school=s) for s, p in growth_files.items()}
+    timings["parse"] = time.perf_counter() - t
+    stats["env_rows"] = sum(len(df) for df in env_data.values())
+    stats["growth_rows"] = sum(len(df) for df in growth_data.values())
+    stats["schools"] = len(set(env_data) | set(growth_data))
+
+    # 컬럼 이름 찾기만 따로 측정 - 시각 파싱 · 숫자 변환 · 메모이제이션이 섞이지 않도록 원본 헤더에 대해서만 호출
+    t = time.perf_counter()
+    for df in env_data.values():
+        for keywords in [["time", "시간", "날짜"], *analytics.ENV_METRICS.values()]:
+            analytics.get_column_safe(df, keywords)
+    for df in growth_data.values():
+        for keywords in analytics.GROWTH_OUTCOMES.values():
+            analytics.get_column_safe(df, keywords)
+    timings["column_resolution"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    frames = {s: analytics.prepare_env_frame(df) for s, df in env_data.items()}
+    timings["frame_parsing"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    env_summary_df = analytics.build_env_summary(env_data)
+    analytics.compute_overview_metrics(env_data, growth_data)
+    ec_weight_df = analytics.build_ec_weight_table(growth_data)
+    trend = analytics.fit_weight_trend(ec_weight_df) if not ec_weight_df.empty else None
+    length_df = analytics.build_length_table(growth_data)
+    combined_df = analytics.build_growth_long(growth_data)
+    features = analytics.build_feature_table(env_data)
+    corr_df = analytics.build_feature_correlation(features, analytics.build_growth_outcomes(growth_data))
+    cumulative = {s: analytics.get_cumulative_indices(s, f) for s, f in frames.items() if not f.empty}
+    display_school = next((s for s in analytics.SCHOOL_NAMES_BY_EC if s in frames), None)
+    profile_df = analytics.compute_profile_grid(frames[display_school], "temperature", analytics.PROFILE_LAYOUTS[0]) \
+        if display_school else None
+    timings["aggregation"] = time.perf_counter() - t
+
+    # 기본 화면(전체 학교, 첫 번째 학교 시계열)에서 그려지는 그래프와 동일
+    t = time.perf_counter()
+    figs = []
+    if not env_summary_df.empty:
+        figs.append(figures.build_env_summary_figure(env_summary_df))
+    if display_school:
+        figs += [figures.build_timeseries_figure(frames[display_school], m, display_school)
+                 for m in figures.TIMESERIES_STYLES]
+        figs.append(figures.build_profile_figure(profile_df, display_school, "temperature", analytics.PROFILE_LAYOUTS[0]))
+    figs.append(figures.build_cumulative_figure(cumulative))
+    if not ec_weight_df.empty:
+        figs.append(figures.build_ec_weight_figure(ec_weight_df, trend, analytics.optimal_school(ec_weight_df)))
+    if not length_df.empty:
+        figs.append(figures.build_length_figure(length_df))
+    weight_col = analytics.get_column_safe(combined_df, ["생중량", "weight"]) if not combined_df.empty else None
+    if weight_col:
+        figs.append(figures.build_weight_box_figure(combined_df, weight_col))
+    if not corr_df.empty:
+        figs.append(figures.build_correlation_figure(corr_df))
+    timings["figure_build"] = time.perf_counter() - t
+    stats["figures"] = len(figs)
+
+    t = time.perf_counter()
+    stats["payload_bytes"] = sum(len(fig.to_json().encode("utf-8")) for fig in figs)
+    timings["json_serialization"] = time.perf_counter() - t
+
+    t = time.perf_counter()
+    export_bytes = sum(len(analytics.export_env_csv(df)) for df in env_data.values())
+    export_bytes += len(analytics.export_growth_xlsx(growth_data))
+    timings["export"] = time.perf_counter() - t
+    stats["export_bytes"] = export_bytes
+
+    return timings, stats
+
+
+def run_benchmark(data_dir: Path, repeat: int = 3) -> dict:
+    analytics.register_dataset_schools(data_dir)
+    runs = []
+    for _ in range(repeat):
+        timings, stats = run_pipeline(data_dir)
+        runs.append(timings)
+
+    return {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "data_dir": str(data_dir),
+        "repeat": repeat,
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+        },
+        "stats": stats,
+        "stages": {
+            stage: {
+                "median_s": statistics.median(run[stage] for run in runs),
+                "min_s": min(run[stage] for run in runs),
+            }
+            for stage in STAGES
+        },
+    }
+
+# ==============================================================================
+# 3. 결과 저장 및 회귀 비교
+# ==============================================================================
+def save_result(result: dict, results_dir: Path = RESULTS_DIR) -> Path:
+    results_dir.mkdir(parents=True, exist_ok=True)
+    path = results_dir / f"bench_{result['timestamp'].replace(':', '')}.json"
+    path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def compare_results(baseline: dict, current: dict, threshold: float = 1.25) -> list[str]:
+    # 중앙값 기준 threshold 배 이상 느려진 단계 목록 반환
+    regressions = []
+    print(f"{'stage':<20}{'baseline(s)':>14}{'current(s)':>14}{'ratio':>9}")
+    for stage in STAGES:
+        base = baseline["stages"].get(stage, {}).get("median_s")
+        cur = current["stages"][stage]["median_s"]
+        if not base:
+            print(f"{stage:<20}{'-':>14}{cur:>14.4f}{'-':>9}")
+            continue
+        ratio = cur / base
+        flag = "  ⚠️ REGRESSION" if ratio > threshold else ""
+        print(f"{stage:<20}{base:>14.4f}{cur:>14.4f}{ratio:>8.2f}x{flag}")
+        if ratio > threshold:
+            regressions.append(stage)
+    return regressions
+
+
+def print_result(result: dict):
+    stats = result["stats"]
+    print(f"schools={stats['schools']} env_rows={stats['env_rows']:,} growth_rows={stats['growth_rows']:,} "
+          f"figures={stats['figures']} payload={stats['payload_bytes']:,}B export={stats['export_bytes']:,}B")
+    for stage in STAGES:
+        timing = result["stages"][stage]
+        print(f"  {stage:<20} median {timing['median_s'] * 1000:9.1f} ms   min {timing['min_s'] * 1000:9.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 핫패스 벤치마크")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    gen = sub.add_parser("generate", help="합성 환경/생육 CSV 생성")
+    gen.add_argument("--out", type=Path, default=Path("bench_data"))
+    gen.add_argument("--schools", type=int, default=4)
+    gen.add_argument("--env-rows", type=int, default=2000, help="학교당 환경 데이터 행 수")
+    gen.add_argument("--growth-rows", type=int, default=300, help="학교당 생육 개체 수")
+    gen.add_argument("--freq", default="h", help="측정 간격 (pandas 주기 문자열, 예: h, 10min, min)")
+    gen.add_argument("--seed", type=int, default=0)
+
+    run = sub.add_parser("run", help="단계별 시간 측정")
+    run.add_argument("--data-dir", type=Path, default=analytics.DATA_DIR)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--save", action="store_true", help=f"결과를 {RESULTS_DIR}/ 에 JSON 으로 저장")
+    run.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    run.add_argument("--threshold", type=float, default=1.25, help="회귀로 판단할 배율")
+
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        schools = generate_dataset(args.out, args.schools, args.env_rows, args.growth_rows, args.freq, args.seed)
+        print(f"{len(schools)}개 학교 × (환경 {args.env_rows:,}행, 생육 {args.growth_rows:,}개체) -> {args.out}")
+        return 0
+
+    result = run_benchmark(args.data_dir, args.repeat)
+    print_result(result)
+    if args.save:
+        print(f"saved: {save_result(result)}")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        if compare_results(baseline, result, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,407 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - Plotly 그래프 생성
+# 대시보드 · 리포트 · 벤치마크가 같은 그래프 코드를 공유 (Streamlit 비의존)
+# ==============================================================================
+
+import pandas as pd
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from analytics import SCHOOL_INFO, SCHOOL_NAMES, CUMULATIVE_INDICES, METRIC_LABELS
+
+TIMESERIES_STYLES = {
+    "temperature": {"title": "🌡️ 온도 변화", "color": "#ff6b6b"},
+    "humidity": {"title": "💧 습도 변화", "color": "#00d4ff"},
+    "ec": {"title": "⚡ EC 변화", "color": "#00ff88"},
+}
+
+# ==============================================================================
+# 1. 환경 분석
+# ==============================================================================
+def build_env_summary_figure(env_summary_df: pd.DataFrame) -> go.Figure:
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=("🌡️ 평균 온도 (°C)", "💧 평균 습도 (%)", "🧪 평균 pH", "⚡ 목표 vs 실측 EC"),
+        vertical_spacing=0.15,
+        horizontal_spacing=0.1
+    )
+
+    colors = [SCHOOL_INFO[s]["color"] for s in env_summary_df["학교"]]
+
+    for i, (row, col, y_col) in enumerate([
+        (1, 1, "평균 온도"),
+        (1, 2, "평균 습도"),
+        (2, 1, "평균 pH")
+    ]):
+        fig.add_trace(
+            go.Bar(x=env_summary_df["학교"], y=env_summary_df[y_col],
+                   marker_color=colors, showlegend=False,
+                   text=env_summary_df[y_col].round(1),
+                   textposition="outside",
+                   textfont=dict(color="white")),
+            row=row, col=col
+        )
+
+    fig.add_trace(
+        go.Bar(x=env_summary_df["학교"], y=env_summary_df["목표 EC"],
+               name="목표 EC", marker_color="#667eea",
+               text=env_summary_df["목표 EC"], textposition="outside"),
+        row=2, col=2
+    )
+    fig.add_trace(
+        go.Bar(x=env_summary_df["학교"], y=env_summary_df["실측 EC"],
+               name="실측 EC", marker_color="#00b894",
+               text=env_summary_df["실측 EC"].round(1), textposition="outside"),
+        row=2, col=2
+    )
+
+    fig.update_layout(
+        height=650,
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        showlegend=True,
+        legend=dict(
+            orientation="h", yanchor="bottom", y=-0.12,
+            xanchor="center", x=0.5,
+            font=dict(color="white")
+        )
+    )
+
+    fig.update_xaxes(showgrid=False, color="rgba(255,255,255,0.7)")
+    fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
+    return fig
+
+
+def build_timeseries_figure(frame: pd.DataFrame, metric: str, school: str) -> go.Figure:
+    import plotly.express as px  # 무거운 모듈이라 그래프를 실제로 그릴 때 로드
+
+    style = TIMESERIES_STYLES[metric]
+    fig = px.line(frame, x="time", y=metric)
+    fig.update_traces(line=dict(color=style["color"], width=2))
+    if metric == "ec":
+        fig.add_hline(
+            y=SCHOOL_INFO[school]["ec_target"],
+            line_dash="dash", line_color="#bf00ff",
+            annotation_text=f"목표 EC: {SCHOOL_INFO[school]['ec_target']}",
+            annotation_font_color="white"
+        )
+    fig.update_layout(
+        title=style["title"],
+        font=dict(family="Malgun Gothic", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)"),
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
+    )
+    return fig
+
+
+def build_profile_figure(profile_df: pd.DataFrame, school: str, metric: str, layout: str) -> go.Figure:
+    fig = go.Figure(go.Heatmap(
+        z=profile_df.values,
+        x=[f"{h}시" for h in profile_df.columns],
+        y=profile_df.index.tolist(),
+        colorscale="Viridis",
+        hoverongaps=False,
+        colorbar=dict(title=METRIC_LABELS[metric], tickfont=dict(color="white"))
+    ))
+
+    fig.update_layout(
+        title=dict(text=f"{school} · {METRIC_LABELS[metric]} {layout} 평균",
+                   font=dict(size=20, color="white")),
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(color="rgba(255,255,255,0.7)"),
+        yaxis=dict(color="rgba(255,255,255,0.7)", autorange="reversed"),
+        height=max(350, 18 * len(profile_df) + 150)
+    )
+    return fig
+
+
+def build_cumulative_figure(cumulative_by_school: dict[str, pd.DataFrame]) -> go.Figure:
+    fig = make_subplots(rows=1, cols=len(CUMULATIVE_INDICES), subplot_titles=list(CUMULATIVE_INDICES),
+                        horizontal_spacing=0.06)
+    for school, cum_df in cumulative_by_school.items():
+        for i, index_name in enumerate(CUMULATIVE_INDICES, start=1):
+            fig.add_trace(
+                go.Scatter(x=cum_df["time"], y=cum_df[index_name], mode="lines",
+                           name=school, legendgroup=school, showlegend=(i == 1),
+                           line=dict(color=SCHOOL_INFO[school]["color"], width=2)),
+                row=1, col=i
+            )
+
+    fig.update_layout(
+        height=420,
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5, font=dict(color="white"))
+    )
+    fig.update_xaxes(showgrid=False, color="rgba(255,255,255,0.7)")
+    fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
+    return fig
+
+# ------------------------------------------------------------------------------
+# 브라우저 필터 모드: 모든 학교를 trace 로 한 번에 보내고 학교 전환 · 범례 토글 · 기간 선택은
+# 드롭다운(updatemenus) / legendgroup / rangeslider 로 브라우저에서 처리 (서버 rerun 없음)
+# ------------------------------------------------------------------------------
+WEBGL_MIN_POINTS = 5000   # 학교별 시계열 점이 이보다 많으면 Scattergl 사용
+
+MENU_STYLE = dict(type="dropdown", direction="down", x=0, y=1.18, xanchor="left", yanchor="top",
+                  bgcolor="rgba(30,30,40,0.9)", bordercolor="rgba(255,255,255,0.3)", font=dict(color="white"))
+
+
+def timeseries_trace_bundle(frame: pd.DataFrame, metric: str, school: str) -> list:
+    # 학교 하나의 trace 묶음 (측정값 + EC 목표선) - 학교별로 캐시해 통합 그래프에 조립
+    # 점이 적으면 SVG Scatter (rangeslider 미리보기에 그려짐), 많으면 WebGL 로 브라우저 렌더링 비용을 줄임
+    color = SCHOOL_INFO[school]["color"]
+    trace_type = go.Scattergl if len(frame) > WEBGL_MIN_POINTS else go.Scatter
+    traces = [trace_type(x=frame["time"], y=frame[metric], mode="lines", name=school, legendgroup=school,
+                         line=dict(color=color, width=2))]
+    if metric == "ec" and not frame.empty:
+        target = SCHOOL_INFO[school]["ec_target"]
+        traces.append(go.Scatter(x=[frame["time"].iloc[0], frame["time"].iloc[-1]], y=[target, target], mode="lines",
+                                 name=f"{school} 목표 EC", legendgroup=school, showlegend=False, hoverinfo="skip",
+                                 line=dict(color=color, width=1, dash="dash")))
+    return traces
+
+
+def _school_menu(bundle_sizes: dict[str, int], include_all: bool, layouts: dict[str, dict] | None = None) -> dict:
+    # 버튼마다 visible 마스크만 바꿈 - 데이터는 이미 브라우저에 있으므로 전송량 0
+    total = sum(bundle_sizes.values())
+    buttons = []
+    if include_all:
+        buttons.append(dict(label="전체", method="update", args=[{"visible": [True] * total}]))
+    offset = 0
+    for school, size in bundle_sizes.items():
+        mask = [offset <= i < offset + size for i in range(total)]
+        buttons.append(dict(label=school, method="update", args=[{"visible": mask}, (layouts or {}).get(school, {})]))
+        offset += size
+    return dict(MENU_STYLE, buttons=buttons, active=0)
+
+
+def build_timeseries_bundle_figure(bundles: dict[str, list], metric: str) -> go.Figure:
+    fig = go.Figure()
+    for traces in bundles.values():
+        fig.add_traces(traces)
+    # rangeslider 는 WebGL trace 를 그리지 못하므로 WebGL trace 가 하나라도 있으면 기간 버튼만 표시
+    uses_webgl = any(trace.type == "scattergl" for trace in fig.data)
+
+    fig.update_layout(
+        title=dict(text=TIMESERIES_STYLES[metric]["title"], x=0.5),
+        updatemenus=[_school_menu({school: len(traces) for school, traces in bundles.items()}, include_all=True)],
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1, font=dict(color="white")),
+        xaxis=dict(
+            showgrid=False, color="rgba(255,255,255,0.7)",
+            rangeslider=dict(visible=not uses_webgl, thickness=0.08),
+            rangeselector=dict(
+                buttons=[dict(count=1, label="1일", step="day", stepmode="backward"),
+                         dict(count=7, label="7일", step="day", stepmode="backward"),
+                         dict(step="all", label="전체")],
+                bgcolor="rgba(30,30,40,0.9)", font=dict(color="white"), y=1.18, x=0.35,
+            ),
+        ),
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)"),
+        height=480,
+        margin=dict(t=110)
+    )
+    return fig
+
+
+def build_profile_bundle_figure(profiles: dict[str, pd.DataFrame], metric: str, layout: str) -> go.Figure:
+    # 히트맵은 겹쳐 볼 수 없으므로 한 번에 한 학교만 표시 - 전환 시 제목 · y 축 범주도 함께 바꿈
+    fig = go.Figure()
+    layouts = {}
+    for i, (school, profile_df) in enumerate(profiles.items()):
+        labels = profile_df.index.tolist()
+        fig.add_trace(go.Heatmap(
+            z=profile_df.values, x=[f"{h}시" for h in profile_df.columns], y=labels,
+            name=school, visible=(i == 0), colorscale="Viridis", hoverongaps=False,
+            colorbar=dict(title=METRIC_LABELS[metric], tickfont=dict(color="white"))
+        ))
+        layouts[school] = {"title.text": f"{school} · {METRIC_LABELS[metric]} {layout} 평균",
+                           "yaxis.categoryarray": labels, "height": max(350, 18 * len(labels) + 150)}
+
+    first = next(iter(layouts.values()), {"title.text": "", "yaxis.categoryarray": [], "height": 350})
+    fig.update_layout(
+        title=dict(text=first["title.text"], font=dict(size=20, color="white"), x=0.5),
+        updatemenus=[_school_menu({school: 1 for school in profiles}, include_all=False, layouts=layouts)],
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(color="rgba(255,255,255,0.7)"),
+        yaxis=dict(color="rgba(255,255,255,0.7)", autorange="reversed",
+                   categoryorder="array", categoryarray=first["yaxis.categoryarray"]),
+        height=first["height"],
+        margin=dict(t=110)
+    )
+    return fig
+
+# ==============================================================================
+# 2. 생육 결과
+# ==============================================================================
+def build_ec_weight_figure(ec_weight_df: pd.DataFrame, trend: tuple | None, optimum: str | None = None) -> go.Figure:
+    fig = go.Figure()
+
+    colors = [SCHOOL_INFO[s]["color"] for s in ec_weight_df["학교"]]
+
+    fig.add_trace(go.Bar(
+        x=ec_weight_df["EC"],
+        y=ec_weight_df["평균 생중량"],
+        text=[f"{s}<br>{w:.1f}g" for s, w in zip(ec_weight_df["학교"], ec_weight_df["평균 생중량"])],
+        textposition="outside",
+        textfont=dict(color="white", size=12),
+        marker=dict(
+            color=colors,
+            line=dict(color="rgba(255,255,255,0.3)", width=2)
+        ),
+        name="평균 생중량"
+    ))
+
+    # 추세선
+    if trend is not None:
+        x_trend, y_trend = trend
+
+        fig.add_trace(go.Scatter(
+            x=x_trend, y=y_trend,
+            mode="lines",
+            name="추세선",
+            line=dict(color="#ff6b6b", width=4, dash="dash")
+        ))
+
+    # 최적 실험군(analytics.optimal_school)의 EC 에 기준선
+    if optimum is not None:
+        fig.add_vline(x=SCHOOL_INFO[optimum]["ec_target"], line_dash="dot", line_color="#00ff88", line_width=3,
+                      annotation_text=f"⭐ 최적 ({optimum})", annotation_font_color="#00ff88",
+                      annotation_font_size=14)
+
+    fig.update_layout(
+        title=dict(text="EC 농도에 따른 평균 생중량 변화", font=dict(size=20, color="white")),
+        xaxis_title="EC 농도 (dS/m)",
+        yaxis_title="평균 생중량 (g)",
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)", dtick=1),
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)"),
+        height=500,
+        showlegend=True,
+        legend=dict(font=dict(color="white"))
+    )
+    return fig
+
+
+def build_length_figure(length_df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure()
+
+    fig.add_trace(go.Bar(
+        x=[f"EC {ec}" for ec in length_df["EC"]],
+        y=length_df["지상부"],
+        name="🌿 지상부 (잎)",
+        marker_color="#00ff88",
+        text=length_df["학교"],
+        textposition="inside",
+        textfont=dict(color="white")
+    ))
+
+    fig.add_trace(go.Bar(
+        x=[f"EC {ec}" for ec in length_df["EC"]],
+        y=length_df["지하부"],
+        name="🟤 지하부 (뿌리)",
+        marker_color="#c4a484",
+        text=[f"{v:.0f}mm" for v in length_df["지하부"]],
+        textposition="inside",
+        textfont=dict(color="white")
+    ))
+
+    fig.update_layout(
+        barmode="stack",
+        title=dict(text="EC 농도에 따른 지상부/지하부 누적 비교", font=dict(size=20, color="white")),
+        xaxis_title="EC 농도",
+        yaxis_title="길이 (mm)",
+        font=dict(family="Malgun Gothic", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)"),
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)"),
+        height=500,
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(color="white"))
+    )
+    return fig
+
+
+def build_weight_box_figure(combined_df: pd.DataFrame, weight_col: str) -> go.Figure:
+    import plotly.express as px
+
+    fig = px.box(
+        combined_df, x="label", y=weight_col, color="학교",
+        color_discrete_map={s: SCHOOL_INFO[s]["color"] for s in SCHOOL_NAMES}
+    )
+
+    fig.update_layout(
+        title=dict(text="학교별 생중량 분포 (이상치 확인)", font=dict(size=20, color="white")),
+        font=dict(family="Malgun Gothic", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)", title=""),
+        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)", title="생중량 (g)"),
+        showlegend=False,
+        height=450
+    )
+    return fig
+
+def build_plant_scatter_figure(plants: pd.DataFrame) -> go.Figure:
+    # 개체별 지상부 vs 지하부 (WebGL) - 이상치는 테두리로 표시
+    fig = go.Figure()
+    for school, group in plants.groupby("학교", observed=True, sort=False):
+        fig.add_trace(go.Scattergl(
+            x=group["지하부 길이"], y=group["지상부 길이"], mode="markers", name=school,
+            marker=dict(color=SCHOOL_INFO[school]["color"], size=8, opacity=0.75,
+                        line=dict(color="white", width=group["이상치"].map({True: 2, False: 0}).tolist())),
+            customdata=group[["개체번호", "생중량", "잎 수"]].to_numpy(),
+            hovertemplate=f"{school} · #%{{customdata[0]}}<br>지하부 %{{x}} mm · 지상부 %{{y}} mm"
+                          "<br>생중량 %{customdata[1]} g · 잎 %{customdata[2]}장<extra></extra>"
+        ))
+
+    fig.update_layout(
+        title=dict(text="개체별 지상부 vs 지하부 길이", font=dict(size=20, color="white")),
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(title="지하부 길이 (mm)", showgrid=False, color="rgba(255,255,255,0.7)"),
+        yaxis=dict(title="지상부 길이 (mm)", showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)"),
+        legend=dict(orientation="h", yanchor="bottom", y=-0.25, xanchor="center", x=0.5, font=dict(color="white")),
+        height=480
+    )
+    return fig
+
+# ==============================================================================
+# 3. 상관 분석
+# ==============================================================================
+def build_correlation_figure(corr_df: pd.DataFrame) -> go.Figure:
+    fig = go.Figure(go.Heatmap(
+        z=corr_df.values,
+        x=corr_df.columns.tolist(),
+        y=corr_df.index.tolist(),
+        zmin=-1, zmax=1, zmid=0,
+        colorscale="RdBu",
+        text=corr_df.round(2).values,
+        texttemplate="%{text}",
+        colorbar=dict(title="r", tickfont=dict(color="white"))
+    ))
+
+    fig.update_layout(
+        title=dict(text="환경 특성과 생육 결과의 피어슨 상관계수", font=dict(size=20, color="white")),
+        font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
+        paper_bgcolor="rgba(0,0,0,0)",
+        plot_bgcolor="rgba(0,0,0,0)",
+        xaxis=dict(color="rgba(255,255,255,0.7)"),
+        yaxis=dict(color="rgba(255,255,255,0.7)", autorange="reversed"),
+        height=max(400, 40 * len(corr_df) + 150)
+    )
+    return fig
@@ -0,0 +1,848 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 센서 측정값 수집 서비스 (asyncio)
+# 로거가 학교별 측정 묶음을 HTTP POST 로 보내면 검증 → WAL 기록 → 컬럼 저장소 반영 후 응답
+# 대시보드는 저장소 버전 파일을 보고 새 세그먼트만 읽어 이어 붙임
+#
+#   python ingest.py serve --port 8700                    # TCP
+#   python ingest.py serve --unix /tmp/ec-ingest.sock     # 로컬 유닉스 소켓
+#   python ingest.py fake --loggers 40 --batches 30       # 가짜 로거로 부하 주기
+#
+#   POST /ingest/<학교>   본문: JSON {"readings": [{"time": ..., "temperature": ..., ...}]}
+#                               또는 text/csv (헤더 time,temperature,humidity,ph,ec)
+#   GET  /health
+#
+# 저장소 구조 (DASHBOARD_STORE_DIR, 기본 store/)
+#   wal.log                        아직 세그먼트로 반영되지 않았을 수 있는 묶음 (JSON 줄)
+#   VERSION                        세그먼트까지 반영된 마지막 일련번호
+#   <학교>/<처음>-<끝>.npz         컬럼별 배열(time ns, 측정값) 세그먼트, 많아지면 하나로 병합
+#   _rollups/<학교>.csv            시간별 합계 · 개수 · 최소 · 최대 (대시보드는 최근 구간 밖을 여기서 읽음)
+#   _quality/<학교>.json           load 명령의 누적 품질 통계와 가져온 파일 목록 (중단된 load 의 커밋 지점 포함)
+# ==============================================================================
+
+from pathlib import Path
+import argparse
+import asyncio
+import hashlib
+import io
+import json
+import logging
+import os
+import random
+import statistics
+import sys
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+import analytics
+from analytics import SCHOOL_INFO, SCHOOL_NAMES_BY_EC
+
+STORE_DIR = analytics.STORE_DIR
+READING_COLUMNS = ["temperature", "humidity", "ph", "ec"]
+VALID_RANGES = {
+    "temperature": (-40.0, 60.0),
+    "humidity": (0.0, 100.0),
+    "ph": (0.0, 14.0),
+    "ec": (0.0, 20.0),
+}
+MAX_BATCH_ROWS = 50_000
+MAX_BODY_BYTES = 8 * 1024 * 1024
+QUEUE_SIZE = 1024          # 가득 차면 503 으로 로거에게 재시도를 요청 (메모리 상한)
+GROUP_COMMIT_MAX = 256     # 한 번의 fsync 로 묶어 기록할 최대 요청 수
+COMPACT_SEGMENTS = 32      # 학교별 작은 세그먼트가 이보다 많아지면 하나로 병합
+COMPACT_SEGMENT_BYTES = 1024 * 1024   # 이보다 큰 세그먼트는 병합 대상에서 제외 (병합 시 메모리 상한)
+CHUNK_ROWS = 100_000       # 대용량 CSV 를 읽을 때 한 번에 메모리에 올리는 행 수
+TAIL_ROWS = 50_000         # 대시보드가 원본 해상도로 읽는 학교별 최근 측정값 수 (이전 구간은 시간별 롤업)
+
+logger = logging.getLogger("dashboard.ingest")
+
+
+class IngestError(Exception):
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+# ==============================================================================
+# 1. 벡터화 검증
+# ==============================================================================
+def parse_body(body: bytes, content_type: str) -> pd.DataFrame:
+    # 형식이 잘못된 본문은 모두 400 - 서버 오류(500)는 저장소 기록 실패 같은 경우에만
+    if "csv" in content_type:
+        try:
+            return pd.read_csv(io.BytesIO(body), encoding="utf-8-sig")
+        except ValueError as e:   # 빈 본문 · 열 개수 불일치 · 인코딩 오류
+            raise IngestError(400, f"CSV 본문을 해석할 수 없습니다: {e}")
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise IngestError(400, "JSON 본문을 해석할 수 없습니다")
+    if not isinstance(payload, (dict, list)):
+        raise IngestError(400, "JSON 본문은 객체 또는 배열이어야 합니다")
+    readings = payload.get("readings") if isinstance(payload, dict) else payload
+    # 행 목록이면 각 행이 객체, 컬럼별 배열이면 각 값이 배열이어야 함
+    if isinstance(readings, list):
+        valid = all(isinstance(row, dict) for row in readings)
+    elif isinstance(readings, dict):
+        valid = all(isinstance(values, list) for values in readings.values())
+    else:
+        valid = False
+    if not valid:
+        raise IngestError(400, "readings 는 행 객체 목록 또는 컬럼별 배열이어야 합니다")
+    try:
+        return pd.DataFrame(readings)
+    except ValueError as e:   # 컬럼별 배열의 길이가 다른 경우
+        raise IngestError(400, f"readings 를 표로 만들 수 없습니다: {e}")
+
+
+def inspect_readings(frame: pd.DataFrame) -> tuple[pd.DataFrame, dict]:
+    # 행 단위 반복 없이 컬럼 연산으로 검증 - 범위를 벗어난 값은 그 칸만 결측으로 바꾸고,
+    # 시각이 없거나 유효한 측정값이 하나도 남지 않은 행만 버림
+    times = analytics.parse_time_column(frame["time"]).to_numpy()
+    values = frame.reindex(columns=READING_COLUMNS).apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float, copy=True)
+    lo = np.array([VALID_RANGES[c][0] for c in READING_COLUMNS])
+    hi = np.array([VALID_RANGES[c][1] for c in READING_COLUMNS])
+    missing = np.isnan(values)
+    with np.errstate(invalid="ignore"):
+        out_of_range = ~missing & ((values < lo) | (values > hi))
+    values[out_of_range] = np.nan
+    bad_time = np.isnat(times)
+    all_missing = np.isnan(values).all(axis=1)
+    ok = ~bad_time & ~all_missing
+
+    accepted = pd.DataFrame(values[ok], columns=READING_COLUMNS)
+    accepted.insert(0, "time", times[ok])
+    accepted = accepted.sort_values("time", kind="stable").reset_index(drop=True)
+    stats = {
+        "rows": len(frame),
+        "accepted": int(ok.sum()),
+        "bad_time": int(bad_time.sum()),
+        "all_missing": int(all_missing.sum()),
+        "missing": dict(zip(READING_COLUMNS, missing.sum(axis=0).tolist())),
+        "out_of_range": dict(zip(READING_COLUMNS, out_of_range.sum(axis=0).tolist())),
+    }
+    return accepted, stats
+
+
+def validate_readings(frame: pd.DataFrame) -> tuple[pd.DataFrame, int]:
+    frame.columns = [str(c).strip().lower() for c in frame.columns]
+    if "time" not in frame.columns:
+        raise IngestError(400, "time 컬럼이 필요합니다")
+    if len(frame) > MAX_BATCH_ROWS:
+        raise IngestError(413, f"한 묶음은 최대 {MAX_BATCH_ROWS}행입니다")
+    accepted, stats = inspect_readings(frame)
+    return accepted, stats["rows"] - stats["accepted"]
+
+# ==============================================================================
+# 2. 컬럼 저장소 (세그먼트 파일은 한 번 쓰면 바뀌지 않음)
+# ==============================================================================
+def _atomic_write(path: Path, write):
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def _segment_range(path: Path) -> tuple[int, int]:
+    lo, hi = path.stem.split("-")
+    return int(lo), int(hi)
+
+
+def _live_segments(school_dir: Path) -> list[Path]:
+    # 병합 직후 잠깐 원본과 병합본이 함께 보일 수 있으므로 다른 세그먼트 범위에 포함된 것은 제외
+    paths = sorted(school_dir.glob("*.npz"))
+    ranges = [_segment_range(p) for p in paths]
+    return [p for p, (lo, hi) in zip(paths, ranges)
+            if not any(olo <= lo and hi <= ohi and (olo, ohi) != (lo, hi) for olo, ohi in ranges)]
+
+
+class ColumnStore:
+    def __init__(self, root: Path = STORE_DIR):
+        self.root = root
+        self._lock = threading.Lock()
+        self._segments: dict[Path, pd.DataFrame] = {}   # 읽어 둔 세그먼트 (새 세그먼트만 추가로 읽음)
+        self._rollups: dict[str, tuple[int, pd.DataFrame]] = {}   # 학교 -> (파일 mtime, 시간별 평균)
+
+    # ---- 쓰기 (수집 서비스) ---------------------------------------------------
+    def write_segment(self, school: str, lo: int, hi: int, frame: pd.DataFrame):
+        school_dir = self.root / school
+        school_dir.mkdir(parents=True, exist_ok=True)
+        arrays = {"time": frame["time"].to_numpy(dtype="datetime64[ns]").view("int64")}
+        arrays.update({col: frame[col].to_numpy(dtype=float) for col in READING_COLUMNS})
+        _atomic_write(school_dir / f"{lo:012d}-{hi:012d}.npz", lambda f: np.savez(f, **arrays))
+
+    def compact(self, school: str):
+        # 끝에서부터 이어지는 작은 세그먼트만 병합 - 큰 세그먼트를 다시 읽지 않고, 병합 범위가 다른 세그먼트를 덮지 않음
+        segments = []
+        for path in reversed(_live_segments(self.root / school)):
+            if path.stat().st_size >= COMPACT_SEGMENT_BYTES:
+                break
+            segments.insert(0, path)
+        if len(segments) <= COMPACT_SEGMENTS:
+            return
+        merged = pd.concat([self._read_segment(p) for p in segments], ignore_index=True)
+        merged = merged.sort_values("time", kind="stable").reset_index(drop=True)
+        lo, hi = _segment_range(segments[0])[0], _segment_range(segments[-1])[1]
+        self.write_segment(school, lo, hi, merged)
+        for p in segments:
+            p.unlink(missing_ok=True)
+
+    def update_rollup(self, school: str, frame: pd.DataFrame):
+        rollup = HourlyRollup.load(self.rollup_path(school))
+        rollup.update(frame)
+        rollup.save(self.rollup_path(school))
+
+    def set_version(self, seq: int):
+        self.root.mkdir(parents=True, exist_ok=True)
+        _atomic_write(self.root / "VERSION", lambda f: f.write(str(seq).encode("ascii")))
+
+    # ---- 읽기 (대시보드) ------------------------------------------------------
+    def version(self) -> int:
+        try:
+            return int((self.root / "VERSION").read_text(encoding="ascii").strip() or 0)
+        except FileNotFoundError:
+            return 0
+
+    @staticmethod
+    def _read_segment(path: Path) -> pd.DataFrame:
+        with np.load(path) as npz:
+            frame = pd.DataFrame({col: npz[col] for col in READING_COLUMNS})
+            frame.insert(0, "time", npz["time"].view("datetime64[ns]"))
+        return frame
+
+    def read_school(self, school: str, tail_rows: int | None = None) -> pd.DataFrame:
+        # tail_rows 를 주면 가장 최근에 기록된 세그먼트부터 그 행 수를 채울 만큼만 읽고 메모리에 둠
+        school_dir = self.root / school
+        for _ in range(3):
+            try:
+                segments = _live_segments(school_dir) if school_dir.exists() else []
+                with self._lock:
+                    frames, rows = [], 0
+                    for path in reversed(segments):
+                        if tail_rows is not None and rows >= tail_rows:
+                            break
+                        if path not in self._segments:
+                            self._segments[path] = self._read_segment(path)
+                        frames.insert(0, self._segments[path])
+                        rows += len(frames[0])
+                    kept = set(segments[len(segments) - len(frames):])
+                    # 병합되어 사라졌거나 최근 구간에서 밀려난 세그먼트는 메모리에서도 제거
+                    for path in [p for p in self._segments if p.parent == school_dir and p not in kept]:
+                        del self._segments[path]
+                break
+            except FileNotFoundError:
+                continue  # 목록을 읽은 뒤 병합으로 지워진 경우 - 다시 목록을 읽음
+        else:
+            frames = []
+        if not frames:
+            return pd.DataFrame(columns=["time"] + READING_COLUMNS)
+        return pd.concat(frames, ignore_index=True).sort_values("time", kind="stable").reset_index(drop=True)
+
+    def rollup_path(self, school: str) -> Path:
+        return self.root / "_rollups" / f"{school}.csv"
+
+    def quality_path(self, school: str) -> Path:
+        return self.root / "_quality" / f"{school}.json"
+
+    def read_rollup(self, school: str) -> pd.DataFrame:
+        # 시간별 평균 (time = 시 단위). 파일이 바뀐 경우에만 다시 읽음
+        path = self.rollup_path(school)
+        try:
+            mtime = path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return pd.DataFrame(columns=["time"] + READING_COLUMNS)
+        with self._lock:
+            cached = self._rollups.get(school)
+        if cached is None or cached[0] != mtime:
+            means = HourlyRollup.load(path).means().rename_axis("time").reset_index()
+            cached = (mtime, means)
+            with self._lock:
+                self._rollups[school] = cached
+        return cached[1]
+
+    def read_quality(self) -> dict[str, dict]:
+        quality_dir = self.root / "_quality"
+        if not quality_dir.exists():
+            return {}
+        return {path.stem: json.loads(path.read_text(encoding="utf-8")) for path in sorted(quality_dir.glob("*.json"))}
+
+    def read_recent(self, tail_rows: int = TAIL_ROWS) -> dict[str, pd.DataFrame]:
+        # 학교마다 최근 tail_rows 행은 원본 해상도, 그보다 앞선 구간은 시간별 롤업 평균 - 메모리 사용이 저장소 크기와 무관
+        if not self.root.exists():
+            return {}
+        live = {}
+        for school_dir in sorted(self.root.iterdir()):
+            if not school_dir.is_dir() or school_dir.name.startswith("_"):
+                continue
+            tail = self.read_school(school_dir.name, tail_rows)
+            if tail.empty:
+                continue
+            rollup = self.read_rollup(school_dir.name)
+            older = rollup[rollup["time"] < tail["time"].iloc[0].floor("h")]
+            live[school_dir.name] = pd.concat([older, tail], ignore_index=True) if len(older) else tail
+        return live
+
+# ==============================================================================
+# 3. WAL + 그룹 커밋 기록기
+# ==============================================================================
+class IngestWriter:
+    def __init__(self, store: ColumnStore):
+        self.store = store
+        self.wal_path = store.root / "wal.log"
+        self.seq = store.version()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_SIZE)
+        self.stats = {"batches": 0, "rows": 0, "rejected": 0, "commits": 0}
+
+    def recover(self) -> int:
+        # 세그먼트 반영 전에 중단된 묶음을 WAL 에서 다시 적용 (세그먼트 이름이 같아 중복 적용돼도 안전)
+        if not self.wal_path.exists():
+            return 0
+        pending = []
+        with open(self.wal_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break  # 기록 도중 중단된 마지막 줄
+                if entry["seq"] > self.seq:
+                    frame = pd.DataFrame(entry["columns"])
+                    frame["time"] = pd.to_datetime(frame["time"])
+                    pending.append((entry["seq"], entry["school"], frame))
+        if pending:
+            self._apply(pending)
+        self.wal_path.unlink(missing_ok=True)
+        return len(pending)
+
+    def _append_wal(self, batches: list[tuple[int, str, pd.DataFrame]]):
+        lines = []
+        for seq, school, frame in batches:
+            columns = {"time": frame["time"].dt.strftime("%Y-%m-%dT%H:%M:%S.%f").tolist()}
+            columns.update({col: [None if np.isnan(v) else v for v in frame[col].tolist()] for col in READING_COLUMNS})
+            lines.append(json.dumps({"seq": seq, "school": school, "columns": columns}, ensure_ascii=False))
+        self.store.root.mkdir(parents=True, exist_ok=True)
+        with open(self.wal_path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _apply(self, batches: list[tuple[int, str, pd.DataFrame]]):
+        # 같은 학교 묶음은 세그먼트 하나로 합쳐 파일 수를 줄임. 버전 기록이 커밋 지점 - 그 전에 실패하면 이번에 쓴
+        # 세그먼트를 지우고 예외를 올림 (클라이언트가 다시 보내도 중복되지 않음)
+        by_school: dict[str, list] = {}
+        for seq, school, frame in batches:
+            by_school.setdefault(school, []).append((seq, frame))
+        frames, written = {}, []
+        try:
+            for school, items in by_school.items():
+                frames[school] = pd.concat([f for _, f in items], ignore_index=True).sort_values("time", kind="stable")
+                lo, hi = items[0][0], items[-1][0]
+                self.store.write_segment(school, lo, hi, frames[school])
+                written.append(self.store.root / school / f"{lo:012d}-{hi:012d}.npz")
+            self.store.set_version(max(seq for seq, _, _ in batches))
+        except BaseException:
+            for path in written:
+                path.unlink(missing_ok=True)
+            raise
+        # 커밋 뒤 정리 작업 - 실패해도 묶음은 반영된 것이므로 성공으로 응답 (병합은 다음 커밋에서 다시 시도)
+        # 롤업은 버전 반영 뒤에 갱신하므로 WAL 재적용으로 같은 묶음이 두 번 더해지지 않음
+        for school, frame in frames.items():
+            try:
+                self.store.compact(school)
+                self.store.update_rollup(school, frame)
+            except Exception:
+                logger.exception("post-commit maintenance failed for %s", school)
+
+    def commit(self, batches: list[tuple[int, str, pd.DataFrame]]):
+        wal_size = self.wal_path.stat().st_size if self.wal_path.exists() else 0
+        self._append_wal(batches)
+        try:
+            self._apply(batches)
+        except BaseException:
+            # 실패를 응답한 묶음이 나중에 recover 로 재적용되지 않도록 이번에 쓴 WAL 기록을 잘라냄
+            os.truncate(self.wal_path, wal_size)
+            raise
+        # 세그먼트와 버전까지 반영되었으므로 WAL 은 비워도 됨
+        with open(self.wal_path, "w", encoding="utf-8"):
+            pass
+
+    async def run(self):
+        while True:
+            group = [await self.queue.get()]
+            while len(group) < GROUP_COMMIT_MAX and not self.queue.empty():
+                group.append(self.queue.get_nowait())
+
+            batches = []
+            for school, frame, future in group:
+                self.seq += 1
+                batches.append((self.seq, school, frame))
+            try:
+                # 디스크 기록은 스레드에서 - 이벤트 루프는 계속 요청을 받음
+                await asyncio.to_thread(self.commit, batches)
+                self.stats["commits"] += 1
+                for (seq, _, frame), (_, _, future) in zip(batches, group):
+                    self.stats["batches"] += 1
+                    self.stats["rows"] += len(frame)
+                    if not future.done():
+                        future.set_result(seq)
+            except Exception as e:
+                for _, _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+
+    async def submit(self, school: str, frame: pd.DataFrame) -> int:
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((school, frame, future))
+        except asyncio.QueueFull:
+            raise IngestError(503, "수집 대기열이 가득 찼습니다. 잠시 후 다시 보내 주세요")
+        return await future
+
+# ==============================================================================
+# 4. HTTP 처리 (asyncio 스트림 위의 최소 HTTP/1.1, keep-alive 지원)
+# ==============================================================================
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large", 500: "Internal Server Error", 503: "Service Unavailable"}
+
+
+async def _read_request(reader: asyncio.StreamReader) -> tuple[str, str, dict, bytes] | None:
+    request_line = await reader.readline()
+    if not request_line:
+        return None
+    try:
+        method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise IngestError(400, "요청 줄을 해석할 수 없습니다")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    raw_length = headers.get("content-length", "0")
+    if not raw_length.isdigit():     # 음수 · 정수가 아닌 값
+        raise IngestError(400, f"Content-Length 가 올바르지 않습니다: {raw_length}")
+    length = int(raw_length)
+    if length > MAX_BODY_BYTES:
+        raise IngestError(413, f"본문은 최대 {MAX_BODY_BYTES} 바이트입니다")
+    body = await reader.readexactly(length) if length else b""
+    return method, path, headers, body
+
+
+def _response(status: int, payload: dict, keep_alive: bool) -> bytes:
+    body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    head = [f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}",
+            "Content-Type: application/json; charset=utf-8",
+            f"Content-Length: {len(body)}",
+            f"Connection: {'keep-alive' if keep_alive else 'close'}"]
+    if status == 503:
+        head.append("Retry-After: 1")
+    return ("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def handle_request(writer_: IngestWriter, method: str, path: str, headers: dict, body: bytes) -> tuple[int, dict]:
+    from urllib.parse import unquote
+
+    path = unquote(path.split("?", 1)[0]).rstrip("/")
+    if path == "/health":
+        return 200, {"version": writer_.seq, "queued": writer_.queue.qsize(), **writer_.stats}
+    if not path.startswith("/ingest/"):
+        raise IngestError(404, f"없는 경로입니다: {path}")
+    if method != "POST":
+        raise IngestError(405, "POST 만 지원합니다")
+
+    school = path[len("/ingest/"):]
+    if school not in SCHOOL_INFO:
+        raise IngestError(404, f"등록되지 않은 학교입니다: {school}")
+    accepted, rejected = validate_readings(parse_body(body, headers.get("content-type", "")))
+    writer_.stats["rejected"] += rejected
+    if accepted.empty:
+        return 200, {"school": school, "accepted": 0, "rejected": rejected, "seq": None}
+    seq = await writer_.submit(school, accepted)
+    return 200, {"school": school, "accepted": len(accepted), "rejected": rejected, "seq": seq}
+
+
+def make_connection_handler(writer_: IngestWriter):
+    async def on_connection(reader: asyncio.StreamReader, stream: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    request = await _read_request(reader)
+                except IngestError as e:
+                    stream.write(_response(e.status, {"error": str(e)}, keep_alive=False))
+                    break
+                except (ValueError, asyncio.IncompleteReadError):
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload = await handle_request(writer_, method, path, headers, body)
+                except IngestError as e:
+                    status, payload = e.status, {"error": str(e)}
+                except Exception as e:
+                    status, payload = 500, {"error": f"{type(e).__name__}: {e}"}
+                stream.write(_response(status, payload, keep_alive))
+                await stream.drain()
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            stream.close()
+
+    return on_connection
+
+
+async def serve(store: ColumnStore, host: str = "127.0.0.1", port: int = 8700, unix: str | None = None):
+    writer_ = IngestWriter(store)
+    recovered = await asyncio.to_thread(writer_.recover)
+    writer_task = asyncio.create_task(writer_.run())
+
+    handler = make_connection_handler(writer_)
+    if unix:
+        server = await asyncio.start_unix_server(handler, path=unix)
+        where = f"unix:{unix}"
+    else:
+        server = await asyncio.start_server(handler, host, port)
+        where = f"http://{host}:{port}"
+    print(f"ingest listening on {where} (store: {store.root}, version {writer_.seq}, WAL 복구 {recovered}건)", flush=True)
+    async with server:
+        await asyncio.gather(server.serve_forever(), writer_task)
+
+# ==============================================================================
+# 5. 가짜 로거 클라이언트 (부하 · 동작 확인용)
+# ==============================================================================
+def fake_readings(school: str, start: pd.Timestamp, rows: int, step_s: int) -> list[dict]:
+    ec_target = SCHOOL_INFO[school]["ec_target"]
+    times = start + pd.to_timedelta(np.arange(rows) * step_s, unit="s")
+    hours = times.hour.to_numpy() + times.minute.to_numpy() / 60
+    rng = np.random.default_rng()
+    temp = 20 + 4 * np.sin((hours - 9) / 24 * 2 * np.pi) + rng.normal(0, 0.3, rows)
+    return [
+        {"time": t.strftime("%Y-%m-%d %H:%M:%S"), "temperature": round(a, 2),
+         "humidity": round(b, 2), "ph": round(c, 2), "ec": round(d, 2)}
+        for t, a, b, c, d in zip(times, temp, 60 - 1.5 * (temp - 20) + rng.normal(0, 1, rows),
+                                 6.2 + rng.normal(0, 0.1, rows), ec_target * (1 + rng.normal(0, 0.05, rows)))
+    ]
+
+
+async def _post(reader, writer, school: str, body: bytes) -> tuple[int, dict]:
+    from urllib.parse import quote
+
+    writer.write((f"POST /ingest/{quote(school)} HTTP/1.1\r\nHost: ingest\r\nContent-Type: application/json\r\n"
+                  f"Content-Length: {len(body)}\r\n\r\n").encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while (line := await reader.readline()) not in (b"\r\n", b""):
+        if line.lower().startswith(b"content-length:"):
+            length = int(line.split(b":")[1])
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def run_fake_logger(idx: int, school: str, batches: int, batch_rows: int, step_s: int,
+                          host: str, port: int, unix: str | None, latencies: list, errors: list):
+    if unix:
+        reader, writer = await asyncio.open_unix_connection(unix)
+    else:
+        reader, writer = await asyncio.open_connection(host, port)
+    # 로거마다 시각을 조금씩 어긋나게 시작 (실제 로거처럼 동시에 몰렸다가 흩어짐)
+    start = pd.Timestamp.now().floor("s") + pd.Timedelta(seconds=idx)
+    try:
+        for i in range(batches):
+            readings = fake_readings(school, start + pd.Timedelta(seconds=i * batch_rows * step_s), batch_rows, step_s)
+            body = json.dumps({"readings": readings}).encode("utf-8")
+            t = time.perf_counter()
+            while True:
+                status, payload = await _post(reader, writer, school, body)
+                if status != 503:
+                    break
+                await asyncio.sleep(0.05 + random.random() * 0.1)
+            latencies.append(time.perf_counter() - t)
+            if status != 200:
+                errors.append(payload)
+    finally:
+        writer.close()
+
+
+async def fake_load(loggers: int, batches: int, batch_rows: int, step_s: int,
+                    host: str, port: int, unix: str | None) -> dict:
+    latencies, errors = [], []
+    t = time.perf_counter()
+    await asyncio.gather(*[
+        run_fake_logger(i, SCHOOL_NAMES_BY_EC[i % len(SCHOOL_NAMES_BY_EC)], batches, batch_rows, step_s,
+                        host, port, unix, latencies, errors)
+        for i in range(loggers)
+    ])
+    wall = time.perf_counter() - t
+    ordered = sorted(latencies) or [0.0]
+    return {
+        "loggers": loggers,
+        "requests": len(latencies),
+        "errors": len(errors),
+        "rows_per_s": len(latencies) * batch_rows / wall if wall else 0.0,
+        "p50_ms": ordered[len(ordered) // 2] * 1000,
+        "p99_ms": ordered[min(len(ordered) - 1, int(0.99 * len(ordered)))] * 1000,
+        "mean_ms": statistics.fmean(ordered) * 1000,
+    }
+
+
+# ==============================================================================
+# 6. 대용량 CSV / XLSX 스트리밍 가져오기 (청크 단위 - 파일 크기와 무관하게 메모리 상한 유지)
+# ==============================================================================
+# 청크마다 검증 → 세그먼트 기록 → 시간 단위 롤업 · 품질 통계 갱신
+#   store/_rollups/<학교>.csv    시간별 측정값 합계 · 개수 · 최소 · 최대 (평균 = 합계 / 개수)
+#   store/_quality/<학교>.json   누적 품질 통계 (시각 오류, 결측, 범위 이탈, 순서 뒤바뀜) + 가져온 파일 목록
+# 가져온 파일은 경로 · 크기 · 수정 시각 · 내용 해시로 기록해 같은 파일을 다시 가져와도 행이 중복되지 않음
+ROLLUP_AGG = {"sum": "sum", "count": "sum", "min": "min", "max": "max"}
+
+
+class HourlyRollup:
+    def __init__(self, table: pd.DataFrame | None = None):
+        self.table = table
+
+    @classmethod
+    def load(cls, path: Path) -> "HourlyRollup":
+        if not path.exists():
+            return cls()
+        return cls(pd.read_csv(path, index_col="hour", parse_dates=["hour"]))
+
+    def update(self, frame: pd.DataFrame):
+        groups = frame[READING_COLUMNS].groupby(frame["time"].dt.floor("h").rename("hour"))
+        part = pd.concat([getattr(groups, stat)().add_suffix(f"_{stat}") for stat in ROLLUP_AGG], axis=1)
+        if self.table is not None:
+            part = pd.concat([self.table, part])
+            part = part.groupby(level=0).agg({col: ROLLUP_AGG[col.rsplit("_", 1)[1]] for col in part.columns})
+        self.table = part.sort_index()
+
+    def means(self) -> pd.DataFrame:
+        if self.table is None:
+            return pd.DataFrame(columns=READING_COLUMNS)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame({m: self.table[f"{m}_sum"] / self.table[f"{m}_count"].replace(0, np.nan)
+                                 for m in READING_COLUMNS})
+
+    def save(self, path: Path):
+        if self.table is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _atomic_write(path, lambda f: f.write(self.table.to_csv().encode("utf-8")))
+
+
+def _empty_quality() -> dict:
+    return {"rows": 0, "accepted": 0, "bad_time": 0, "all_missing": 0, "out_of_order": 0,
+            "missing": dict.fromkeys(READING_COLUMNS, 0), "out_of_range": dict.fromkeys(READING_COLUMNS, 0),
+            "time_min": None, "time_max": None, "files": []}
+
+
+def _merge_quality(total: dict, chunk: dict):
+    for key in ("rows", "accepted", "bad_time", "all_missing"):
+        total[key] += chunk[key]
+    for key in ("missing", "out_of_range"):
+        for metric, n in chunk[key].items():
+            total[key][metric] += n
+
+
+def canonical_columns(columns: pd.Index) -> dict[str, str]:
+    # 원본 헤더(한글 · 대소문자 등)를 time + 표준 측정 컬럼 이름으로 바꾸는 매핑 (첫 청크에서 한 번 계산)
+    probe = pd.DataFrame(columns=[str(c).strip().lower() for c in columns])
+    rename = dict(zip(columns, probe.columns))
+    mapping = {}
+    time_col = analytics.get_column_safe(probe, ["time", "시간", "날짜"])
+    if time_col:
+        mapping[time_col] = "time"
+    for metric, keywords in analytics.ENV_METRICS.items():
+        col = analytics.get_column_safe(probe, keywords)
+        if col and col not in mapping:
+            mapping[col] = metric
+    return {orig: mapping[low] for orig, low in rename.items() if low in mapping}
+
+
+def source_entry(path: Path) -> dict:
+    stat = path.stat()
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return {"path": str(path.resolve()), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "digest": digest.hexdigest()}
+
+
+def find_loaded(quality: dict, source: dict) -> dict | None:
+    # 내용 해시가 같으면 이미 가져온 파일 (이름만 바뀐 사본 포함). 경로는 같은데 내용이 바뀌었으면 중단
+    loaded = [f for f in quality["files"] if isinstance(f, dict)]
+    for f in loaded:
+        if f["digest"] == source["digest"]:
+            return f
+    if any(f["path"] == source["path"] for f in loaded):
+        raise RuntimeError(f"{Path(source['path']).name}: 이미 가져온 파일의 내용이 바뀌었습니다. "
+                           f"이전 행과 중복되므로 저장소를 비우고 다시 가져오세요")
+    return None
+
+
+def stream_chunks(path: Path, school: str, chunk_rows: int = CHUNK_ROWS):
+    # .gz / .zst 는 pandas 가 스트림으로 압축을 풀며 읽으므로 임시 파일이 생기지 않음
+    suffix = analytics.source_suffix(path)
+    if suffix in analytics.WORKBOOK_SUFFIXES:
+        return analytics.iter_xlsx_blocks(path, analytics.school_sheet(path, school), chunk_rows)
+    if suffix == ".csv.zst":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError:
+            raise RuntimeError(f"{path.name}: .csv.zst 를 읽으려면 zstandard 패키지가 필요합니다 (pip install zstandard)")
+    return pd.read_csv(path, encoding="utf-8-sig", chunksize=chunk_rows, compression="infer")
+
+
+def _write_quality(path: Path, quality: dict):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _atomic_write(path, lambda f: f.write(json.dumps(quality, ensure_ascii=False, indent=2).encode("utf-8")))
+
+
+def _staged_rollup(store: ColumnStore, school: str, seq: int) -> Path:
+    return store.rollup_path(school).with_suffix(f".{seq}.pending")
+
+
+def _resume_load(store: ColumnStore, school: str, quality: dict, source: dict) -> tuple[int, int]:
+    # 중단된 load 의 마지막 커밋 지점(품질 파일의 loading)으로 저장소를 맞추고 (이어 읽을 원본 행 수, 일련번호) 반환
+    progress = quality.get("loading")
+    if progress is None:
+        return 0, store.version()
+    if progress["digest"] != source["digest"]:
+        raise RuntimeError(f"{Path(progress['path']).name} 을(를) 가져오다 중단되었습니다. 그 파일을 먼저 다시 가져오세요")
+    seq = progress["seq"]
+    staged = _staged_rollup(store, school, seq)
+    if staged.exists():
+        os.replace(staged, store.rollup_path(school))     # 커밋 뒤 롤업 교체 전에 중단된 경우 마저 반영
+    for path in store.rollup_path(school).parent.glob(f"{school}.*.pending"):
+        path.unlink()
+    (store.root / school / f"{seq + 1:012d}-{seq + 1:012d}.npz").unlink(missing_ok=True)   # 커밋되지 않은 청크
+    if store.version() < seq:
+        store.set_version(seq)
+    return progress["rows_done"], seq
+
+
+def load_file(store: ColumnStore, path: Path, school: str, chunk_rows: int = CHUNK_ROWS) -> dict | None:
+    # 수집 서버(serve)와 같은 저장소에 동시에 쓰지 않도록 서버를 멈춘 상태에서 실행
+    # 이미 가져온 파일이면 아무것도 쓰지 않고 None
+    # 청크마다 세그먼트 → 임시 롤업 → 품질 파일(loading: 커밋한 원본 행 수 · 일련번호) 순으로 기록하고, 품질 파일이
+    # 바뀐 뒤에야 롤업 교체 · 버전 갱신 · 병합을 함. 중간에 실패해도 다시 실행하면 마지막 커밋 지점부터 이어서 가져옴
+    rollup_path = store.rollup_path(school)
+    quality_path = store.quality_path(school)
+    quality = json.loads(quality_path.read_text(encoding="utf-8")) if quality_path.exists() else _empty_quality()
+    source = source_entry(path)
+    if find_loaded(quality, source) is not None:
+        return None
+    skip, seq = _resume_load(store, school, quality, source)
+    rollup = HourlyRollup.load(rollup_path)
+    last_time = pd.Timestamp(quality["time_max"]) if quality["time_max"] else None
+    rename = None
+    consumed = 0
+
+    for chunk in stream_chunks(path, school, chunk_rows):
+        if rename is None:
+            rename = canonical_columns(chunk.columns)
+            if "time" not in rename.values():
+                raise RuntimeError(f"{path.name}: 시각 컬럼(time/시간/날짜)을 찾을 수 없습니다")
+        consumed += len(chunk)
+        if consumed <= skip:
+            continue
+        chunk = chunk.iloc[max(0, skip - (consumed - len(chunk))):].rename(columns=rename)
+
+        # 정렬 전 원본 순서 기준으로 이전 시각보다 앞선 행 수를 셈
+        times = analytics.parse_time_column(chunk["time"]).reset_index(drop=True)
+        seeded = pd.concat([pd.Series([last_time], dtype=times.dtype), times], ignore_index=True)
+        previous = seeded.cummax().shift(1).iloc[1:].reset_index(drop=True)
+        quality["out_of_order"] += int((times < previous).sum())
+
+        accepted, stats = inspect_readings(chunk)
+        _merge_quality(quality, stats)
+        staged = None
+        if not accepted.empty:
+            seq += 1
+            store.write_segment(school, seq, seq, accepted)
+            rollup.update(accepted)
+            staged = _staged_rollup(store, school, seq)
+            rollup.save(staged)
+
+            chunk_min, chunk_max = accepted["time"].iloc[0], accepted["time"].iloc[-1]
+            last_time = chunk_max if last_time is None else max(last_time, chunk_max)
+            quality["time_min"] = str(chunk_min if quality["time_min"] is None else min(pd.Timestamp(quality["time_min"]), chunk_min))
+            quality["time_max"] = str(last_time)
+
+        quality["loading"] = {**source, "rows_done": consumed, "seq": seq}
+        _write_quality(quality_path, quality)
+        if staged is not None:
+            os.replace(staged, rollup_path)
+            store.set_version(seq)
+            store.compact(school)
+
+    quality.pop("loading", None)
+    quality["files"].append({**source, "loaded_at": time.time()})
+    _write_quality(quality_path, quality)
+    return quality
+
+
+def main():
+    parser = argparse.ArgumentParser(description="센서 측정값 수집 서비스")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p_serve = sub.add_parser("serve", help="수집 서버 실행")
+    p_serve.add_argument("--host", default="127.0.0.1")
+    p_serve.add_argument("--port", type=int, default=8700)
+    p_serve.add_argument("--unix", help="TCP 대신 유닉스 소켓 경로에서 대기")
+    p_serve.add_argument("--store", type=Path, default=STORE_DIR)
+
+    p_fake = sub.add_parser("fake", help="가짜 로거로 측정값 전송")
+    p_fake.add_argument("--host", default="127.0.0.1")
+    p_fake.add_argument("--port", type=int, default=8700)
+    p_fake.add_argument("--unix")
+    p_fake.add_argument("--loggers", type=int, default=8)
+    p_fake.add_argument("--batches", type=int, default=10)
+    p_fake.add_argument("--batch-rows", type=int, default=60)
+    p_fake.add_argument("--step", type=int, default=60, help="측정 간격(초)")
+    p_load = sub.add_parser("load", help="대용량 환경 데이터(.csv/.csv.gz/.csv.zst/.xlsx)를 청크 단위로 저장소에 가져오기 "
+                                         "(serve 와 동시에 실행하지 말 것)")
+    p_load.add_argument("files", nargs="+", type=Path)
+    p_load.add_argument("--school", help="실험군 (기본: 파일명에서 찾음)")
+    p_load.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    p_load.add_argument("--store", type=Path, default=STORE_DIR)
+    args = parser.parse_args()
+
+    try:
+        if args.command == "load":
+            import resource
+
+            store = ColumnStore(args.store)
+            for path in args.files:
+                school = args.school or analytics.match_school(path.name)
+                if school not in SCHOOL_INFO:
+                    print(f"{path}: 실험군을 알 수 없습니다 (--school 로 지정)", file=sys.stderr)
+                    return 1
+                t = time.perf_counter()
+                quality = load_file(store, path, school, args.chunk_rows)
+                if quality is None:
+                    print(f"{path.name} -> {school}: 이미 가져온 파일이므로 건너뜀")
+                    continue
+                elapsed = time.perf_counter() - t
+                print(f"{path.name} -> {school}: {quality['accepted']}/{quality['rows']}행 누적 "
+                      f"({elapsed:.1f}s, 시각 오류 {quality['bad_time']}, 순서 뒤바뀜 {quality['out_of_order']}, "
+                      f"범위 이탈 {sum(quality['out_of_range'].values())})")
+            print(f"peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f} MB")
+        elif args.command == "serve":
+            asyncio.run(serve(ColumnStore(args.store), args.host, args.port, args.unix))
+        else:
+            report = asyncio.run(fake_load(args.loggers, args.batches, args.batch_rows, args.step,
+                                           args.host, args.port, args.unix))
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+            return 1 if report["errors"] else 0
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 동시 접속 부하 테스트
+# Streamlit 테스트 인터페이스(AppTest)로 N개 세션을 동시에 열고 위젯 조작을 재생
+#
+#   python loadtest.py --levels 1,4,16 --out loadtest.json
+#   python loadtest.py --levels 8 --data-dir bench_data      (bench.py generate 로 만든 합성 데이터)
+#
+# 동시성 단계마다 새 프로세스에서 실행하므로 단계별 캐시는 콜드 스타트, 최대 RSS 는 단계별 값
+# 탭 전환은 브라우저에서만 일어나고 rerun 을 일으키지 않으므로 시나리오에 포함하지 않음
+# ==============================================================================
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import json
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import threading
+import time
+
+APP_PATH = Path(__file__).resolve().parent / "main.py"
+SCHOOL_FILTER_LABEL = "🏫 학교 선택"
+
+# ==============================================================================
+# 1. 세션 시나리오
+# ==============================================================================
+def _school_filter(at):
+    return next(sb for sb in at.selectbox if sb.label == SCHOOL_FILTER_LABEL)
+
+
+def scripted_interactions(school_names: list[str], profile_layouts: list[str]) -> list[tuple]:
+    # 한 반이 대시보드를 열고 둘러보는 흐름: 시계열 학교 변경 → 프로필 조작 → 사이드바 필터
+    steps = []
+    for school in school_names[1:]:
+        steps.append((f"ts_school={school}", lambda at, s=school: at.selectbox(key="ts_school").set_value(s)))
+    steps.append(("profile_metric=ec", lambda at: at.selectbox(key="profile_metric").set_value("ec")))
+    steps.append(("profile_layout", lambda at: at.radio(key="profile_layout").set_value(profile_layouts[-1])))
+    for school in school_names[:2]:
+        steps.append((f"school={school}", lambda at, s=school: _school_filter(at).set_value(s)))
+    steps.append(("school=전체", lambda at: _school_filter(at).set_value("전체")))
+    return steps
+
+
+def run_session(barrier: threading.Barrier, steps: list[tuple], timeout: float) -> list[dict]:
+    from streamlit.testing.v1 import AppTest
+
+    samples = []
+    at = AppTest.from_file(str(APP_PATH), default_timeout=timeout)
+    barrier.wait()
+
+    for action, apply in [("initial", None)] + steps:
+        t = time.perf_counter()
+        try:
+            if apply is not None:
+                apply(at)
+            at.run()
+            error = len(at.exception) > 0
+        except Exception:
+            error = True
+        samples.append({"action": action, "latency_s": time.perf_counter() - t, "error": error})
+        if error:
+            break
+    return samples
+
+# ==============================================================================
+# 2. 동시성 단계 실행 (단계마다 별도 프로세스)
+# ==============================================================================
+def _percentiles(values: list[float]) -> dict[str, float]:
+    if not values:
+        return {}
+    ordered = sorted(values)
+
+    def pick(q):
+        return ordered[min(len(ordered) - 1, int(round(q * (len(ordered) - 1))))] * 1000
+
+    return {"p50": pick(0.50), "p90": pick(0.90), "p95": pick(0.95), "p99": pick(0.99), "max": ordered[-1] * 1000,
+            "mean": statistics.fmean(ordered) * 1000}
+
+
+def _share_script_cache():
+    # 실제 서버는 모든 세션이 잠금이 걸린 ScriptCache 하나를 공유하지만 AppTest 는 실행마다 새로 만들어 main.py 를 다시 파싱
+    # Python 3.11 의 ast.parse 는 스레드 동시 호출 시 SystemError 가 날 수 있으므로 서버처럼 하나를 공유
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+
+    shared = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: shared
+
+
+def run_level(concurrency: int, timeout: float, data_dir: str | None) -> dict:
+    os.chdir(APP_PATH.parent)
+    if data_dir:
+        os.environ["DASHBOARD_DATA_DIR"] = data_dir
+    sys.path.insert(0, str(APP_PATH.parent))
+
+    import analytics
+    analytics.register_dataset_schools(analytics.DATA_DIR)
+    steps = scripted_interactions(analytics.SCHOOL_NAMES_BY_EC, analytics.PROFILE_LAYOUTS)
+
+    _share_script_cache()
+    barrier = threading.Barrier(concurrency)
+    results: list[list[dict]] = [[] for _ in range(concurrency)]
+
+    def worker(i):
+        results[i] = run_session(barrier, steps, timeout)
+
+    cpu0 = time.process_time()
+    wall0 = time.perf_counter()
+    threads = [threading.Thread(target=worker, args=(i,), name=f"session-{i}") for i in range(concurrency)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    wall = time.perf_counter() - wall0
+    cpu = time.process_time() - cpu0
+
+    samples = [s for session in results for s in session]
+    ok = [s["latency_s"] for s in samples if not s["error"]]
+    initial = [s["latency_s"] for s in samples if s["action"] == "initial" and not s["error"]]
+    return {
+        "concurrency": concurrency,
+        "reruns": len(samples),
+        "errors": sum(s["error"] for s in samples),
+        "wall_s": wall,
+        "throughput_rps": len(ok) / wall if wall else 0.0,
+        "latency_ms": _percentiles(ok),
+        "initial_latency_ms": _percentiles(initial),
+        "cpu_s": cpu,
+        "cpu_cores_used": cpu / wall if wall else 0.0,
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }
+
+
+def run_levels(levels: list[int], timeout: float = 120.0, data_dir: str | None = None) -> list[dict]:
+    ctx = multiprocessing.get_context("spawn")
+    reports = []
+    for level in levels:
+        with ProcessPoolExecutor(max_workers=1, mp_context=ctx) as pool:
+            report = pool.submit(run_level, level, timeout, data_dir).result()
+        print_level(report)
+        reports.append(report)
+    return reports
+
+
+def print_level(report: dict):
+    lat = report["latency_ms"]
+    print(f"N={report['concurrency']:<4} reruns={report['reruns']:<5} errors={report['errors']:<3} "
+          f"p50={lat.get('p50', 0):8.0f}ms p95={lat.get('p95', 0):8.0f}ms p99={lat.get('p99', 0):8.0f}ms "
+          f"first-paint p95={report['initial_latency_ms'].get('p95', 0):8.0f}ms "
+          f"rps={report['throughput_rps']:6.2f} cpu={report['cpu_cores_used']:4.2f} cores "
+          f"peakRSS={report['peak_rss_mb']:7.1f}MB", flush=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 세션 부하 테스트")
+    parser.add_argument("--levels", default="1,2,4,8", help="동시 세션 수 목록 (쉼표 구분)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="rerun 1회 제한 시간(초)")
+    parser.add_argument("--data-dir", help="데이터 디렉터리 (기본: data/)")
+    parser.add_argument("--out", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    levels = [int(x) for x in args.levels.split(",") if x.strip()]
+    reports = run_levels(levels, args.timeout, args.data_dir)
+    if args.out:
+        args.out.write_text(json.dumps(reports, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if any(r["errors"] for r in reports) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,428 +4,333 @@
 # ==============================================================================
 
 import streamlit as st
-import pandas as pd
 import numpy as np
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import pandas as pd
 from pathlib import Path
-import unicodedata
-import io
+import hashlib
+import os
+
+import analytics
+from analytics import (
+    SCHOOL_INFO, SCHOOL_NAMES_BY_EC,
+    ENV_METRICS, METRIC_LABELS, BASE_TEMP, PROFILE_LAYOUTS, PLANT_ATTRIBUTES,
+    get_column_safe, prepare_env_frame, get_cumulative_indices,
+    build_env_summary, compute_overview_metrics, build_ec_weight_table, fit_weight_trend,
+    build_length_table, build_growth_long, export_env_csv, export_growth_xlsx,
+    build_feature_table, build_growth_outcomes, build_feature_correlation,
+)
+import profiling
 
 # ==============================================================================
 # 0. 페이지 설정 및 프리미엄 CSS
 # ==============================================================================
-st.set_page_config(
-    page_title="🌱 극지식물 최적 EC 농도 연구",
-    page_icon="🌱",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+# 스타일은 static/dashboard.css 로 분리 (.streamlit/config.toml 의 enableStaticServing 필요)
+# 매 rerun 마다 CSS 전체 대신 @import 한 줄만 보내고, 파일은 브라우저가 한 번 받아 캐시
+PAGE_CSS = "<style>@import url('app/static/dashboard.css');</style>"
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+BADGE_EXPANDER_AFTER = 12   # 실험군이 이보다 많으면 사이드바 배지를 접어서 표시
+LIVE_POLL_SECONDS = float(os.environ.get("DASHBOARD_LIVE_POLL", "5"))  # 실시간 수집 저장소 확인 주기(초)
+LIVE_PARTITION = os.environ.get("DASHBOARD_LIVE_PARTITION", "")  # 실시간 측정값을 합칠 파티션 id (기본: data/ 루트)
+LIVE_TAIL_ROWS = os.environ.get("DASHBOARD_LIVE_TAIL")  # 원본 해상도로 합칠 학교별 최근 행 수 (기본: ingest.TAIL_ROWS)
+SQLITE_PATH = os.environ.get("DASHBOARD_SQLITE")  # 설정하면 CSV 대신 SQLite 저장소(sqlstore.py)에서 조회
+PARTITION_CACHE_SIZE = int(os.environ.get("DASHBOARD_PARTITION_CACHE", "3"))  # 메모리에 유지할 최근 파티션 수
+CLIENT_FILTER_DEFAULT = os.environ.get("DASHBOARD_CLIENT_FILTER") == "1"  # 브라우저 필터 모드 기본값
+PLANT_PAGE_SIZES = [25, 50, 100, 200]   # 개체 탐색 표 한 페이지 행 수
+PLANT_TOP_K = 10
+PLANT_SCATTER_MAX = 20_000              # 개체 산점도에 보내는 최대 점 수
+PRECOMPUTE_INTERVAL = float(os.environ.get("DASHBOARD_PRECOMPUTE", "30"))  # 백그라운드 사전 계산 확인 주기(초), 0 이면 끔
 
-# 프리미엄 CSS 스타일
-st.markdown("""
-<style>
-@import url('https://fonts.googleapis.com/css2?family=Noto+Sans+KR:wght@300;400;500;700;900&display=swap');
-
-/* 기본 폰트 설정 */
-html, body, [class*="css"] {
-    font-family: 'Noto Sans KR', sans-serif;
-}
-
-/* 배경 그라데이션 */
-.stApp {
-    background: linear-gradient(135deg, #0f0f23 0%, #1a1a2e 50%, #16213e 100%);
-}
-
-/* 히어로 섹션 */
-.hero-container {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 50%, #f093fb 100%);
-    border-radius: 20px;
-    padding: 40px;
-    margin-bottom: 30px;
-    box-shadow: 0 20px 60px rgba(102, 126, 234, 0.4);
-    position: relative;
-    overflow: hidden;
-}
-
-.hero-container::before {
-    content: '';
-    position: absolute;
-    top: -50%;
-    left: -50%;
-    width: 200%;
-    height: 200%;
-    background: radial-gradient(circle, rgba(255,255,255,0.1) 0%, transparent 70%);
-    animation: shimmer 3s infinite;
-}
-
-@keyframes shimmer {
-    0% { transform: rotate(0deg); }
-    100% { transform: rotate(360deg); }
-}
-
-.hero-title {
-    font-size: 3.5rem;
-    font-weight: 900;
-    color: white;
-    text-shadow: 2px 2px 20px rgba(0,0,0,0.3);
-    margin-bottom: 10px;
-    position: relative;
-    z-index: 1;
-}
-
-.hero-subtitle {
-    font-size: 1.3rem;
-    color: rgba(255,255,255,0.9);
-    font-weight: 300;
-    position: relative;
-    z-index: 1;
-}
-
-/* 글래스모피즘 카드 */
-.glass-card {
-    background: rgba(255, 255, 255, 0.05);
-    backdrop-filter: blur(20px);
-    border-radius: 20px;
-    border: 1px solid rgba(255, 255, 255, 0.1);
-    padding: 25px;
-    margin: 15px 0;
-    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.3);
-    transition: all 0.3s ease;
-}
-
-.glass-card:hover {
-    transform: translateY(-5px);
-    box-shadow: 0 15px 40px rgba(102, 126, 234, 0.3);
-    border-color: rgba(102, 126, 234, 0.5);
-}
-
-/* 네온 글로우 효과 */
-.neon-text {
-    color: #00ff88;
-    text-shadow: 0 0 10px #00ff88, 0 0 20px #00ff88, 0 0 40px #00ff88;
-}
-
-.neon-blue {
-    color: #00d4ff;
-    text-shadow: 0 0 10px #00d4ff, 0 0 20px #00d4ff;
-}
-
-.neon-purple {
-    color: #bf00ff;
-    text-shadow: 0 0 10px #bf00ff, 0 0 20px #bf00ff;
-}
-
-/* 메트릭 카드 */
-.metric-card {
-    background: linear-gradient(145deg, rgba(102, 126, 234, 0.2), rgba(118, 75, 162, 0.2));
-    border-radius: 20px;
-    padding: 30px;
-    text-align: center;
-    border: 1px solid rgba(255, 255, 255, 0.1);
-    box-shadow: 0 10px 40px rgba(0, 0, 0, 0.2);
-    transition: all 0.3s ease;
-}
-
-.metric-card:hover {
-    transform: scale(1.05);
-    box-shadow: 0 15px 50px rgba(102, 126, 234, 0.4);
-}
-
-.metric-value {
-    font-size: 2.8rem;
-    font-weight: 900;
-    background: linear-gradient(135deg, #00ff88, #00d4ff);
-    -webkit-background-clip: text;
-    -webkit-text-fill-color: transparent;
-    background-clip: text;
-}
-
-.metric-label {
-    font-size: 1rem;
-    color: rgba(255, 255, 255, 0.7);
-    margin-top: 10px;
-    font-weight: 500;
-}
-
-/* EC 뱃지 */
-.ec-badge {
-    display: inline-block;
-    padding: 8px 20px;
-    border-radius: 30px;
-    font-weight: 700;
-    font-size: 1.1rem;
-    margin: 5px;
-    transition: all 0.3s ease;
-}
-
-.ec-badge:hover {
-    transform: scale(1.1);
-}
-
-.ec-1 { background: linear-gradient(135deg, #667eea, #764ba2); color: white; }
-.ec-2 { background: linear-gradient(135deg, #00b894, #00cec9); color: white; box-shadow: 0 0 20px rgba(0, 184, 148, 0.5); }
-.ec-4 { background: linear-gradient(135deg, #fd79a8, #e84393); color: white; }
-.ec-8 { background: linear-gradient(135deg, #a29bfe, #6c5ce7); color: white; }
-
-/* 섹션 타이틀 */
-.section-title {
-    font-size: 2rem;
-    font-weight: 700;
-    color: white;
-    margin: 40px 0 20px 0;
-    padding-bottom: 15px;
-    border-bottom: 3px solid;
-    border-image: linear-gradient(90deg, #667eea, #764ba2, transparent) 1;
-}
-
-/* 인사이트 박스 */
-.insight-box {
-    background: linear-gradient(135deg, rgba(0, 255, 136, 0.1), rgba(0, 212, 255, 0.1));
-    border-left: 4px solid #00ff88;
-    border-radius: 0 15px 15px 0;
-    padding: 20px 25px;
-    margin: 20px 0;
-    color: rgba(255, 255, 255, 0.9);
-}
-
-.warning-box {
-    background: linear-gradient(135deg, rgba(255, 107, 107, 0.1), rgba(254, 202, 87, 0.1));
-    border-left: 4px solid #ff6b6b;
-    border-radius: 0 15px 15px 0;
-    padding: 20px 25px;
-    margin: 20px 0;
-    color: rgba(255, 255, 255, 0.9);
-}
-
-/* 결론 카드 */
-.conclusion-card {
-    background: linear-gradient(135deg, rgba(0, 255, 136, 0.15), rgba(0, 184, 148, 0.15));
-    border: 2px solid rgba(0, 255, 136, 0.3);
-    border-radius: 20px;
-    padding: 30px;
-    margin: 20px 0;
-}
-
-.danger-card {
-    background: linear-gradient(135deg, rgba(255, 107, 107, 0.15), rgba(238, 82, 83, 0.15));
-    border: 2px solid rgba(255, 107, 107, 0.3);
-    border-radius: 20px;
-    padding: 30px;
-    margin: 20px 0;
-}
-
-/* 테이블 스타일 */
-.styled-table {
-    width: 100%;
-    border-collapse: separate;
-    border-spacing: 0;
-    background: rgba(255, 255, 255, 0.05);
-    border-radius: 15px;
-    overflow: hidden;
-}
-
-.styled-table th {
-    background: linear-gradient(135deg, #667eea, #764ba2);
-    color: white;
-    padding: 15px;
-    font-weight: 600;
-}
-
-.styled-table td {
-    padding: 15px;
-    color: rgba(255, 255, 255, 0.9);
-    border-bottom: 1px solid rgba(255, 255, 255, 0.1);
-}
-
-.styled-table tr:hover td {
-    background: rgba(102, 126, 234, 0.1);
-}
-
-/* 애니메이션 */
-@keyframes float {
-    0%, 100% { transform: translateY(0); }
-    50% { transform: translateY(-10px); }
-}
-
-.floating {
-    animation: float 3s ease-in-out infinite;
-}
-
-@keyframes pulse {
-    0%, 100% { opacity: 1; }
-    50% { opacity: 0.7; }
-}
-
-.pulse {
-    animation: pulse 2s ease-in-out infinite;
-}
-
-/* 사이드바 스타일 */
-section[data-testid="stSidebar"] {
-    background: linear-gradient(180deg, #1a1a2e 0%, #16213e 100%);
-}
-
-section[data-testid="stSidebar"] .stMarkdown {
-    color: rgba(255, 255, 255, 0.9);
-}
-
-/* 탭 스타일 */
-.stTabs [data-baseweb="tab-list"] {
-    gap: 10px;
-    background: rgba(255, 255, 255, 0.05);
-    border-radius: 15px;
-    padding: 10px;
-}
-
-.stTabs [data-baseweb="tab"] {
-    background: transparent;
-    border-radius: 10px;
-    color: rgba(255, 255, 255, 0.7);
-    font-weight: 600;
-}
-
-.stTabs [aria-selected="true"] {
-    background: linear-gradient(135deg, #667eea, #764ba2);
-    color: white;
-}
-
-/* Expander 스타일 */
-.streamlit-expanderHeader {
-    background: rgba(255, 255, 255, 0.05);
-    border-radius: 10px;
-    color: white;
-}
-
-/* 스크롤바 */
-::-webkit-scrollbar {
-    width: 8px;
-    height: 8px;
-}
-
-::-webkit-scrollbar-track {
-    background: rgba(255, 255, 255, 0.05);
-}
-
-::-webkit-scrollbar-thumb {
-    background: linear-gradient(135deg, #667eea, #764ba2);
-    border-radius: 10px;
-}
-
-</style>
-""", unsafe_allow_html=True)
 
-# ==============================================================================
-# 1. 학교 정보 설정 (EC 오름차순 정렬)
-# ==============================================================================
-SCHOOL_INFO = {
-    "송도고": {"ec_target": 1.0, "color": "#667eea", "order": 1, "emoji": "🔵"},
-    "하늘고": {"ec_target": 2.0, "color": "#00b894", "order": 2, "emoji": "🟢"},  # 최적
-    "아라고": {"ec_target": 4.0, "color": "#e84393", "order": 3, "emoji": "🔴"},
-    "동산고": {"ec_target": 8.0, "color": "#6c5ce7", "order": 4, "emoji": "🟣"},
-}
+def setup_page():
+    st.set_page_config(
+        page_title="🌱 극지식물 최적 EC 농도 연구",
+        page_icon="🌱",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+    
+    # 프리미엄 CSS 스타일
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
+    
+    # 실험군 배지 색상은 레지스트리에서 생성 - 정적 파일로 쓸 수 없으면 인라인으로 보냄
+    css_version = publish_school_css()
+    if css_version:
+        st.markdown(f"<style>@import url('app/static/schools.css?v={css_version}');</style>", unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>{school_badge_css()}</style>", unsafe_allow_html=True)
 
-SCHOOL_NAMES_BY_EC = sorted(SCHOOL_INFO.keys(), key=lambda x: SCHOOL_INFO[x]["ec_target"])
-SCHOOL_NAMES = list(SCHOOL_INFO.keys())
 
-# ==============================================================================
-# 2. 한글 파일명 안전 인식 함수
-# ==============================================================================
-def normalize_match(target: str, candidate: str) -> bool:
-    target_nfc = unicodedata.normalize("NFC", target)
-    target_nfd = unicodedata.normalize("NFD", target)
-    candidate_nfc = unicodedata.normalize("NFC", candidate)
-    candidate_nfd = unicodedata.normalize("NFD", candidate)
-    return target_nfc == candidate_nfc or target_nfd == candidate_nfd
+def _rgba(hex_color: str, alpha: float) -> str:
+    h = hex_color.lstrip("#")
+    return f"rgba({int(h[0:2], 16)}, {int(h[2:4], 16)}, {int(h[4:6], 16)}, {alpha})"
+
 
+def school_badge_class(school: str) -> str:
+    return f"ec-badge school-{SCHOOL_INFO[school]['order']}"
 
-def find_file(directory: Path, keyword: str, extension: str) -> Path | None:
-    if not directory.exists():
+
+def school_badge_css() -> str:
+    rules = []
+    for info in SCHOOL_INFO.values():
+        start, end = info["gradient"]
+        glow = f" box-shadow: 0 0 20px {_rgba(info['color'], 0.5)};" if info["highlight"] else ""
+        rules.append(f".school-{info['order']} {{ background: linear-gradient(135deg, {start}, {end}); color: white;{glow} }}")
+    return "\n".join(rules) + "\n"
+
+
+@st.cache_resource
+def publish_school_css() -> str | None:
+    # 프로세스당 한 번 static/schools.css 를 갱신하고 캐시 무효화용 버전을 돌려줌
+    css = school_badge_css()
+    version = hashlib.blake2b(css.encode("utf-8"), digest_size=6).hexdigest()
+    target = STATIC_DIR / "schools.css"
+    try:
+        if not target.exists() or target.read_text(encoding="utf-8") != css:
+            tmp = target.with_name(f"schools.css.{os.getpid()}.tmp")
+            tmp.write_text(css, encoding="utf-8")
+            os.replace(tmp, target)
+    except OSError:
         return None
-    for file_path in directory.iterdir():
-        if file_path.suffix.lower() == extension:
-            file_name = file_path.stem
-            keyword_nfc = unicodedata.normalize("NFC", keyword)
-            keyword_nfd = unicodedata.normalize("NFD", keyword)
-            file_name_nfc = unicodedata.normalize("NFC", file_name)
-            file_name_nfd = unicodedata.normalize("NFD", file_name)
-            if keyword_nfc in file_name_nfc or keyword_nfd in file_name_nfd:
-                return file_path
-    return None
+    return version
 
 # ==============================================================================
-# 3. 데이터 로딩 함수
+# 1. 분석 코어 연결 (캐시 래퍼 + 계측)
 # ==============================================================================
-@st.cache_data
-def load_environment_data() -> dict[str, pd.DataFrame]:
-    data_dir = Path("data")
-    env_data = {}
-    
-    if not data_dir.exists():
+# 캐시된 함수 본문은 캐시 실패 시에만 실행되므로 본문에서 mark_miss() 로 적중/실패를 구분
+@st.cache_data(ttl=60, show_spinner=False)
+def _cached_partitions() -> list[dict]:
+    profiling.mark_miss()
+    return analytics.load_manifest(analytics.DATA_DIR)
+
+
+# 파티션별 원본은 최근 사용 순으로 PARTITION_CACHE_SIZE 개만 유지 (st.cache_data 의 max_entries 는 LRU)
+@st.cache_data(max_entries=PARTITION_CACHE_SIZE)
+def _cached_csv_environment_data(data_dir: str) -> dict[str, pd.DataFrame]:
+    profiling.mark_miss()
+    return analytics.load_environment_data(Path(data_dir))
+
+
+@st.cache_data(max_entries=PARTITION_CACHE_SIZE * 2)
+def _cached_environment_data(data_dir: str, store_version: int, sql_version: int,
+                             start: str | None, end: str | None) -> dict[str, pd.DataFrame]:
+    # 저장소 버전이 바뀌면 원본은 캐시에서, 실시간 측정값은 최근 구간 원본 + 이전 구간 시간별 롤업으로 합침
+    # SQLite 모드에서는 선택한 기간의 행만 DB 에서 가져옴
+    profiling.mark_miss()
+    if SQLITE_PATH:
+        import sqlstore  # 수집 · SQLite · 사전 계산 모듈은 해당 기능을 쓸 때만 로드
+        
+        env_data = sqlstore.load_environment_data(SQLITE_PATH, start, end)
+    else:
+        env_data = _cached_csv_environment_data(data_dir)
+    if store_version == 0:
         return env_data
+    import ingest
+    
+    tail_rows = int(LIVE_TAIL_ROWS) if LIVE_TAIL_ROWS else ingest.TAIL_ROWS
+    return analytics.merge_live_readings(env_data, live_store().read_recent(tail_rows))
+
+
+@st.cache_data(max_entries=PARTITION_CACHE_SIZE)
+def _cached_growth_data(data_dir: str, sql_version: int) -> dict[str, pd.DataFrame]:
+    profiling.mark_miss()
+    if SQLITE_PATH:
+        import sqlstore
+        
+        return sqlstore.load_growth_data(SQLITE_PATH)
+    return analytics.load_growth_data(Path(data_dir))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_sql_aggregate(name: str, sql_version: int, *args):
+    # GROUP BY 를 DB 에서 수행하는 sqlstore 집계 함수 (결과 형태는 analytics 집계와 동일)
+    import sqlstore
     
-    for file_path in data_dir.iterdir():
-        if file_path.suffix.lower() == ".csv":
-            file_name_nfc = unicodedata.normalize("NFC", file_path.stem)
-            if "환경" in file_name_nfc:
-                for school in SCHOOL_NAMES:
-                    school_nfc = unicodedata.normalize("NFC", school)
-                    if school_nfc in file_name_nfc and school not in env_data:
-                        try:
-                            df = pd.read_csv(file_path, encoding="utf-8-sig")
-                            df.columns = [unicodedata.normalize("NFC", col.strip().lower()) for col in df.columns]
-                            env_data[school] = df
-                        except Exception as e:
-                            pass
+    profiling.mark_miss()
+    return getattr(sqlstore, name)(SQLITE_PATH, *args)
+
+
+# 파티션 하나에 학교 × 지표 × 배치 조합이 수십 개 - 파티션 캐시 개수에 맞춰 상한을 둠
+@st.cache_data(show_spinner=False, max_entries=PARTITION_CACHE_SIZE * 64)
+def _cached_profile_grid(frame: pd.DataFrame, metric: str, layout: str) -> pd.DataFrame:
+    profiling.mark_miss()
+    return analytics.compute_profile_grid(frame, metric, layout)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def _cached_figure(builder_name: str, *args):
+    import figures  # plotly 는 첫 그래프를 그릴 때 로드
     
-    return env_data
+    profiling.mark_miss()
+    return getattr(figures, builder_name)(*args)
+
+
+@st.cache_data(show_spinner=False, max_entries=PARTITION_CACHE_SIZE)
+def _cached_growth_xlsx(growth_data: dict[str, pd.DataFrame]) -> bytes:
+    profiling.mark_miss()
+    return export_growth_xlsx(growth_data)
+
+
+def sql_version() -> int:
+    # DB 파일(WAL 포함)의 수정 시각 - 다시 가져오기 등으로 바뀌면 캐시를 무효화
+    if not SQLITE_PATH:
+        return 0
+    return sum(os.stat(p).st_mtime_ns for p in (SQLITE_PATH, SQLITE_PATH + "-wal") if os.path.exists(p))
+
+
+def list_partitions() -> list[dict]:
+    return profiling.cached_call("partitions", _cached_partitions)
+
+
+def load_environment_data(data_dir: Path, bounds: tuple[str | None, str | None] = (None, None)) -> dict[str, pd.DataFrame]:
+    version = live_version(data_dir)
+    st.session_state["store_version"] = version
+    return profiling.cached_call("load_environment_data", _cached_environment_data,
+                                 str(data_dir), version, sql_version(), *bounds)
+
+
+def load_growth_data(data_dir: Path) -> dict[str, pd.DataFrame]:
+    return profiling.cached_call("load_growth_data", _cached_growth_data, str(data_dir), sql_version())
+
+
+def sql_aggregate(name: str, *args):
+    return profiling.cached_call(f"sql:{name}", _cached_sql_aggregate, name, sql_version(), *args)
+
+
+def compute_profile_grid(frame: pd.DataFrame, metric: str, layout: str) -> pd.DataFrame:
+    return profiling.cached_call("compute_profile_grid", _cached_profile_grid, frame, metric, layout)
+
+
+def build_figure(builder_name: str, *args):
+    with profiling.section(f"figure:{builder_name}"):
+        return profiling.cached_call(f"figure:{builder_name}", _cached_figure, builder_name, *args)
+
 
+def growth_xlsx_bytes(growth_data: dict[str, pd.DataFrame]) -> bytes:
+    return profiling.cached_call("export_growth_xlsx", _cached_growth_xlsx, growth_data)
 
-@st.cache_data
-def load_growth_data() -> dict[str, pd.DataFrame]:
-    data_dir = Path("data")
-    growth_data = {}
+
+def timeseries_bundle_figure(env_data: dict[str, pd.DataFrame], metric: str):
+    # 학교별 trace 묶음은 학교 단위로 캐시 - 한 학교 데이터만 바뀌면 그 학교 묶음만 다시 만듦
+    bundles = {}
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in env_data:
+            frame = prepare_env_frame(env_data[school])
+            if not frame.empty and frame[metric].notna().any():
+                bundles[school] = build_figure("timeseries_trace_bundle", frame, metric, school)
+    if not bundles:
+        return None
+    import figures
     
-    if not data_dir.exists():
-        return growth_data
+    with profiling.section("figure:build_timeseries_bundle_figure"):
+        return figures.build_timeseries_bundle_figure(bundles, metric)
+
+
+def profile_bundle_figure(env_data: dict[str, pd.DataFrame], metric: str, layout: str):
+    profiles = {}
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in env_data:
+            frame = prepare_env_frame(env_data[school])
+            if not frame.empty and frame["time"].dt.hour.nunique() >= 2:
+                profiles[school] = compute_profile_grid(frame, metric, layout)
+    return build_figure("build_profile_bundle_figure", profiles, metric, layout) if profiles else None
+
+
+def derived(snapshot: dict | None, key, compute):
+    # 백그라운드 스냅숏에 있으면 그대로 쓰고, 없으면(준비 전 · SQLite · 실시간 병합) 이번 rerun 에서 계산
+    if snapshot is not None and key in snapshot["artifacts"]:
+        profiling.record_cache("snapshot", hit=True)
+        value = snapshot["artifacts"][key]
+        if isinstance(key, tuple) and key[0] == "figure":
+            # 스냅숏 그래프는 모든 세션이 공유 - 세션에서 레이아웃을 바꿔도 다른 사용자 그래프에 번지지 않도록 사본
+            # go.Figure(원본) 은 원본 trace 속성을 잠시 변경하므로 동시 세션에서 깨짐 - 읽기 전용 to_dict() 로 복사
+            import plotly.graph_objects as go
+            value = go.Figure(value.to_dict())
+        return value
+    if snapshot is not None:
+        profiling.record_cache("snapshot", hit=False)
+    return compute()
+
+
+def render_chart(name: str, fig):
+    # 디버그 패널이 켜진 경우에만 직렬화 크기를 측정 (측정 자체가 직렬화를 한 번 더 하므로)
+    if profiling.payload_tracking():
+        profiling.record_payload(name, len(fig.to_json().encode("utf-8")))
+    with profiling.section(f"chart:{name}"):
+        st.plotly_chart(fig, width="stretch")
+
+
+@st.cache_resource
+def live_store() -> "ingest.ColumnStore":
+    # 세션 간에 공유 - 한 번 읽은 세그먼트는 다시 읽지 않음
+    import ingest
     
-    for file_path in data_dir.iterdir():
-        if file_path.suffix.lower() == ".csv":
-            file_name_nfc = unicodedata.normalize("NFC", file_path.stem)
-            if "생육" in file_name_nfc:
-                for school in SCHOOL_NAMES:
-                    school_nfc = unicodedata.normalize("NFC", school)
-                    if school_nfc in file_name_nfc and school not in growth_data:
-                        try:
-                            df = pd.read_csv(file_path, encoding="utf-8-sig")
-                            df.columns = [unicodedata.normalize("NFC", col.strip()) for col in df.columns]
-                            growth_data[school] = df
-                        except Exception as e:
-                            pass
+    return ingest.ColumnStore(analytics.STORE_DIR)
+
+
+def receives_live(data_dir: Path) -> bool:
+    # 수집 저장소는 파티션 구분이 없으므로 LIVE_PARTITION 하나에만 합침
+    return Path(data_dir).resolve() == analytics.partition_dir(analytics.DATA_DIR, LIVE_PARTITION)
+
+
+def live_version(data_dir: Path) -> int:
+    return live_store().version() if receives_live(data_dir) else 0
+
+
+@st.fragment(run_every=LIVE_POLL_SECONDS)
+def watch_live_store():
+    # 수집 서비스가 새 측정값을 반영하면 VERSION 이 바뀜 - 바뀐 경우에만 전체 rerun
+    version = live_store().version()
+    st.caption(f"📡 실시간 수집 · 저장소 버전 {version}")
+    quality = live_store().read_quality()
+    if quality:
+        with st.expander("📋 가져오기 품질"):
+            st.dataframe(pd.DataFrame.from_dict({school: {
+                "행": q["rows"], "반영": q["accepted"], "시각 오류": q["bad_time"],
+                "범위 이탈": sum(q["out_of_range"].values()), "순서 뒤바뀜": q["out_of_order"], "파일": len(q["files"]),
+            } for school, q in quality.items()}, orient="index"), width="stretch")
+    if version != st.session_state.get("store_version", version):
+        st.rerun()
+
+
+@st.cache_resource
+def precompute_worker() -> "warmup.PrecomputeWorker":
+    # 프로세스당 하나 - 첫 방문자 이전부터 스냅숏을 만들어 두고 데이터가 바뀌면 다시 만듦
+    import warmup
     
-    return growth_data
+    return warmup.PrecomputeWorker(analytics.DATA_DIR, PRECOMPUTE_INTERVAL, PARTITION_CACHE_SIZE).start()
 
 
-def get_column_safe(df: pd.DataFrame, keywords: list[str]) -> str | None:
-    for col in df.columns:
-        col_lower = col.lower()
-        for kw in keywords:
-            if kw in col_lower:
-                return col
-    return None
+def current_snapshot(data_dir: Path, bounds: tuple[str | None, str | None]) -> dict | None:
+    # 스냅숏은 CSV 원본 전체 기간 기준 - SQLite 모드나 실시간 측정값이 합쳐지는 경우에는 쓰지 않음
+    if PRECOMPUTE_INTERVAL <= 0 or SQLITE_PATH or bounds != (None, None) or live_version(data_dir) != 0:
+        return None
+    worker = precompute_worker()
+    worker.touch(data_dir)   # 최근에 본 파티션부터 스냅숏을 유지
+    return worker.get(data_dir)
+
+
+@st.cache_resource
+def start_metrics_exporter(port: int):
+    return profiling.start_http_exporter(port)
+
+
+@st.cache_resource
+def start_api_server(port: int):
+    # 같은 프로세스에서 띄우면 분석 코어의 메모이제이션(표준 프레임 등)을 대시보드와 공유
+    import api
+    return api.start_api_server(port)
 
 # ==============================================================================
-# 4. 메인 앱
+# 2. 메인 앱
 # ==============================================================================
-def main():
+def render_dashboard():
     # =========================================================================
     # 히어로 섹션
     # =========================================================================
-    st.markdown("""
+    st.markdown(f"""
     <div class="hero-container">
         <div class="hero-title">🌱 극지식물 최적 EC 농도 연구</div>
-        <div class="hero-subtitle">4개 학교 공동 실험 · 나도수영(Oxyria digyna) 생육 최적화 분석</div>
+        <div class="hero-subtitle">{len(analytics.school_institutions())}개 학교 공동 실험 · 나도수영(Oxyria digyna) 생육 최적화 분석</div>
     </div>
     """, unsafe_allow_html=True)
     
@@ -436,54 +341,100 @@ def main():
         st.markdown("## 🎛️ 컨트롤 패널")
         st.markdown("---")
         
-        school_options = ["전체"] + SCHOOL_NAMES_BY_EC
-        selected_school = st.selectbox("🏫 학교 선택", school_options)
+        # 실험 / 시즌 파티션이 여러 개면 선택한 파티션만 읽음 (SQLite 모드는 DB 하나가 데이터셋이라 선택 없음)
+        partitions = [] if SQLITE_PATH else list_partitions()
+        partition = partitions[0] if partitions else None
+        if len(partitions) > 1:
+            partition = st.selectbox("🗂️ 데이터셋", partitions, format_func=lambda p: p["label"], key="partition")
+        data_dir = analytics.partition_dir(analytics.DATA_DIR, partition["id"]) if partition else analytics.DATA_DIR
+        
+        school_options = ["전체"] + ([s for s in SCHOOL_NAMES_BY_EC if s in partition["schools"]]
+                                   if partition else SCHOOL_NAMES_BY_EC)
+        # 브라우저 필터 모드: 모든 학교를 한 번에 보내고 학교 전환 · 범례 · 기간 선택은 그래프 안에서 처리
+        client_filter = st.toggle("⚡ 브라우저 필터 모드", key="client_filter", value=CLIENT_FILTER_DEFAULT,
+                                  help="학교를 바꿔 볼 때 서버를 다시 실행하지 않고 브라우저에서 전환합니다")
+        if client_filter:
+            selected_school = "전체"
+            st.caption("학교 전환은 그래프 위 메뉴 · 범례에서 (서버 요청 없음)")
+        else:
+            selected_school = st.selectbox("🏫 학교 선택", school_options)
+        
+        # SQLite 모드: 기간 필터를 DB 조회 조건으로 내려보냄 (전체 기간을 메모리에 올리지 않음)
+        bounds = (None, None)
+        time_range = sql_aggregate("time_bounds") if SQLITE_PATH else None
+        if time_range:
+            picked = st.date_input("📅 기간", value=time_range, min_value=time_range[0], max_value=time_range[1],
+                                   key="date_range")
+            if len(picked) == 2:
+                import sqlstore
+                
+                bounds = sqlstore.date_range_bounds(*picked)
         
         st.markdown("---")
         st.markdown("### 🧪 EC 실험 조건")
         
-        for school in SCHOOL_NAMES_BY_EC:
-            info = SCHOOL_INFO[school]
-            if school == "하늘고":
-                st.markdown(f"""
-                <div class="ec-badge ec-2" style="display: block; text-align: center;">
-                    ⭐ {school} · EC {info['ec_target']}
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                ec_class = f"ec-{int(info['ec_target'])}"
-                st.markdown(f"""
-                <div class="ec-badge {ec_class}" style="display: block; text-align: center;">
-                    {info['emoji']} {school} · EC {info['ec_target']}
-                </div>
-                """, unsafe_allow_html=True)
+        # 실험군 수와 관계없이 배지 전체를 요소 하나로 전송
+        badges = "".join(
+            f'<div class="{school_badge_class(school)}" style="display: block; text-align: center;">'
+            f'{"⭐" if SCHOOL_INFO[school]["highlight"] else SCHOOL_INFO[school]["emoji"]} {school} · EC {SCHOOL_INFO[school]["ec_target"]}'
+            f'</div>'
+            for school in SCHOOL_NAMES_BY_EC
+        )
+        if len(SCHOOL_NAMES_BY_EC) > BADGE_EXPANDER_AFTER:
+            with st.expander(f"실험군 {len(SCHOOL_NAMES_BY_EC)}개"):
+                st.markdown(badges, unsafe_allow_html=True)
+        else:
+            st.markdown(badges, unsafe_allow_html=True)
         
         st.markdown("---")
         st.markdown("### 💡 핵심 질문")
         st.info("극지식물이 가장 잘 자라는 **최적 EC 농도**는?")
+        
+        st.markdown("---")
+        st.checkbox("🛠️ 성능 디버그 패널", key="debug_panel",
+                    value=os.environ.get("DASHBOARD_PROFILING") == "1")
+        
+        # 수집 서비스(ingest.py)가 저장소를 만든 경우, 실시간 측정값을 합치는 파티션에서만 주기적으로 확인
+        if analytics.STORE_DIR.exists() and receives_live(data_dir):
+            watch_live_store()
     
     # -------------------------------------------------------------------------
     # 데이터 로딩
     # -------------------------------------------------------------------------
-    with st.spinner(""):
-        env_data = load_environment_data()
-        growth_data = load_growth_data()
+    # 스냅숏은 rerun 시작 시 한 번만 가져오므로 중간에 교체되어도 이번 화면은 한 버전으로 그려짐
+    snapshot = current_snapshot(data_dir, bounds)
+    with st.spinner(""), profiling.section("load_data"):
+        if snapshot is not None:
+            st.session_state["store_version"] = 0
+            env_data, growth_data = snapshot["env_data"], snapshot["growth_data"]
+        else:
+            env_data = load_environment_data(data_dir, bounds)
+            growth_data = load_growth_data(data_dir)
+    # 실시간 수집 측정값이 합쳐진 경우에는 DB 집계에 빠지므로 메모리 집계를 사용
+    pushdown = bool(SQLITE_PATH) and st.session_state["store_version"] == 0
     
     if not env_data and not growth_data:
         st.error("❌ 데이터를 찾을 수 없습니다. `data/` 폴더를 확인해주세요.")
         return
     
     filtered_schools = SCHOOL_NAMES_BY_EC if selected_school == "전체" else [selected_school]
+    # 최적 실험군: 설정에서 highlight 로 표시한 항목, 없으면 평균 생중량이 가장 큰 실험군
+    optimum = analytics.optimal_school()
+    if optimum is None:
+        optimum = analytics.optimal_school(sql_aggregate("build_ec_weight_table") if pushdown
+                                           else derived(snapshot, "ec_weight", lambda: build_ec_weight_table(growth_data)))
+    optimum_ec = SCHOOL_INFO[optimum]["ec_target"] if optimum else "-"
+    optimum_label = f"EC {optimum_ec} ({optimum})" if optimum else "-"
     
     # -------------------------------------------------------------------------
     # 탭 구성
     # -------------------------------------------------------------------------
-    tab1, tab2, tab3 = st.tabs(["📖 연구 개요", "🌡️ 환경 분석", "📊 생육 결과"])
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📖 연구 개요", "🌡️ 환경 분석", "📊 생육 결과", "🔗 상관 분석", "🔬 개체 탐색"])
     
     # =========================================================================
     # TAB 1: 연구 개요
     # =========================================================================
-    with tab1:
+    with tab1, profiling.section("tab:overview"):
         st.markdown('<div class="section-title">🎯 연구 목적</div>', unsafe_allow_html=True)
         
         col1, col2 = st.columns([2, 1])
@@ -500,7 +451,7 @@ def main():
                 <br>
                 <p style="color: rgba(255,255,255,0.85); line-height: 1.8; font-size: 1.1rem;">
                     본 연구에서는 <strong style="color: #bf00ff;">EC(전기전도도)</strong> 농도가 식물 생육에 미치는 영향을 
-                    4개 학교 공동 실험을 통해 분석하고, <strong style="color: #00ff88;">최적의 양분 농도</strong>를 도출하고자 합니다.
+                    여러 학교 공동 실험을 통해 분석하고, <strong style="color: #00ff88;">최적의 양분 농도</strong>를 도출하고자 합니다.
                 </p>
             </div>
             """, unsafe_allow_html=True)
@@ -558,7 +509,24 @@ def main():
         # 학교별 실험 조건
         st.markdown('<div class="section-title">🏫 학교별 실험 조건</div>', unsafe_allow_html=True)
         
-        st.markdown("""
+        rows = []
+        for school in SCHOOL_NAMES_BY_EC:
+            info = SCHOOL_INFO[school]
+            if info["highlight"]:
+                row_style = f' style="background: {_rgba(info["color"], 0.1)};"'
+                ec_style = " color: #00ff88;"
+                note = f'<strong style="color: #00ff88;">{info["note"]}</strong>'
+            else:
+                row_style, ec_style, note = "", "", info["note"]
+            rows.append(f"""
+                    <tr{row_style}>
+                        <td style="text-align: center;"><span class="{school_badge_class(school)}">{info['emoji']} {school}</span></td>
+                        <td style="text-align: center; font-size: 1.3rem; font-weight: 700;{ec_style}">{info['ec_target']}</td>
+                        <td style="text-align: center;">{info['condition']}</td>
+                        <td style="text-align: center;">{note}</td>
+                    </tr>""")
+        
+        st.markdown(f"""
         <div class="glass-card">
             <table class="styled-table">
                 <thead>
@@ -569,31 +537,7 @@ def main():
                         <th style="text-align: center;">비고</th>
                     </tr>
                 </thead>
-                <tbody>
-                    <tr>
-                        <td style="text-align: center;"><span class="ec-badge ec-1">🔵 송도고</span></td>
-                        <td style="text-align: center; font-size: 1.3rem; font-weight: 700;">1.0</td>
-                        <td style="text-align: center;">저농도 · 고온(22~23°C)</td>
-                        <td style="text-align: center;">일반 재배 환경</td>
-                    </tr>
-                    <tr style="background: rgba(0, 184, 148, 0.1);">
-                        <td style="text-align: center;"><span class="ec-badge ec-2">🟢 하늘고</span></td>
-                        <td style="text-align: center; font-size: 1.3rem; font-weight: 700; color: #00ff88;">2.0</td>
-                        <td style="text-align: center;">적정농도 · 저온(14.7°C)</td>
-                        <td style="text-align: center;"><strong style="color: #00ff88;">⭐ 최적 조건</strong></td>
-                    </tr>
-                    <tr>
-                        <td style="text-align: center;"><span class="ec-badge ec-4">🔴 아라고</span></td>
-                        <td style="text-align: center; font-size: 1.3rem; font-weight: 700;">4.0</td>
-                        <td style="text-align: center;">고농도 · 고습도(66%)</td>
-                        <td style="text-align: center;">염류 스트레스 구간</td>
-                    </tr>
-                    <tr>
-                        <td style="text-align: center;"><span class="ec-badge ec-8">🟣 동산고</span></td>
-                        <td style="text-align: center; font-size: 1.3rem; font-weight: 700;">8.0</td>
-                        <td style="text-align: center;">초고농도</td>
-                        <td style="text-align: center;">극한 스트레스 구간</td>
-                    </tr>
+                <tbody>{"".join(rows)}
                 </tbody>
             </table>
         </div>
@@ -602,19 +546,11 @@ def main():
         # 주요 지표 카드
         st.markdown('<div class="section-title">📈 핵심 지표</div>', unsafe_allow_html=True)
         
-        total_count = sum(len(growth_data.get(s, pd.DataFrame())) for s in SCHOOL_NAMES)
-        
-        all_temps, all_humid = [], []
-        for school, df in env_data.items():
-            temp_col = get_column_safe(df, ["temp", "온도"])
-            humid_col = get_column_safe(df, ["humid", "습도"])
-            if temp_col:
-                all_temps.extend(df[temp_col].dropna().tolist())
-            if humid_col:
-                all_humid.extend(df[humid_col].dropna().tolist())
-        
-        avg_temp = sum(all_temps) / len(all_temps) if all_temps else 0
-        avg_humid = sum(all_humid) / len(all_humid) if all_humid else 0
+        overview = sql_aggregate("compute_overview_metrics", *bounds) if pushdown \
+            else derived(snapshot, "overview", lambda: compute_overview_metrics(env_data, growth_data))
+        total_count = overview["total_count"]
+        avg_temp = overview["avg_temp"]
+        avg_humid = overview["avg_humid"]
         
         col_m1, col_m2, col_m3, col_m4 = st.columns(4)
         
@@ -646,10 +582,10 @@ def main():
             """, unsafe_allow_html=True)
         
         with col_m4:
-            st.markdown("""
+            st.markdown(f"""
             <div class="metric-card" style="border: 2px solid rgba(0, 255, 136, 0.5);">
                 <div style="font-size: 2rem;">⭐</div>
-                <div class="metric-value" style="color: #00ff88;">2.0</div>
+                <div class="metric-value" style="color: #00ff88;">{optimum_ec}</div>
                 <div class="metric-label">최적 EC (dS/m)</div>
             </div>
             """, unsafe_allow_html=True)
@@ -660,11 +596,11 @@ def main():
         col_f1, col_f2 = st.columns(2)
         
         with col_f1:
-            st.markdown("""
+            st.markdown(f"""
             <div class="conclusion-card">
                 <h3 style="color: #00ff88; margin-bottom: 15px;">✅ 최적 조건 발견</h3>
                 <ul style="color: rgba(255,255,255,0.85); line-height: 2;">
-                    <li><strong>EC 2.0 dS/m</strong>에서 최고 생중량 기록</li>
+                    <li><strong>{optimum_label}</strong>에서 최고 생중량 기록</li>
                     <li>지상부와 지하부의 <strong>균형 잡힌 성장</strong></li>
                     <li>염류 스트레스 없이 안정적인 양분 흡수</li>
                 </ul>
@@ -686,169 +622,130 @@ def main():
     # =========================================================================
     # TAB 2: 환경 데이터
     # =========================================================================
-    with tab2:
+    with tab2, profiling.section("tab:environment"):
         st.markdown('<div class="section-title">🌡️ 환경 데이터 분석</div>', unsafe_allow_html=True)
         
         if not env_data:
             st.error("❌ 환경 데이터를 찾을 수 없습니다.")
         else:
             # 학교별 환경 평균 비교
-            env_summary = []
-            for school in SCHOOL_NAMES_BY_EC:
-                if school in env_data:
-                    df = env_data[school]
-                    temp_col = get_column_safe(df, ["temp", "온도"])
-                    humid_col = get_column_safe(df, ["humid", "습도"])
-                    ph_col = get_column_safe(df, ["ph"])
-                    ec_col = get_column_safe(df, ["ec"])
-                    
-                    env_summary.append({
-                        "학교": school,
-                        "EC": SCHOOL_INFO[school]["ec_target"],
-                        "평균 온도": df[temp_col].mean() if temp_col else 0,
-                        "평균 습도": df[humid_col].mean() if humid_col else 0,
-                        "평균 pH": df[ph_col].mean() if ph_col else 0,
-                        "실측 EC": df[ec_col].mean() if ec_col else 0,
-                        "목표 EC": SCHOOL_INFO[school]["ec_target"],
-                        "색상": SCHOOL_INFO[school]["color"]
-                    })
-            
-            env_summary_df = pd.DataFrame(env_summary)
+            env_summary_df = sql_aggregate("build_env_summary", *bounds) if pushdown \
+                else derived(snapshot, "env_summary", lambda: build_env_summary(env_data))
             
             if not env_summary_df.empty:
-                fig = make_subplots(
-                    rows=2, cols=2,
-                    subplot_titles=("🌡️ 평균 온도 (°C)", "💧 평균 습도 (%)", "🧪 평균 pH", "⚡ 목표 vs 실측 EC"),
-                    vertical_spacing=0.15,
-                    horizontal_spacing=0.1
-                )
-                
-                colors = [SCHOOL_INFO[s]["color"] for s in env_summary_df["학교"]]
-                
-                for i, (row, col, y_col) in enumerate([
-                    (1, 1, "평균 온도"),
-                    (1, 2, "평균 습도"),
-                    (2, 1, "평균 pH")
-                ]):
-                    fig.add_trace(
-                        go.Bar(x=env_summary_df["학교"], y=env_summary_df[y_col],
-                               marker_color=colors, showlegend=False,
-                               text=env_summary_df[y_col].round(1),
-                               textposition="outside",
-                               textfont=dict(color="white")),
-                        row=row, col=col
-                    )
-                
-                fig.add_trace(
-                    go.Bar(x=env_summary_df["학교"], y=env_summary_df["목표 EC"],
-                           name="목표 EC", marker_color="#667eea",
-                           text=env_summary_df["목표 EC"], textposition="outside"),
-                    row=2, col=2
-                )
-                fig.add_trace(
-                    go.Bar(x=env_summary_df["학교"], y=env_summary_df["실측 EC"],
-                           name="실측 EC", marker_color="#00b894",
-                           text=env_summary_df["실측 EC"].round(1), textposition="outside"),
-                    row=2, col=2
-                )
-                
-                fig.update_layout(
-                    height=650,
-                    font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    showlegend=True,
-                    legend=dict(
-                        orientation="h", yanchor="bottom", y=-0.12,
-                        xanchor="center", x=0.5,
-                        font=dict(color="white")
-                    )
-                )
-                
-                fig.update_xaxes(showgrid=False, color="rgba(255,255,255,0.7)")
-                fig.update_yaxes(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
-                
-                st.plotly_chart(fig, use_container_width=True)
+                fig = derived(snapshot, ("figure", "env_summary"),
+                              lambda: build_figure("build_env_summary_figure", env_summary_df))
+                render_chart("env_summary", fig)
             
             # 시계열 그래프
             st.markdown('<div class="section-title">📈 시계열 환경 변화</div>', unsafe_allow_html=True)
             
-            display_school = filtered_schools[0] if len(filtered_schools) == 1 else st.selectbox(
-                "학교 선택", SCHOOL_NAMES_BY_EC, key="ts_school"
-            )
+            # 브라우저 필터 모드: 학교 전환은 그래프 안의 메뉴로 하므로 학교 선택 위젯을 만들지 않음
+            display_school = None if client_filter else filtered_schools[0] if len(filtered_schools) == 1 \
+                else st.selectbox("학교 선택", SCHOOL_NAMES_BY_EC, key="ts_school")
             
-            if display_school in env_data:
-                df = env_data[display_school].copy()
-                time_col = get_column_safe(df, ["time", "시간", "날짜"])
-                temp_col = get_column_safe(df, ["temp", "온도"])
-                humid_col = get_column_safe(df, ["humid", "습도"])
-                ec_col = get_column_safe(df, ["ec"])
-                
-                if time_col:
-                    df[time_col] = pd.to_datetime(df[time_col], errors="coerce")
-                    df = df.sort_values(time_col)
+            if client_filter:
+                col1, col2 = st.columns(2)
+                for container, metric in ((col1, "temperature"), (col2, "humidity"), (st.container(), "ec")):
+                    with container:
+                        fig_bundle = derived(snapshot, ("figure", "timeseries_bundle", metric),
+                                             lambda: timeseries_bundle_figure(env_data, metric))
+                        if fig_bundle is not None:
+                            render_chart(f"timeseries_{metric}", fig_bundle)
+            elif display_school in env_data:
+                df = prepare_env_frame(env_data[display_school])
+                has_time = not df.empty
                 
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    if temp_col and time_col:
-                        fig_temp = px.line(df, x=time_col, y=temp_col)
-                        fig_temp.update_traces(line=dict(color="#ff6b6b", width=2))
-                        fig_temp.update_layout(
-                            title="🌡️ 온도 변화",
-                            font=dict(family="Malgun Gothic", color="white"),
-                            paper_bgcolor="rgba(0,0,0,0)",
-                            plot_bgcolor="rgba(0,0,0,0)",
-                            xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)"),
-                            yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
-                        )
-                        st.plotly_chart(fig_temp, use_container_width=True)
+                    if has_time and df["temperature"].notna().any():
+                        fig_temp = derived(snapshot, ("figure", "timeseries", display_school, "temperature"),
+                                           lambda: build_figure("build_timeseries_figure", df, "temperature", display_school))
+                        render_chart("timeseries_temperature", fig_temp)
                 
                 with col2:
-                    if humid_col and time_col:
-                        fig_humid = px.line(df, x=time_col, y=humid_col)
-                        fig_humid.update_traces(line=dict(color="#00d4ff", width=2))
-                        fig_humid.update_layout(
-                            title="💧 습도 변화",
-                            font=dict(family="Malgun Gothic", color="white"),
-                            paper_bgcolor="rgba(0,0,0,0)",
-                            plot_bgcolor="rgba(0,0,0,0)",
-                            xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)"),
-                            yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
-                        )
-                        st.plotly_chart(fig_humid, use_container_width=True)
+                    if has_time and df["humidity"].notna().any():
+                        fig_humid = derived(snapshot, ("figure", "timeseries", display_school, "humidity"),
+                                            lambda: build_figure("build_timeseries_figure", df, "humidity", display_school))
+                        render_chart("timeseries_humidity", fig_humid)
+                
+                if has_time and df["ec"].notna().any():
+                    fig_ec = derived(snapshot, ("figure", "timeseries", display_school, "ec"),
+                                     lambda: build_figure("build_timeseries_figure", df, "ec", display_school))
+                    render_chart("timeseries_ec", fig_ec)
+            
+            # 일주기 프로필 히트맵
+            st.markdown('<div class="section-title">🕒 일주기 프로필</div>', unsafe_allow_html=True)
+            
+            if client_filter or display_school in env_data:
+                col_p1, col_p2 = st.columns(2)
+                with col_p1:
+                    profile_metric = st.selectbox("측정 항목", list(ENV_METRICS), format_func=METRIC_LABELS.get,
+                                                  key="profile_metric")
+                with col_p2:
+                    profile_layout = st.radio("집계 축", PROFILE_LAYOUTS, horizontal=True, key="profile_layout")
+            
+            if client_filter:
+                fig_profile = derived(snapshot, ("figure", "profile_bundle", profile_metric, profile_layout),
+                                      lambda: profile_bundle_figure(env_data, profile_metric, profile_layout))
+                if fig_profile is None:
+                    st.warning("⚠️ 시간대별 프로필을 그릴 수 있는(시간 단위로 측정한) 학교가 없습니다.")
+                else:
+                    render_chart("profile", fig_profile)
+            elif display_school in env_data:
+                frame = prepare_env_frame(env_data[display_school])
                 
-                if ec_col and time_col:
-                    fig_ec = px.line(df, x=time_col, y=ec_col)
-                    fig_ec.update_traces(line=dict(color="#00ff88", width=2))
-                    fig_ec.add_hline(
-                        y=SCHOOL_INFO[display_school]["ec_target"],
-                        line_dash="dash", line_color="#bf00ff",
-                        annotation_text=f"목표 EC: {SCHOOL_INFO[display_school]['ec_target']}",
-                        annotation_font_color="white"
-                    )
-                    fig_ec.update_layout(
-                        title="⚡ EC 변화",
-                        font=dict(family="Malgun Gothic", color="white"),
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        plot_bgcolor="rgba(0,0,0,0)",
-                        xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)"),
-                        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)")
-                    )
-                    st.plotly_chart(fig_ec, use_container_width=True)
+                if frame.empty or frame["time"].dt.hour.nunique() < 2:
+                    st.warning(f"⚠️ {display_school}은(는) 일 단위로 측정되어 시간대별 프로필을 그릴 수 없습니다.")
+                else:
+                    def build_profile():
+                        profile_df = sql_aggregate("compute_profile_grid", display_school, profile_metric, profile_layout,
+                                                   *bounds) if pushdown \
+                            else compute_profile_grid(frame, profile_metric, profile_layout)
+                        return build_figure("build_profile_figure", profile_df, display_school, profile_metric, profile_layout)
+                    
+                    fig_profile = derived(snapshot, ("figure", "profile", display_school, profile_metric, profile_layout),
+                                          build_profile)
+                    render_chart("profile", fig_profile)
+            
+            # 누적 노출 지수
+            st.markdown('<div class="section-title">📈 누적 노출 지수</div>', unsafe_allow_html=True)
+            
+            def build_cumulative():
+                cumulative_by_school = {}
+                for school in filtered_schools:
+                    if school not in env_data:
+                        continue
+                    frame = prepare_env_frame(env_data[school])
+                    if frame.empty:
+                        continue
+                    cumulative_by_school[school] = get_cumulative_indices(school, frame, str(data_dir))
+                return build_figure("build_cumulative_figure", cumulative_by_school)
+            
+            fig_cum = derived(snapshot, ("figure", "cumulative", tuple(filtered_schools)), build_cumulative)
+            render_chart("cumulative", fig_cum)
+            
+            st.markdown(f"""
+            <div class="insight-box">
+                <strong style="color: #00ff88; font-size: 1.2rem;">📊 누적 지수란?</strong><br><br>
+                생육은 순간 측정값보다 <strong>누적된 노출량</strong>에 좌우됩니다.<br>
+                적산온도는 기준온도 <strong>{BASE_TEMP}°C</strong> 초과분, 포차는 포화수증기압 대비 부족분을 시간에 대해 적분한 값입니다.
+            </div>
+            """, unsafe_allow_html=True)
             
             with st.expander("📥 환경 데이터 다운로드"):
                 for school in filtered_schools:
                     if school in env_data:
                         st.markdown(f"**{school}**")
-                        st.dataframe(env_data[school], height=200)
-                        csv = env_data[school].to_csv(index=False).encode("utf-8-sig")
+                        st.dataframe(env_data[school], height=200, width="stretch")
+                        csv = derived(snapshot, ("export", "env_csv", school), lambda: export_env_csv(env_data[school]))
                         st.download_button(f"📥 {school} CSV", csv, f"{school}_환경.csv", "text/csv", key=f"env_{school}")
     
     # =========================================================================
     # TAB 3: 생육 결과
     # =========================================================================
-    with tab3:
+    with tab3, profiling.section("tab:growth"):
         st.markdown('<div class="section-title">📊 생육 결과 분석</div>', unsafe_allow_html=True)
         
         if not growth_data:
@@ -857,75 +754,16 @@ def main():
             # EC별 생중량 + 추세선
             st.markdown('<div class="section-title">🥇 EC 농도별 평균 생중량</div>', unsafe_allow_html=True)
             
-            ec_weight_data = []
-            for school in SCHOOL_NAMES_BY_EC:
-                if school in growth_data:
-                    df = growth_data[school]
-                    weight_col = get_column_safe(df, ["생중량", "weight", "중량"])
-                    if weight_col:
-                        ec_weight_data.append({
-                            "학교": school,
-                            "EC": SCHOOL_INFO[school]["ec_target"],
-                            "평균 생중량": df[weight_col].mean(),
-                            "색상": SCHOOL_INFO[school]["color"]
-                        })
+            ec_weight_df = sql_aggregate("build_ec_weight_table") if pushdown \
+                else derived(snapshot, "ec_weight", lambda: build_ec_weight_table(growth_data))
             
-            if ec_weight_data:
-                ec_weight_df = pd.DataFrame(ec_weight_data).sort_values("EC")
+            if not ec_weight_df.empty:
                 max_idx = ec_weight_df["평균 생중량"].idxmax()
                 
-                fig_main = go.Figure()
-                
-                colors = [SCHOOL_INFO[s]["color"] for s in ec_weight_df["학교"]]
-                
-                fig_main.add_trace(go.Bar(
-                    x=ec_weight_df["EC"],
-                    y=ec_weight_df["평균 생중량"],
-                    text=[f"{s}<br>{w:.1f}g" for s, w in zip(ec_weight_df["학교"], ec_weight_df["평균 생중량"])],
-                    textposition="outside",
-                    textfont=dict(color="white", size=12),
-                    marker=dict(
-                        color=colors,
-                        line=dict(color="rgba(255,255,255,0.3)", width=2)
-                    ),
-                    name="평균 생중량"
-                ))
-                
-                # 추세선
-                x_vals = ec_weight_df["EC"].values
-                y_vals = ec_weight_df["평균 생중량"].values
-                if len(x_vals) >= 3:
-                    z = np.polyfit(x_vals, y_vals, 2)
-                    p = np.poly1d(z)
-                    x_trend = np.linspace(x_vals.min(), x_vals.max(), 50)
-                    y_trend = p(x_trend)
-                    
-                    fig_main.add_trace(go.Scatter(
-                        x=x_trend, y=y_trend,
-                        mode="lines",
-                        name="추세선",
-                        line=dict(color="#ff6b6b", width=4, dash="dash")
-                    ))
-                
-                fig_main.add_vline(x=2.0, line_dash="dot", line_color="#00ff88", line_width=3,
-                                   annotation_text="⭐ 최적", annotation_font_color="#00ff88",
-                                   annotation_font_size=14)
-                
-                fig_main.update_layout(
-                    title=dict(text="EC 농도에 따른 평균 생중량 변화", font=dict(size=20, color="white")),
-                    xaxis_title="EC 농도 (dS/m)",
-                    yaxis_title="평균 생중량 (g)",
-                    font=dict(family="Malgun Gothic, Noto Sans KR", color="white"),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)", dtick=1),
-                    yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)"),
-                    height=500,
-                    showlegend=True,
-                    legend=dict(font=dict(color="white"))
-                )
-                
-                st.plotly_chart(fig_main, use_container_width=True)
+                fig_main = derived(snapshot, ("figure", "ec_weight"),
+                                   lambda: build_figure("build_ec_weight_figure", ec_weight_df,
+                                                        fit_weight_trend(ec_weight_df), optimum))
+                render_chart("ec_weight", fig_main)
                 
                 st.markdown(f"""
                 <div class="insight-box">
@@ -939,64 +777,13 @@ def main():
             # 지상부/지하부 누적 막대
             st.markdown('<div class="section-title">🌿 지상부 vs 지하부 길이 (T/R율)</div>', unsafe_allow_html=True)
             
-            length_data = []
-            for school in SCHOOL_NAMES_BY_EC:
-                if school in growth_data:
-                    df = growth_data[school]
-                    shoot_col = get_column_safe(df, ["지상부", "shoot"])
-                    root_col = get_column_safe(df, ["지하부", "root"])
-                    
-                    shoot_avg = df[shoot_col].mean() if shoot_col else 0
-                    root_avg = df[root_col].mean() if root_col else 0
-                    
-                    length_data.append({
-                        "학교": school,
-                        "EC": SCHOOL_INFO[school]["ec_target"],
-                        "지상부": shoot_avg,
-                        "지하부": root_avg,
-                        "T/R율": shoot_avg / root_avg if root_avg > 0 else 0
-                    })
+            length_df = sql_aggregate("build_length_table") if pushdown \
+                else derived(snapshot, "length", lambda: build_length_table(growth_data))
             
-            if length_data:
-                length_df = pd.DataFrame(length_data).sort_values("EC")
-                
-                fig_stack = go.Figure()
-                
-                fig_stack.add_trace(go.Bar(
-                    x=[f"EC {ec}" for ec in length_df["EC"]],
-                    y=length_df["지상부"],
-                    name="🌿 지상부 (잎)",
-                    marker_color="#00ff88",
-                    text=length_df["학교"],
-                    textposition="inside",
-                    textfont=dict(color="white")
-                ))
-                
-                fig_stack.add_trace(go.Bar(
-                    x=[f"EC {ec}" for ec in length_df["EC"]],
-                    y=length_df["지하부"],
-                    name="🟤 지하부 (뿌리)",
-                    marker_color="#c4a484",
-                    text=[f"{v:.0f}mm" for v in length_df["지하부"]],
-                    textposition="inside",
-                    textfont=dict(color="white")
-                ))
-                
-                fig_stack.update_layout(
-                    barmode="stack",
-                    title=dict(text="EC 농도에 따른 지상부/지하부 누적 비교", font=dict(size=20, color="white")),
-                    xaxis_title="EC 농도",
-                    yaxis_title="길이 (mm)",
-                    font=dict(family="Malgun Gothic", color="white"),
-                    paper_bgcolor="rgba(0,0,0,0)",
-                    plot_bgcolor="rgba(0,0,0,0)",
-                    xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)"),
-                    yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)"),
-                    height=500,
-                    legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="center", x=0.5, font=dict(color="white"))
-                )
+            if not length_df.empty:
                 
-                st.plotly_chart(fig_stack, use_container_width=True)
+                fig_stack = derived(snapshot, ("figure", "length"), lambda: build_figure("build_length_figure", length_df))
+                render_chart("length_stack", fig_stack)
                 
                 st.markdown("""
                 <div class="warning-box">
@@ -1010,39 +797,14 @@ def main():
             # 박스플롯
             st.markdown('<div class="section-title">📦 학교별 생중량 분포</div>', unsafe_allow_html=True)
             
-            all_growth = []
-            for school in SCHOOL_NAMES_BY_EC:
-                if school in growth_data:
-                    df = growth_data[school].copy()
-                    df["학교"] = school
-                    df["EC"] = SCHOOL_INFO[school]["ec_target"]
-                    all_growth.append(df)
+            def build_weight_box():
+                combined_df = build_growth_long(growth_data)
+                weight_col = get_column_safe(combined_df, ["생중량", "weight"]) if not combined_df.empty else None
+                return build_figure("build_weight_box_figure", combined_df, weight_col) if weight_col else None
             
-            if all_growth:
-                combined_df = pd.concat(all_growth, ignore_index=True)
-                weight_col = get_column_safe(combined_df, ["생중량", "weight"])
-                
-                if weight_col:
-                    combined_df = combined_df.sort_values("EC")
-                    combined_df["label"] = combined_df.apply(lambda x: f"{x['학교']}\n(EC {x['EC']})", axis=1)
-                    
-                    fig_box = px.box(
-                        combined_df, x="label", y=weight_col, color="학교",
-                        color_discrete_map={s: SCHOOL_INFO[s]["color"] for s in SCHOOL_NAMES}
-                    )
-                    
-                    fig_box.update_layout(
-                        title=dict(text="학교별 생중량 분포 (이상치 확인)", font=dict(size=20, color="white")),
-                        font=dict(family="Malgun Gothic", color="white"),
-                        paper_bgcolor="rgba(0,0,0,0)",
-                        plot_bgcolor="rgba(0,0,0,0)",
-                        xaxis=dict(showgrid=False, color="rgba(255,255,255,0.7)", title=""),
-                        yaxis=dict(showgrid=True, gridcolor="rgba(255,255,255,0.1)", color="rgba(255,255,255,0.7)", title="생중량 (g)"),
-                        showlegend=False,
-                        height=450
-                    )
-                    
-                    st.plotly_chart(fig_box, use_container_width=True)
+            fig_box = derived(snapshot, ("figure", "weight_box"), build_weight_box)
+            if fig_box is not None:
+                render_chart("weight_box", fig_box)
             
             # 최종 결론
             st.markdown('<div class="section-title">🎯 최종 결론</div>', unsafe_allow_html=True)
@@ -1050,7 +812,7 @@ def main():
             col_c1, col_c2 = st.columns(2)
             
             with col_c1:
-                st.markdown("""
+                st.markdown(f"""
                 <div class="conclusion-card">
                     <h2 style="color: #00ff88; margin-bottom: 20px;">✅ 최적 생육 조건</h2>
                     <div style="font-size: 3rem; text-align: center; margin: 20px 0;">
@@ -1059,7 +821,7 @@ def main():
                         </span>
                     </div>
                     <ul style="color: rgba(255,255,255,0.9); line-height: 2.2; font-size: 1.1rem;">
-                        <li><strong>EC 2.0 (하늘고)</strong>에서 최고 생중량</li>
+                        <li><strong>{optimum_label}</strong>에서 최고 생중량</li>
                         <li>지상부/지하부 <strong>균형 성장</strong></li>
                         <li>염류 스트레스 <strong>없음</strong></li>
                     </ul>
@@ -1098,18 +860,163 @@ def main():
                 for school in filtered_schools:
                     if school in growth_data:
                         st.markdown(f"**{school}** ({len(growth_data[school])}개체)")
-                        st.dataframe(growth_data[school], height=200)
+                        st.dataframe(growth_data[school], height=200, width="stretch")
                 
                 if growth_data:
-                    xlsx_buffer = io.BytesIO()
-                    with pd.ExcelWriter(xlsx_buffer, engine="openpyxl") as writer:
-                        for school in SCHOOL_NAMES_BY_EC:
-                            if school in growth_data:
-                                growth_data[school].to_excel(writer, sheet_name=school, index=False)
-                    xlsx_buffer.seek(0)
-                    
-                    st.download_button("📥 전체 XLSX 다운로드", xlsx_buffer, "생육결과.xlsx",
+                    st.download_button("📥 전체 XLSX 다운로드", derived(snapshot, ("export", "growth_xlsx"), lambda: growth_xlsx_bytes(growth_data)),
+                                       "생육결과.xlsx",
                                        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")
+    
+    # =========================================================================
+    # TAB 4: 환경-생육 상관 분석
+    # =========================================================================
+    with tab4, profiling.section("tab:correlation"):
+        st.markdown('<div class="section-title">🔗 환경 특성 × 생육 결과 상관관계</div>', unsafe_allow_html=True)
+        
+        if not env_data or not growth_data:
+            st.error("❌ 환경 데이터와 생육 결과 데이터가 모두 필요합니다.")
+        else:
+            feature_df = derived(snapshot, "features", lambda: build_feature_table(env_data, str(data_dir)))
+            outcome_df = derived(snapshot, "outcomes", lambda: build_growth_outcomes(growth_data))
+            corr_df = derived(snapshot, "correlation", lambda: build_feature_correlation(feature_df, outcome_df))
+            
+            if corr_df.empty:
+                st.warning("⚠️ 상관 분석에는 환경·생육 데이터가 모두 있는 학교가 3곳 이상 필요합니다.")
+            else:
+                fig_corr = derived(snapshot, ("figure", "correlation"), lambda: build_figure("build_correlation_figure", corr_df))
+                render_chart("correlation", fig_corr)
+                
+                st.markdown(f"""
+                <div class="insight-box">
+                    <strong style="color: #00ff88; font-size: 1.2rem;">📊 해석 시 주의</strong><br><br>
+                    상관계수는 학교 단위 요약값 <strong>{len(feature_df.index.intersection(outcome_df.index))}개</strong>로 계산되었습니다.<br>
+                    표본이 적으므로 <strong style="color: #00d4ff;">경향 파악용</strong>으로만 활용하세요.
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with st.expander("📋 학교별 환경 특성 테이블"):
+                st.dataframe(feature_df.join(outcome_df).round(3), width="stretch")
+    
+    # =========================================================================
+    # TAB 5: 개체별 탐색 (정렬 인덱스 기반 범위 필터 · 상위 k · 페이지 단위 전송)
+    # =========================================================================
+    with tab5, profiling.section("tab:plants"):
+        st.markdown('<div class="section-title">🔬 개체별 생육 탐색</div>', unsafe_allow_html=True)
+        
+        plant_index = derived(snapshot, "plant_index", lambda: analytics.build_plant_index(growth_data))
+        if len(plant_index) == 0:
+            st.error("❌ 생육 결과 데이터를 찾을 수 없습니다.")
+        else:
+            # 범위 필터 - 전체 범위 그대로인 속성은 조건에서 빠짐
+            ranges = {}
+            filter_cols = st.columns(len(PLANT_ATTRIBUTES))
+            for col, attr in zip(filter_cols, PLANT_ATTRIBUTES):
+                bounds_ = plant_index.bounds(attr)
+                if bounds_ is None or bounds_[0] == bounds_[1]:
+                    continue
+                with col:
+                    ranges[attr] = st.slider(attr, bounds_[0], bounds_[1], bounds_, key=f"plant_range_{attr}")
+            
+            col_o1, col_o2, col_o3, col_o4 = st.columns([2, 2, 1, 1])
+            with col_o1:
+                outlier_attr = st.selectbox("이상치만 보기 (학교별 IQR 기준)", [None, "전체"] + PLANT_ATTRIBUTES,
+                                            format_func=lambda a: "사용 안 함" if a is None else a, key="plant_outlier")
+            with col_o2:
+                sort_by = st.selectbox("정렬 기준", PLANT_ATTRIBUTES, key="plant_sort")
+            with col_o3:
+                descending = st.toggle("내림차순", value=True, key="plant_desc")
+            with col_o4:
+                page_size = st.selectbox("페이지 크기", PLANT_PAGE_SIZES, key="plant_page_size")
+            
+            mask = plant_index.select(ranges, filtered_schools, outlier_attr)
+            total = int(mask.sum())
+            
+            col_s1, col_s2, col_s3 = st.columns(3)
+            col_s1.metric("조건에 맞는 개체", f"{total:,}", f"전체 {len(plant_index):,}", delta_color="off")
+            col_s2.metric("이상치", f"{int((mask & plant_index.any_outlier).sum()):,}")
+            # 결측값은 건너뛰고, 선택된 개체에 유효한 값이 하나도 없으면 "-"
+            mean_value = plant_index.frame[sort_by][mask].mean() if total else np.nan
+            col_s3.metric(f"평균 {sort_by}", f"{mean_value:.2f}" if pd.notna(mean_value) else "-")
+            
+            if total:
+                # 산점도는 조건에 맞는 개체 전체 대신 최대 PLANT_SCATTER_MAX 개를 고르게 추려서 전송
+                scatter_ids = np.flatnonzero(mask)
+                if len(scatter_ids) > PLANT_SCATTER_MAX:
+                    scatter_ids = scatter_ids[np.linspace(0, len(scatter_ids) - 1, PLANT_SCATTER_MAX).astype(int)]
+                    st.caption(f"산점도는 {total:,}개 중 {PLANT_SCATTER_MAX:,}개를 고르게 표본 추출해 표시합니다.")
+                fig_plants = build_figure("build_plant_scatter_figure", plant_index.rows(scatter_ids))
+                render_chart("plant_scatter", fig_plants)
+                
+                col_t1, col_t2 = st.columns(2)
+                with col_t1:
+                    st.markdown(f"**🏆 {sort_by} 상위 {PLANT_TOP_K}**")
+                    st.dataframe(plant_index.top_k(mask, sort_by, PLANT_TOP_K, largest=True), hide_index=True, width="stretch")
+                with col_t2:
+                    st.markdown(f"**🔻 {sort_by} 하위 {PLANT_TOP_K}**")
+                    st.dataframe(plant_index.top_k(mask, sort_by, PLANT_TOP_K, largest=False), hide_index=True, width="stretch")
+                
+                # 서버에서 잘라 낸 한 페이지만 전송 (필터가 바뀌어 페이지 수가 줄면 마지막 페이지로)
+                pages = max(1, -(-total // page_size))
+                if st.session_state.get("plant_page", 1) > pages:
+                    st.session_state["plant_page"] = pages
+                page = st.number_input(f"페이지 (총 {pages:,})", min_value=1, max_value=pages, step=1, key="plant_page")
+                st.dataframe(plant_index.page(mask, sort_by, descending, int(page), page_size), hide_index=True, width="stretch")
+            else:
+                st.info("조건에 맞는 개체가 없습니다. 범위를 넓혀 보세요.")
+
+# ==============================================================================
+# 3. 성능 디버그 패널
+# ==============================================================================
+def render_debug_panel(run: dict):
+    with st.sidebar:
+        st.markdown("### 🛠️ 성능 디버그")
+        st.caption(f"이번 rerun: {run['total_s'] * 1000:.0f} ms (구간 시간은 하위 구간 포함)")
+        
+        sections_df = pd.DataFrame(
+            [(name, sec * 1000, calls) for name, (sec, calls) in run["sections"].items()],
+            columns=["구간", "ms", "호출"]
+        ).sort_values("ms", ascending=False)
+        st.dataframe(sections_df.round(1), hide_index=True, height=300, width="stretch")
+        
+        if run["cache"]:
+            cache_df = pd.DataFrame(
+                [(name, hits, misses) for name, (hits, misses) in run["cache"].items()],
+                columns=["캐시", "적중", "실패"]
+            )
+            st.dataframe(cache_df, hide_index=True, width="stretch")
+        
+        if run["payload"]:
+            payload_df = pd.DataFrame(list(run["payload"].items()), columns=["차트", "bytes"])
+            st.dataframe(payload_df.sort_values("bytes", ascending=False), hide_index=True, width="stretch")
+            st.caption(f"차트 전송량 합계: {sum(run['payload'].values()) / 1024:,.1f} KiB")
+        
+        st.download_button("📥 Prometheus 카운터", profiling.prometheus_text(), "dashboard_metrics.prom",
+                           "text/plain", key="metrics_download")
+
+
+def main():
+    setup_page()
+    
+    # DASHBOARD_METRICS_PORT: 로컬 스크레이퍼용 /metrics 엔드포인트
+    # DASHBOARD_METRICS_FILE: node_exporter textfile collector 용 .prom 파일 경로
+    if os.environ.get("DASHBOARD_METRICS_PORT"):
+        start_metrics_exporter(int(os.environ["DASHBOARD_METRICS_PORT"]))
+    # DASHBOARD_API_PORT: 다른 도구용 읽기 전용 JSON API (api.py)
+    if os.environ.get("DASHBOARD_API_PORT"):
+        start_api_server(int(os.environ["DASHBOARD_API_PORT"]))
+    # DASHBOARD_PRECOMPUTE: 백그라운드 사전 계산 주기(초) - 첫 방문자도 완성된 스냅숏을 읽음
+    if PRECOMPUTE_INTERVAL > 0:
+        precompute_worker()
+    
+    debug = st.session_state.get("debug_panel", os.environ.get("DASHBOARD_PROFILING") == "1")
+    profiling.start_run(track_payload=debug)
+    try:
+        render_dashboard()
+    finally:
+        run = profiling.finish_run(os.environ.get("DASHBOARD_METRICS_FILE"))
+    
+    if debug and run is not None:
+        render_debug_panel(run)
 
 # ==============================================================================
 # 실행
@@ -0,0 +1,230 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 실행 시간 계측 (표준 라이브러리만 사용)
+# 구간별 시간 · 캐시 적중/실패 · 차트별 전송 바이트를 rerun 단위와 누적 카운터로 기록
+# ==============================================================================
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+logger = logging.getLogger("dashboard.profiling")
+
+# 누적 카운터 (프로세스 전체, Prometheus 노출용)
+_lock = threading.Lock()
+_section_totals: dict[str, list] = {}   # 구간 -> [누적 초, 호출 수]
+_cache_totals: dict[str, list] = {}     # 캐시 -> [적중, 실패]
+_payload_totals: dict[str, list] = {}   # 차트 -> [누적 바이트, 렌더 수]
+_reruns = [0, 0.0]                      # [rerun 수, 누적 초]
+_textfile_lock = threading.Lock()       # 같은 프로세스의 세션 스레드가 동시에 지표 파일을 교체하지 않게 함
+
+# 현재 rerun 기록 (Streamlit 은 세션마다 별도 스레드에서 스크립트를 실행)
+_current_run: ContextVar[dict | None] = ContextVar("current_run", default=None)
+_miss_flag: ContextVar[list | None] = ContextVar("miss_flag", default=None)
+
+# ==============================================================================
+# 1. rerun 단위 기록
+# ==============================================================================
+def start_run(track_payload: bool = False) -> dict:
+    run = {
+        "started": time.time(),
+        "t0": time.perf_counter(),
+        "track_payload": track_payload,
+        "sections": {},
+        "cache": {},
+        "payload": {},
+    }
+    _current_run.set(run)
+    return run
+
+
+def finish_run(metrics_file: str | None = None) -> dict | None:
+    run = _current_run.get()
+    if run is None:
+        return None
+    run["total_s"] = time.perf_counter() - run["t0"]
+    _current_run.set(None)
+    with _lock:
+        _reruns[0] += 1
+        _reruns[1] += run["total_s"]
+
+    logger.info(json.dumps({
+        "event": "rerun",
+        "started": run["started"],
+        "total_ms": round(run["total_s"] * 1000, 2),
+        "sections_ms": {name: round(sec * 1000, 2) for name, (sec, _) in run["sections"].items()},
+        "cache": run["cache"],
+        "payload_bytes": run["payload"],
+    }, ensure_ascii=False))
+
+    if metrics_file:
+        # 지표 내보내기 실패가 페이지 렌더링을 깨뜨리지 않도록 기록만 남김
+        try:
+            write_textfile(metrics_file)
+        except Exception:
+            logger.exception("metrics textfile export failed: %s", metrics_file)
+    return run
+
+
+def payload_tracking() -> bool:
+    run = _current_run.get()
+    return bool(run and run["track_payload"])
+
+# ==============================================================================
+# 2. 계측 함수
+# ==============================================================================
+def _record_section(name: str, elapsed: float):
+    with _lock:
+        total = _section_totals.setdefault(name, [0.0, 0])
+        total[0] += elapsed
+        total[1] += 1
+    run = _current_run.get()
+    if run is not None:
+        entry = run["sections"].setdefault(name, [0.0, 0])
+        entry[0] += elapsed
+        entry[1] += 1
+
+
+@contextmanager
+def section(name: str):
+    t = time.perf_counter()
+    try:
+        yield
+    finally:
+        _record_section(name, time.perf_counter() - t)
+
+
+def timed(fn):
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        t = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _record_section(fn.__name__, time.perf_counter() - t)
+    return wrapper
+
+
+def mark_miss():
+    # 캐시된 함수 본문 안에서 호출 - 본문이 실행되었다는 것은 캐시 실패라는 뜻
+    flag = _miss_flag.get()
+    if flag is not None:
+        flag[0] = True
+
+
+def cached_call(name: str, fn, *args, **kwargs):
+    token = _miss_flag.set([False])
+    try:
+        result = fn(*args, **kwargs)
+        missed = _miss_flag.get()[0]
+    finally:
+        _miss_flag.reset(token)
+    record_cache(name, hit=not missed)
+    return result
+
+
+def record_cache(name: str, hit: bool):
+    slot = 0 if hit else 1
+    with _lock:
+        _cache_totals.setdefault(name, [0, 0])[slot] += 1
+    run = _current_run.get()
+    if run is not None:
+        run["cache"].setdefault(name, [0, 0])[slot] += 1
+
+
+def record_payload(name: str, n_bytes: int):
+    with _lock:
+        total = _payload_totals.setdefault(name, [0, 0])
+        total[0] += n_bytes
+        total[1] += 1
+    run = _current_run.get()
+    if run is not None:
+        run["payload"][name] = run["payload"].get(name, 0) + n_bytes
+
+# ==============================================================================
+# 3. Prometheus 텍스트 포맷 내보내기
+# ==============================================================================
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text() -> str:
+    with _lock:
+        sections = {k: list(v) for k, v in _section_totals.items()}
+        caches = {k: list(v) for k, v in _cache_totals.items()}
+        payloads = {k: list(v) for k, v in _payload_totals.items()}
+        reruns = list(_reruns)
+
+    lines = [
+        "# HELP dashboard_reruns_total Completed dashboard script reruns.",
+        "# TYPE dashboard_reruns_total counter",
+        f"dashboard_reruns_total {reruns[0]}",
+        "# HELP dashboard_rerun_seconds_total Wall time spent in dashboard reruns.",
+        "# TYPE dashboard_rerun_seconds_total counter",
+        f"dashboard_rerun_seconds_total {reruns[1]:.6f}",
+        "# HELP dashboard_section_seconds_total Wall time per instrumented section (inclusive).",
+        "# TYPE dashboard_section_seconds_total counter",
+    ]
+    lines += [f'dashboard_section_seconds_total{{section="{_label(k)}"}} {v[0]:.6f}' for k, v in sorted(sections.items())]
+    lines += ["# HELP dashboard_section_calls_total Calls per instrumented section.",
+              "# TYPE dashboard_section_calls_total counter"]
+    lines += [f'dashboard_section_calls_total{{section="{_label(k)}"}} {v[1]}' for k, v in sorted(sections.items())]
+    lines += ["# HELP dashboard_cache_hits_total Cache hits per cached loader or figure builder.",
+              "# TYPE dashboard_cache_hits_total counter"]
+    lines += [f'dashboard_cache_hits_total{{cache="{_label(k)}"}} {v[0]}' for k, v in sorted(caches.items())]
+    lines += ["# HELP dashboard_cache_misses_total Cache misses per cached loader or figure builder.",
+              "# TYPE dashboard_cache_misses_total counter"]
+    lines += [f'dashboard_cache_misses_total{{cache="{_label(k)}"}} {v[1]}' for k, v in sorted(caches.items())]
+    lines += ["# HELP dashboard_chart_payload_bytes_total Serialized figure bytes sent per chart.",
+              "# TYPE dashboard_chart_payload_bytes_total counter"]
+    lines += [f'dashboard_chart_payload_bytes_total{{chart="{_label(k)}"}} {v[0]}' for k, v in sorted(payloads.items())]
+    lines += ["# HELP dashboard_chart_renders_total Chart renders with payload tracking enabled.",
+              "# TYPE dashboard_chart_renders_total counter"]
+    lines += [f'dashboard_chart_renders_total{{chart="{_label(k)}"}} {v[1]}' for k, v in sorted(payloads.items())]
+    return "\n".join(lines) + "\n"
+
+
+def write_textfile(path: str):
+    # node_exporter textfile collector 형식 - 임시 파일에 쓴 뒤 교체해 반쯤 쓰인 파일을 읽지 않게 함
+    # 임시 파일 이름은 호출마다 고유하게 만들어 다른 프로세스와도 겹치지 않음
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    text = prometheus_text()
+    with _textfile_lock:
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=target.parent, prefix=target.name + ".",
+                                         suffix=".tmp", delete=False) as tmp:
+            tmp.write(text)
+        try:
+            os.replace(tmp.name, target)
+        except OSError:
+            os.unlink(tmp.name)
+            raise
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") not in ("", "/metrics"):
+            self.send_error(404)
+            return
+        body = prometheus_text().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_exporter(port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    threading.Thread(target=server.serve_forever, name="metrics-exporter", daemon=True).start()
+    return server
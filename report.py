@@ -0,0 +1,327 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 정적 리포트 생성 (오프라인 공유용 HTML 스냅숏)
+# 대시보드와 같은 figures.py 그래프를 섹션 단위로 프로세스 풀에서 병렬 렌더링하고,
+# 데이터 · 코드가 바뀌지 않은 섹션은 이전 실행 결과를 재사용
+#
+#   python report.py --out report                  # report/index.html + 학교별 report/<학교>.html
+#   python report.py --out report --images         # kaleido 가 있으면 PNG 도 함께 저장
+#   python report.py --out report --workers 4 --no-cache
+# ==============================================================================
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+import argparse
+import hashlib
+import html
+import importlib.util
+import os
+import time
+
+import pandas as pd
+
+import analytics
+from analytics import SCHOOL_INFO, SCHOOL_NAMES_BY_EC
+
+APP_DIR = Path(__file__).resolve().parent
+CACHE_DIR_NAME = ".sections"
+PLOTLY_JS = "plotly.min.js"
+# 섹션 렌더링 결과에 영향을 주는 코드 - 바뀌면 캐시 전체가 무효화됨
+CODE_FILES = ["report.py", "figures.py", "analytics.py", "schools.json"]
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<script src="{plotly_js}"></script>
+<style>
+body {{ background: #0e1117; color: #fafafa; font-family: "Malgun Gothic", "Noto Sans KR", sans-serif; margin: 0 auto; max-width: 1200px; padding: 24px; }}
+h1 {{ color: #00ff88; }} h2 {{ color: #00d4ff; border-bottom: 1px solid rgba(255,255,255,0.15); padding-bottom: 6px; }}
+nav a {{ color: #00d4ff; margin-right: 12px; }}
+table {{ border-collapse: collapse; margin: 12px 0; }} th, td {{ border: 1px solid rgba(255,255,255,0.15); padding: 6px 10px; text-align: right; }}
+.card {{ background: rgba(255,255,255,0.05); border-radius: 12px; padding: 16px 20px; margin: 12px 0; line-height: 1.8; }}
+.meta {{ color: rgba(255,255,255,0.5); font-size: 0.85rem; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<nav>{nav}</nav>
+<p class="meta">{meta}</p>
+{body}
+</body>
+</html>
+"""
+
+# ==============================================================================
+# 1. 섹션 렌더러 (작업 프로세스에서 실행)
+# ==============================================================================
+# 프로세스마다 데이터셋을 한 번만 읽음 (지문이 같으면 재사용)
+_dataset: dict = {}
+
+
+def _load(data_dir: str, fingerprint: str) -> tuple[dict, dict]:
+    if _dataset.get("key") != (data_dir, fingerprint):
+        analytics.register_dataset_schools(Path(data_dir))   # spawn 방식 프로세스는 부모의 레지스트리를 물려받지 않음
+        _dataset["key"] = (data_dir, fingerprint)
+        _dataset["env"] = analytics.load_environment_data(Path(data_dir))
+        _dataset["growth"] = analytics.load_growth_data(Path(data_dir))
+    return _dataset["env"], _dataset["growth"]
+
+
+def _cumulative(env_data: dict, schools: list[str]) -> dict[str, pd.DataFrame]:
+    cumulative = {}
+    for school in schools:
+        if school in env_data:
+            frame = analytics.prepare_env_frame(env_data[school])
+            if not frame.empty:
+                cumulative[school] = analytics.compute_cumulative_indices(frame)
+    return cumulative
+
+
+def _table(df: pd.DataFrame) -> str:
+    return df.to_html(index=False, float_format=lambda v: f"{v:,.2f}", border=0, escape=True)
+
+
+def section_env_summary(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    summary = analytics.build_env_summary(env_data)
+    return [] if summary.empty else [figures.build_env_summary_figure(summary)]
+
+
+def section_cumulative(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    cumulative = _cumulative(env_data, [school] if school else SCHOOL_NAMES_BY_EC)
+    return [figures.build_cumulative_figure(cumulative)] if cumulative else []
+
+
+def section_timeseries(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    if school not in env_data:
+        return []
+    frame = analytics.prepare_env_frame(env_data[school])
+    return [figures.build_timeseries_figure(frame, metric, school) for metric in figures.TIMESERIES_STYLES
+            if not frame.empty and frame[metric].notna().any()]
+
+
+def section_profile(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    if school not in env_data:
+        return []
+    frame = analytics.prepare_env_frame(env_data[school])
+    if frame.empty or frame["time"].dt.hour.nunique() < 2:
+        return []
+    layout = analytics.PROFILE_LAYOUTS[0]
+    return [figures.build_profile_figure(analytics.compute_profile_grid(frame, metric, layout), school, metric, layout)
+            for metric in ("temperature", "ec") if frame[metric].notna().any()]
+
+
+def section_ec_weight(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    table = analytics.build_ec_weight_table(growth_data)
+    return [] if table.empty else [figures.build_ec_weight_figure(
+        table, analytics.fit_weight_trend(table), analytics.optimal_school(table))]
+
+
+def section_length(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    table = analytics.build_length_table(growth_data)
+    return [] if table.empty else [figures.build_length_figure(table)]
+
+
+def section_weight_box(env_data: dict, growth_data: dict, school: str | None) -> list:
+    import figures
+    combined = analytics.build_growth_long(growth_data)
+    weight_col = analytics.get_column_safe(combined, ["생중량", "weight"]) if not combined.empty else None
+    return [figures.build_weight_box_figure(combined, weight_col)] if weight_col else []
+
+
+def section_growth_table(env_data: dict, growth_data: dict, school: str | None) -> list:
+    if school not in growth_data:
+        return []
+    outcomes = {}
+    for outcome, keywords in analytics.GROWTH_OUTCOMES.items():
+        col = analytics.get_column_safe(growth_data[school], keywords)
+        if col:
+            outcomes[outcome] = pd.to_numeric(growth_data[school][col], errors="coerce")
+    if not outcomes:
+        return []
+    stats = pd.DataFrame(outcomes).describe().T[["count", "mean", "std", "min", "50%", "max"]]
+    return [_table(stats.rename(columns={"count": "개체 수", "mean": "평균", "std": "표준편차", "min": "최소",
+                                         "50%": "중앙값", "max": "최대"}).reset_index(names="항목"))]
+
+
+def section_conclusions(env_data: dict, growth_data: dict, school: str | None) -> list:
+    # 대시보드의 결론 카드를 데이터에서 다시 계산 (최대 생중량 EC, 학교별 T/R율)
+    items = []
+    ec_weight = analytics.build_ec_weight_table(growth_data)
+    if not ec_weight.empty:
+        best = ec_weight.loc[ec_weight["평균 생중량"].idxmax()]
+        items.append(f"<li>최대 평균 생중량: <strong>EC {best['EC']} dS/m ({html.escape(best['학교'])})</strong>"
+                     f" · {best['평균 생중량']:.2f} g</li>")
+    length = analytics.build_length_table(growth_data)
+    for _, row in length.iterrows():
+        items.append(f"<li>{html.escape(row['학교'])} (EC {row['EC']}): 지상부 {row['지상부']:.1f} mm · "
+                     f"지하부 {row['지하부']:.1f} mm · T/R율 {row['T/R율']:.2f}</li>")
+    overview = analytics.compute_overview_metrics(env_data, growth_data)
+    items.append(f"<li>총 실험 개체 {overview['total_count']} · 평균 온도 {overview['avg_temp']:.1f}°C · "
+                 f"평균 습도 {overview['avg_humid']:.1f}%</li>")
+    return [f'<div class="card"><ul>{"".join(items)}</ul></div>']
+
+
+# 이름 -> (제목, 렌더러). 종합 리포트와 학교별 리포트에 들어갈 섹션 순서
+SECTIONS = {
+    "conclusions": ("🎯 핵심 결론", section_conclusions),
+    "env_summary": ("🌡️ 학교별 환경 평균", section_env_summary),
+    "cumulative": ("📈 누적 노출 지수", section_cumulative),
+    "timeseries": ("📈 시계열 환경 변화", section_timeseries),
+    "profile": ("🕒 일주기 프로필", section_profile),
+    "ec_weight": ("🥇 EC 농도별 평균 생중량", section_ec_weight),
+    "length": ("🌿 지상부 vs 지하부 길이 (T/R율)", section_length),
+    "weight_box": ("📦 학교별 생중량 분포", section_weight_box),
+    "growth_table": ("📋 생육 결과 요약", section_growth_table),
+}
+COMBINED_SECTIONS = ["conclusions", "env_summary", "cumulative", "ec_weight", "length", "weight_box"]
+SCHOOL_SECTIONS = ["timeseries", "profile", "cumulative", "growth_table"]
+
+
+def render_section(data_dir: str, fingerprint: str, name: str, school: str | None,
+                   image_dir: str | None) -> str:
+    env_data, growth_data = _load(data_dir, fingerprint)
+    title, renderer = SECTIONS[name]
+    parts = []
+    for i, part in enumerate(renderer(env_data, growth_data, school)):
+        if isinstance(part, str):
+            parts.append(part)
+            continue
+        # plotly.js 는 페이지마다 한 번만 별도 파일로 불러오므로 그래프 본문만 포함
+        parts.append(part.to_html(full_html=False, include_plotlyjs=False, config={"displaylogo": False}))
+        if image_dir:
+            part.write_image(Path(image_dir) / f"{name}-{school or '전체'}-{i}.png", scale=2)
+    if not parts:
+        return ""
+    return f'<section id="{name}"><h2>{title}</h2>\n' + "\n".join(parts) + "\n</section>"
+
+# ==============================================================================
+# 2. 섹션 캐시 · 병렬 실행
+# ==============================================================================
+def code_version() -> str:
+    digest = hashlib.blake2b(digest_size=8)
+    for name in CODE_FILES:
+        path = APP_DIR / name
+        if path.exists():
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def section_key(fingerprint: str, code: str, name: str, school: str | None, images: bool) -> str:
+    raw = f"{fingerprint}|{code}|{name}|{school or ''}|{int(images)}"
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=12).hexdigest()
+
+
+def images_available() -> bool:
+    return importlib.util.find_spec("kaleido") is not None
+
+
+def render_sections(data_dir: Path, tasks: list[tuple[str, str | None]], cache_dir: Path | None,
+                    image_dir: Path | None, workers: int | None) -> tuple[dict, dict]:
+    # (섹션, 학교) -> HTML. 캐시에 있는 섹션은 건너뛰고 나머지만 프로세스 풀에 분배
+    fingerprint = analytics.dataset_fingerprint(data_dir)
+    code = code_version()
+    results, pending = {}, {}
+    for task in tasks:
+        key = section_key(fingerprint, code, *task, image_dir is not None)
+        cached = cache_dir / f"{key}.html" if cache_dir else None
+        if cached is not None and cached.exists():
+            results[task] = cached.read_text(encoding="utf-8")
+        else:
+            pending[task] = cached
+
+    if pending:
+        args = (str(data_dir), fingerprint)
+        image_arg = str(image_dir) if image_dir else None
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {task: pool.submit(render_section, *args, *task, image_arg) for task in pending}
+            for task, future in futures.items():
+                results[task] = future.result()
+                if pending[task] is not None:
+                    pending[task].write_text(results[task], encoding="utf-8")
+
+    return results, {"sections": len(tasks), "rendered": len(pending), "cached": len(tasks) - len(pending)}
+
+# ==============================================================================
+# 3. 페이지 조립
+# ==============================================================================
+def _page_name(school: str | None) -> str:
+    return "index.html" if school is None else f"{school}.html"
+
+
+def write_pages(out_dir: Path, schools: list[str], sections: dict, fingerprint: str):
+    import plotly.offline
+
+    js_path = out_dir / PLOTLY_JS
+    if not js_path.exists():
+        js_path.write_text(plotly.offline.get_plotlyjs(), encoding="utf-8")
+
+    nav = " ".join([f'<a href="{_page_name(None)}">종합</a>'] +
+                   [f'<a href="{html.escape(_page_name(s))}">{SCHOOL_INFO[s]["emoji"]} {html.escape(s)}</a>'
+                    for s in schools])
+    meta = f"생성 {time.strftime('%Y-%m-%d %H:%M')} · 데이터 지문 {fingerprint[:12]}"
+    pages = {None: ("🌱 극지식물 최적 EC 농도 연구 - 종합 리포트", COMBINED_SECTIONS)}
+    for school in schools:
+        pages[school] = (f"{SCHOOL_INFO[school]['emoji']} {school} · EC {SCHOOL_INFO[school]['ec_target']} 리포트",
+                         SCHOOL_SECTIONS)
+
+    for school, (title, names) in pages.items():
+        body = "\n".join(sections[name, school] for name in names if sections.get((name, school)))
+        (out_dir / _page_name(school)).write_text(
+            PAGE_TEMPLATE.format(title=html.escape(title), plotly_js=PLOTLY_JS, nav=nav, meta=meta, body=body),
+            encoding="utf-8",
+        )
+
+
+def build_report(data_dir: Path, out_dir: Path, images: bool = False, workers: int | None = None,
+                 use_cache: bool = True) -> dict:
+    out_dir.mkdir(parents=True, exist_ok=True)
+    cache_dir = out_dir / CACHE_DIR_NAME if use_cache else None
+    if cache_dir:
+        cache_dir.mkdir(exist_ok=True)
+    image_dir = out_dir / "images" if images else None
+    if image_dir:
+        image_dir.mkdir(exist_ok=True)
+
+    env_files = analytics.discover_school_files(data_dir, "환경")
+    growth_files = analytics.discover_school_files(data_dir, "생육")
+    schools = [s for s in SCHOOL_NAMES_BY_EC if s in env_files or s in growth_files]
+    tasks = [(name, None) for name in COMBINED_SECTIONS] + \
+            [(name, school) for school in schools for name in SCHOOL_SECTIONS]
+
+    sections, stats = render_sections(data_dir, tasks, cache_dir, image_dir, workers)
+    write_pages(out_dir, schools, sections, analytics.dataset_fingerprint(data_dir))
+    stats["pages"] = 1 + len(schools)
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 정적 HTML 리포트 생성")
+    parser.add_argument("--data-dir", type=Path, default=analytics.DATA_DIR)
+    parser.add_argument("--out", type=Path, default=Path("report"))
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--images", action="store_true", help="PNG 도 저장 (kaleido 필요)")
+    parser.add_argument("--no-cache", action="store_true", help="섹션 캐시를 쓰지 않고 모두 다시 렌더링")
+    args = parser.parse_args()
+
+    analytics.register_dataset_schools(args.data_dir)
+
+    images = args.images
+    if images and not images_available():
+        print("⚠️ kaleido 가 없어 PNG 저장을 건너뜁니다 (pip install kaleido)")
+        images = False
+
+    t = time.perf_counter()
+    stats = build_report(args.data_dir, args.out, images, args.workers or os.cpu_count(), not args.no_cache)
+    print(f"{args.out}/index.html 외 {stats['pages'] - 1}개 학교 리포트 · 섹션 {stats['sections']}개 "
+          f"(렌더링 {stats['rendered']}, 캐시 {stats['cached']}) · {time.perf_counter() - t:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - SQLite 저장소 (선택 사항, 표준 라이브러리 sqlite3)
+# 환경 측정값(readings)과 개체별 생육 결과(plants)를 한 파일 DB 에 두고
+# 기간 · 학교 필터와 GROUP BY 집계를 DB 에서 수행해 필요한 행만 프로세스로 가져옴
+#
+#   python sqlstore.py import --data-dir data --db dashboard.sqlite
+#   DASHBOARD_SQLITE=dashboard.sqlite streamlit run main.py
+# ==============================================================================
+
+from pathlib import Path
+import argparse
+import datetime as dt
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+import analytics
+from analytics import SCHOOL_INFO, SCHOOL_NAMES_BY_EC, ENV_METRICS, GROWTH_OUTCOMES, WEEKDAY_LABELS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    school      TEXT NOT NULL,
+    time        TEXT NOT NULL,      -- 'YYYY-MM-DD HH:MM:SS' (문자열 비교 = 시간 비교)
+    temperature REAL,
+    humidity    REAL,
+    ph          REAL,
+    ec          REAL
+);
+CREATE INDEX IF NOT EXISTS readings_school_time ON readings (school, time);
+
+CREATE TABLE IF NOT EXISTS plants (
+    school   TEXT NOT NULL,
+    plant_no INTEGER,
+    leaves   REAL,
+    shoot    REAL,
+    root     REAL,
+    weight   REAL
+);
+CREATE INDEX IF NOT EXISTS plants_school ON plants (school, plant_no);
+"""
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# plants 컬럼 -> 원본 생육 CSV 표기 (대시보드 · 분석 코어의 키워드 검색과 호환)
+PLANT_COLUMNS = {
+    "plant_no": "개체번호",
+    "leaves": "잎 수(장)",
+    "shoot": "지상부 길이(mm)",
+    "root": "지하부 길이(mm)",
+    "weight": "생중량(g)",
+}
+PLANT_OUTCOMES = {"leaves": "잎 수", "shoot": "지상부 길이", "root": "지하부 길이", "weight": "생중량"}
+
+# ==============================================================================
+# 1. 연결 (스레드마다 하나 - Streamlit 세션은 스레드가 다름)
+# ==============================================================================
+_local = threading.local()
+
+
+def connect(db_path: str | Path) -> sqlite3.Connection:
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    key = str(db_path)
+    if key not in conns:
+        conn = sqlite3.connect(key)
+        conn.execute("PRAGMA journal_mode=WAL")      # 읽기와 쓰기가 서로 막지 않음
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        conns[key] = conn
+    return conns[key]
+
+
+def _where(schools: list[str] | None, start: str | None, end: str | None) -> tuple[str, list]:
+    clauses, params = [], []
+    if schools is not None:
+        clauses.append(f"school IN ({','.join('?' * len(schools))})")
+        params += schools
+    if start is not None:
+        clauses.append("time >= ?")
+        params.append(start)
+    if end is not None:
+        clauses.append("time < ?")
+        params.append(end)
+    return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+
+def date_range_bounds(start: dt.date | None, end: dt.date | None) -> tuple[str | None, str | None]:
+    # 날짜 선택(양끝 포함)을 time 비교용 반열린 구간 [start, end+1일) 로 변환
+    return (start.strftime(TIME_FORMAT) if start else None,
+            (end + dt.timedelta(days=1)).strftime(TIME_FORMAT) if end else None)
+
+# ==============================================================================
+# 2. CSV 가져오기
+# ==============================================================================
+def import_school_environment(conn: sqlite3.Connection, school: str, df: pd.DataFrame) -> int:
+    frame = analytics.prepare_env_frame(df)
+    rows = pd.DataFrame({"school": school, "time": frame["time"].dt.strftime(TIME_FORMAT)})
+    for metric in ENV_METRICS:
+        rows[metric] = frame[metric].astype(object).where(frame[metric].notna(), None)
+    conn.execute("DELETE FROM readings WHERE school = ?", (school,))
+    conn.executemany("INSERT INTO readings VALUES (?, ?, ?, ?, ?, ?)", rows.itertuples(index=False, name=None))
+    return len(rows)
+
+
+def import_school_growth(conn: sqlite3.Connection, school: str, df: pd.DataFrame) -> int:
+    rows = pd.DataFrame({"school": school}, index=df.index)
+    no_col = analytics.get_column_safe(df, ["개체", "no", "id"])
+    rows["plant_no"] = pd.to_numeric(df[no_col], errors="coerce") if no_col else np.arange(1, len(df) + 1)
+    for column, outcome in PLANT_OUTCOMES.items():
+        col = analytics.get_column_safe(df, GROWTH_OUTCOMES[outcome])
+        rows[column] = pd.to_numeric(df[col], errors="coerce") if col else np.nan
+    rows = rows.astype(object).where(rows.notna(), None)
+    conn.execute("DELETE FROM plants WHERE school = ?", (school,))
+    conn.executemany("INSERT INTO plants VALUES (?, ?, ?, ?, ?, ?)", rows.itertuples(index=False, name=None))
+    return len(rows)
+
+
+def import_csv(db_path: Path, data_dir: Path = analytics.DATA_DIR) -> dict[str, int]:
+    conn = connect(db_path)
+    counts = {"readings": 0, "plants": 0}
+    with conn:
+        for school, df in analytics.load_environment_data(data_dir).items():
+            counts["readings"] += import_school_environment(conn, school, df)
+        for school, df in analytics.load_growth_data(data_dir).items():
+            counts["plants"] += import_school_growth(conn, school, df)
+    conn.execute("ANALYZE")
+    return counts
+
+# ==============================================================================
+# 3. 필터 푸시다운 로더 (analytics 로더와 같은 모양의 학교별 DataFrame)
+# ==============================================================================
+def load_environment_data(db_path: Path, start: str | None = None, end: str | None = None,
+                          schools: list[str] | None = None) -> dict[str, pd.DataFrame]:
+    where, params = _where(schools, start, end)
+    df = pd.read_sql_query(f"SELECT school, time, {', '.join(ENV_METRICS)} FROM readings{where} ORDER BY school, time",
+                           connect(db_path), params=params)
+    return {school: group.drop(columns="school").reset_index(drop=True) for school, group in df.groupby("school", sort=False)}
+
+
+def load_growth_data(db_path: Path, schools: list[str] | None = None) -> dict[str, pd.DataFrame]:
+    where, params = _where(schools, None, None)
+    df = pd.read_sql_query(f"SELECT school, {', '.join(PLANT_COLUMNS)} FROM plants{where} ORDER BY school, rowid",
+                           connect(db_path), params=params)
+    df = df.rename(columns=PLANT_COLUMNS)
+    return {school: group.drop(columns="school").reset_index(drop=True) for school, group in df.groupby("school", sort=False)}
+
+
+def time_bounds(db_path: Path) -> tuple[dt.date, dt.date] | None:
+    row = connect(db_path).execute("SELECT MIN(time), MAX(time) FROM readings").fetchone()
+    if row[0] is None:
+        return None
+    return pd.Timestamp(row[0]).date(), pd.Timestamp(row[1]).date()
+
+# ==============================================================================
+# 4. GROUP BY 푸시다운 집계 (analytics 집계 함수와 같은 결과 형태)
+# ==============================================================================
+def build_env_summary(db_path: Path, start: str | None = None, end: str | None = None) -> pd.DataFrame:
+    where, params = _where(None, start, end)
+    agg = pd.read_sql_query(
+        f"SELECT school, AVG(temperature) AS t, AVG(humidity) AS h, AVG(ph) AS p, AVG(ec) AS e "
+        f"FROM readings{where} GROUP BY school", connect(db_path), params=params
+    ).set_index("school")
+    rows = []
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in agg.index:
+            r = agg.loc[school].fillna(0)
+            rows.append({"학교": school, "EC": SCHOOL_INFO[school]["ec_target"],
+                         "평균 온도": r["t"], "평균 습도": r["h"], "평균 pH": r["p"], "실측 EC": r["e"],
+                         "목표 EC": SCHOOL_INFO[school]["ec_target"], "색상": SCHOOL_INFO[school]["color"]})
+    return pd.DataFrame(rows)
+
+
+def compute_overview_metrics(db_path: Path, start: str | None = None, end: str | None = None) -> dict[str, float]:
+    conn = connect(db_path)
+    where, params = _where(None, start, end)
+    avg_temp, avg_humid = conn.execute(f"SELECT AVG(temperature), AVG(humidity) FROM readings{where}", params).fetchone()
+    total_count = conn.execute("SELECT COUNT(*) FROM plants").fetchone()[0]
+    return {"total_count": total_count, "avg_temp": avg_temp or 0, "avg_humid": avg_humid or 0}
+
+
+def _plant_averages(db_path: Path, columns: list[str]) -> pd.DataFrame:
+    select = ", ".join(f"AVG({c}) AS {c}" for c in columns)
+    return pd.read_sql_query(f"SELECT school, {select} FROM plants GROUP BY school",
+                             connect(db_path)).set_index("school")
+
+
+def build_ec_weight_table(db_path: Path) -> pd.DataFrame:
+    agg = _plant_averages(db_path, ["weight"]).dropna()
+    rows = [{"학교": s, "EC": SCHOOL_INFO[s]["ec_target"], "평균 생중량": agg.loc[s, "weight"],
+             "색상": SCHOOL_INFO[s]["color"]} for s in SCHOOL_NAMES_BY_EC if s in agg.index]
+    return pd.DataFrame(rows).sort_values("EC") if rows else pd.DataFrame()
+
+
+def build_length_table(db_path: Path) -> pd.DataFrame:
+    agg = _plant_averages(db_path, ["shoot", "root"]).fillna(0)
+    rows = []
+    for school in SCHOOL_NAMES_BY_EC:
+        if school in agg.index:
+            shoot_avg, root_avg = agg.loc[school, "shoot"], agg.loc[school, "root"]
+            rows.append({"학교": school, "EC": SCHOOL_INFO[school]["ec_target"], "지상부": shoot_avg, "지하부": root_avg,
+                         "T/R율": shoot_avg / root_avg if root_avg > 0 else 0})
+    return pd.DataFrame(rows).sort_values("EC") if rows else pd.DataFrame()
+
+
+def compute_profile_grid(db_path: Path, school: str, metric: str, layout: str,
+                         start: str | None = None, end: str | None = None) -> pd.DataFrame:
+    if metric not in ENV_METRICS:
+        raise ValueError(f"알 수 없는 지표: {metric}")
+    where, params = _where([school], start, end)
+    if layout == "시간 × 요일":
+        row_expr = "(CAST(strftime('%w', time) AS INTEGER) + 6) % 7"   # SQLite 는 일요일=0, 분석 코어는 월요일=0
+    else:
+        row_expr = "date(time)"
+    # 날짜 범위는 측정값 유무와 무관하게 전체 행 기준 (분석 코어와 같음) - AVG 가 NULL 을 건너뛰므로
+    # 값이 모두 NULL 인 칸은 NULL(NaN) 로 남음
+    cells = pd.read_sql_query(
+        f"SELECT {row_expr} AS row_key, CAST(strftime('%H', time) AS INTEGER) AS hour, AVG({metric}) AS value "
+        f"FROM readings{where} GROUP BY row_key, hour",
+        connect(db_path), params=params
+    )
+
+    if layout == "시간 × 요일":
+        index = range(7)
+        labels = WEEKDAY_LABELS
+    elif cells.empty:
+        index, labels = [], []
+    else:
+        days = pd.date_range(cells["row_key"].min(), cells["row_key"].max(), freq="D")
+        index = days.strftime("%Y-%m-%d").tolist()
+        labels = days.strftime("%m-%d").tolist()
+    grid = cells.pivot(index="row_key", columns="hour", values="value").reindex(index=index, columns=range(24))
+    grid.index = labels
+    return grid.astype(float)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CSV 데이터를 SQLite 저장소로 가져오기")
+    sub = parser.add_subparsers(dest="command", required=True)
+    p_import = sub.add_parser("import")
+    p_import.add_argument("--data-dir", type=Path, default=analytics.DATA_DIR)
+    p_import.add_argument("--db", type=Path, default=Path("dashboard.sqlite"))
+    args = parser.parse_args()
+
+    analytics.register_dataset_schools(args.data_dir)
+    counts = import_csv(args.db, args.data_dir)
+    print(f"{args.db}: readings {counts['readings']}행, plants {counts['plants']}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 콜드 스타트 측정 (import 시간 + 첫 렌더 시간)
+#
+#   python startup_report.py                 # main/analytics/figures import 시간, 무거운 패키지 순위
+#   python startup_report.py --first-run     # 새 인터프리터에서 첫 rerun(캐시 없음) 시간까지 측정
+# ==============================================================================
+
+from pathlib import Path
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+APP_DIR = Path(__file__).resolve().parent
+TARGETS = ["analytics", "figures", "main"]
+# 첫 화면에 필요 없어 지연 로드해야 하는 모듈 - main import 시점에 올라오면 경고
+# (plotly 코어는 streamlit 자체가 import 하므로 대상에서 제외)
+DEFERRED_MODULES = ["plotly.express", "openpyxl", "statsmodels", "figures", "ingest", "sqlstore", "warmup"]
+
+FIRST_RUN_SNIPPET = """
+import time
+from streamlit.testing.v1 import AppTest
+t = time.perf_counter()
+at = AppTest.from_file("main.py", default_timeout=300).run()
+print(time.perf_counter() - t)
+"""
+
+# ==============================================================================
+# 1. -X importtime 파싱
+# ==============================================================================
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    # "import time: self [us] | cumulative | imported package" -> (모듈, self, cumulative, 깊이)
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip(" "))) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def measure_import(target: str) -> tuple[float, list[tuple[str, int, int, int]]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    rows = parse_importtime(proc.stderr)
+    total = next((cum for name, _, cum, depth in reversed(rows) if name == target and depth == 0), 0)
+    return total / 1000, rows
+
+
+def loaded_modules(target: str) -> set[str]:
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import sys, {target}; print('\\n'.join(sys.modules))"],
+        cwd=APP_DIR, capture_output=True, text=True, check=True,
+    )
+    return set(proc.stdout.split())
+
+
+def measure_first_run() -> float:
+    proc = subprocess.run([sys.executable, "-c", FIRST_RUN_SNIPPET], cwd=APP_DIR,
+                          capture_output=True, text=True, check=True)
+    return float(proc.stdout.strip().splitlines()[-1]) * 1000
+
+# ==============================================================================
+# 2. 보고서
+# ==============================================================================
+def build_report(repeat: int = 3, top: int = 12, first_run: bool = False) -> dict:
+    report = {"imports_ms": {}, "heaviest": [], "deferred_loaded_at_import": []}
+
+    for target in TARGETS:
+        totals = []
+        for _ in range(repeat):
+            total, rows = measure_import(target)
+            totals.append(total)
+        report["imports_ms"][target] = statistics.median(totals)
+
+    # main import 기준 최상위 패키지(깊이 1)별 누적 시간
+    _, rows = measure_import("main")
+    top_level = [(name, cum / 1000) for name, _, cum, depth in rows if depth == 1]
+    report["heaviest"] = sorted(top_level, key=lambda x: x[1], reverse=True)[:top]
+
+    modules = loaded_modules("main")
+    report["deferred_loaded_at_import"] = [m for m in DEFERRED_MODULES if m in modules]
+
+    if first_run:
+        report["first_run_ms"] = measure_first_run()
+    return report
+
+
+def print_report(report: dict):
+    print("import 시간 (새 인터프리터, 중앙값)")
+    for target, ms in report["imports_ms"].items():
+        print(f"  {target:<12} {ms:8.1f} ms")
+
+    print("\nmain import 시 무거운 최상위 모듈")
+    for name, ms in report["heaviest"]:
+        print(f"  {name:<32} {ms:8.1f} ms")
+
+    if report["deferred_loaded_at_import"]:
+        print(f"\n⚠️ 지연 로드 대상이 import 시점에 로드됨: {', '.join(report['deferred_loaded_at_import'])}")
+    else:
+        print(f"\n✅ 지연 로드 대상({', '.join(DEFERRED_MODULES)})은 import 시점에 로드되지 않음")
+
+    if "first_run_ms" in report:
+        print(f"\n첫 rerun (콜드 캐시): {report['first_run_ms']:.0f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="콜드 스타트 import 시간 보고서")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--top", type=int, default=12)
+    parser.add_argument("--first-run", action="store_true", help="AppTest 로 첫 rerun 시간도 측정")
+    parser.add_argument("--json", type=Path, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    report = build_report(args.repeat, args.top, args.first_run)
+    print_report(report)
+    if args.json:
+        args.json.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    return 1 if report["deferred_loaded_at_import"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
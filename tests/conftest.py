@@ -0,0 +1,5 @@
+# 저장소 루트의 모듈(analytics, ingest, api ...)을 그대로 import 하도록 경로 추가
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
@@ -0,0 +1,124 @@
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+from urllib.error import HTTPError
+from urllib.parse import quote
+from urllib.request import Request, urlopen
+import gzip
+import json
+import threading
+
+import pytest
+
+import analytics
+import api
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+SCHOOL = "아라고"
+
+
+def serve(cache) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), api.make_handler(cache))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = serve(api.DatasetCache(DATA_DIR))
+    yield f"http://127.0.0.1:{server.server_port}{api.API_PREFIX}"
+    server.shutdown()
+    server.server_close()
+
+
+def get(url: str, headers: dict | None = None) -> tuple[int, dict, bytes]:
+    try:
+        with urlopen(Request(url, headers=headers or {}), timeout=30) as resp:
+            return resp.status, dict(resp.headers), resp.read()
+    except HTTPError as e:
+        return e.code, dict(e.headers), e.read()
+
+
+def get_json(url: str) -> tuple[int, dict]:
+    status, _, body = get(url)
+    return status, json.loads(body)
+
+
+def test_paging_covers_whole_range(base_url):
+    url = f"{base_url}/timeseries/{quote(SCHOOL)}?metric=ec,temperature&start=2025-05-26&end=2025-05-28"
+    status, first = get_json(url + "&limit=10")
+    assert status == 200
+    items, cursor = list(first["items"]), first["next_cursor"]
+    while cursor is not None:
+        _, page = get_json(f"{url}&limit=10&cursor={cursor}")
+        items += page["items"]
+        cursor = page["next_cursor"]
+    assert len(items) == first["total"] > 10
+    times = [item["time"] for item in items]
+    assert times == sorted(times)
+    assert set(items[0]) == {"time", "ec", "temperature"}
+
+
+def test_etag_and_not_modified(base_url):
+    status, headers, body = get(f"{base_url}/env-summary", {"Accept-Encoding": "gzip"})
+    assert status == 200 and headers["ETag"].startswith('W/"')
+    payload = gzip.decompress(body) if headers.get("Content-Encoding") == "gzip" else body
+    assert json.loads(payload)["items"]
+    status, _, body = get(f"{base_url}/env-summary", {"If-None-Match": headers["ETag"]})
+    assert status == 304 and body == b""
+
+
+def test_not_modified_skips_building():
+    class CountingCache(api.DatasetCache):
+        snapshots = 0
+
+        def snapshot(self, fingerprint=None):
+            CountingCache.snapshots += 1
+            return super().snapshot(fingerprint)
+
+    server = serve(CountingCache(DATA_DIR))
+    url = f"http://127.0.0.1:{server.server_port}{api.API_PREFIX}/ec-weight"
+    try:
+        status, headers, _ = get(url)
+        assert status == 200 and CountingCache.snapshots == 1
+        status, _, _ = get(url, {"If-None-Match": headers["ETag"]})
+        assert status == 304 and CountingCache.snapshots == 1
+        assert get(f"http://127.0.0.1:{server.server_port}{api.API_PREFIX}/nothing",
+                   {"If-None-Match": headers["ETag"]})[0] == 404
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_timezone_aware_bounds(base_url):
+    url = f"{base_url}/timeseries/{quote(SCHOOL)}?metric=ec&limit=1"
+    status, aware = get_json(url + "&start=2025-05-26T00:00:00Z")
+    assert status == 200
+    _, naive = get_json(url + "&start=2025-05-26T09:00:00")   # 같은 순간의 현지 시각
+    assert aware["total"] == naive["total"] > 0
+
+
+@pytest.mark.parametrize("query, status", [
+    ("metric=co2", 400), ("limit=0", 400), ("start=not-a-date", 400),
+])
+def test_bad_queries(base_url, query, status):
+    code, payload = get_json(f"{base_url}/timeseries/{quote(SCHOOL)}?{query}")
+    assert code == status and "error" in payload
+
+
+def test_unknown_school_and_path(base_url):
+    assert get_json(f"{base_url}/timeseries/{quote('없는학교')}")[0] == 404
+    assert get_json(f"{base_url}/nothing")[0] == 404
+
+
+def test_unexpected_error_returns_json_500():
+    class BrokenCache(api.DatasetCache):
+        def snapshot(self, fingerprint=None):
+            raise RuntimeError("boom")
+
+    server = serve(BrokenCache(DATA_DIR))
+    try:
+        status, payload = get_json(f"http://127.0.0.1:{server.server_port}{api.API_PREFIX}/schools")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert status == 500 and "error" in payload
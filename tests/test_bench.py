@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+import analytics
+import bench
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    schools = bench.generate_dataset(tmp_path, n_schools=6, env_rows=200, growth_rows=30)
+    analytics.register_dataset_schools(tmp_path)
+    yield tmp_path, schools
+    analytics.load_school_registry()
+    analytics.clear_caches()
+
+
+def test_generated_files_match_the_real_formats(dataset):
+    data_dir, schools = dataset
+    assert list(schools)[:4] == analytics.SCHOOL_NAMES[:4] and "합성005고" in analytics.SCHOOL_INFO
+    env = pd.read_csv(data_dir / "합성005고_환경데이터.csv", encoding="utf-8-sig")
+    assert list(env.columns) == ["time", "temperature", "humidity", "ph", "ec"]
+    assert env["time"].iloc[0] == "2025-05-01 5:00:00"            # 원본 로거처럼 시는 0 채움 없음
+    growth = pd.read_csv(data_dir / "합성005고_생육결과데이터.csv", encoding="utf-8-sig")
+    assert list(growth.columns) == bench.GROWTH_COLUMNS and len(growth) == 30
+
+
+def test_pipeline_times_every_stage(dataset):
+    data_dir, schools = dataset
+    result = bench.run_benchmark(data_dir, repeat=1)
+    assert set(result["stages"]) == set(bench.STAGES)
+    assert all(stage["median_s"] >= 0 for stage in result["stages"].values())
+    assert result["stats"]["schools"] == len(schools) and result["stats"]["env_rows"] == 200 * len(schools)
+
+
+def test_compare_flags_only_slower_stages():
+    baseline = {"stages": {stage: {"median_s": 1.0} for stage in bench.STAGES if stage != "frame_parsing"}}
+    current = {"stages": {stage: {"median_s": 1.0} for stage in bench.STAGES}}
+    current["stages"]["parse"]["median_s"] = 2.0
+    current["stages"]["export"]["median_s"] = 0.5
+    assert bench.compare_results(baseline, current) == ["parse"]     # 이전 결과에 없는 단계는 비교하지 않음
@@ -0,0 +1,57 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+
+
+def env_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "time": pd.date_range("2025-05-01", periods=rows, freq="10min"),
+        "temperature": rng.uniform(10, 30, rows),
+        "humidity": rng.uniform(40, 90, rows),
+        "ph": rng.uniform(5.5, 7.0, rows),
+        "ec": rng.uniform(0.5, 3.0, rows),
+    })
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    analytics.clear_caches()
+    yield
+    analytics.clear_caches()
+
+
+def test_incremental_matches_full_recompute():
+    frame = env_frame(500, seed=1)
+    analytics.get_cumulative_indices("학교", frame.iloc[:300].reset_index(drop=True))
+    extended = analytics.get_cumulative_indices("학교", frame)
+    full = analytics.compute_cumulative_indices(frame)
+    pd.testing.assert_frame_equal(extended, full, check_exact=False, rtol=1e-9)
+
+
+def test_same_shape_different_content_is_recomputed():
+    first = env_frame(200, seed=1)
+    second = env_frame(200, seed=2)   # 행 수와 마지막 시각이 같고 값만 다름
+    analytics.get_cumulative_indices("학교", first)
+    result = analytics.get_cumulative_indices("학교", second)
+    pd.testing.assert_frame_equal(result, analytics.compute_cumulative_indices(second))
+
+
+def test_changed_prefix_is_not_extended():
+    frame = env_frame(300, seed=3)
+    analytics.get_cumulative_indices("학교", frame.iloc[:200].reset_index(drop=True))
+    edited = frame.copy()
+    edited.loc[10, "temperature"] += 5.0
+    result = analytics.get_cumulative_indices("학교", edited)
+    pd.testing.assert_frame_equal(result, analytics.compute_cumulative_indices(edited))
+
+
+def test_scopes_are_isolated():
+    a = env_frame(100, seed=4)
+    b = env_frame(150, seed=5)
+    analytics.get_cumulative_indices("학교", a, scope="season-a")
+    analytics.get_cumulative_indices("학교", b, scope="season-b")
+    again = analytics.get_cumulative_indices("학교", a, scope="season-a")
+    pd.testing.assert_frame_equal(again, analytics.compute_cumulative_indices(a))
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    analytics.clear_caches()
+    yield
+    analytics.clear_caches()
+
+
+def env_frame(ec: list[float], ph: list[float], hours: list[float]) -> pd.DataFrame:
+    times = pd.Timestamp("2025-05-26") + pd.to_timedelta(hours, unit="h")
+    return pd.DataFrame({"time": times.strftime("%Y-%m-%d %H:%M:%S"), "temperature": 20.0, "humidity": 60.0,
+                         "ph": ph, "ec": ec})
+
+
+def test_band_and_excursion_ratios_are_time_weighted():
+    # 각 측정값은 다음 측정까지의 시간을 대표 (마지막 값은 간격 중앙값)
+    hours = np.array([0.0, 1.0, 2.0, 12.0])
+    ec = np.array([2.0, 2.0, 5.0, np.nan])
+    features = analytics.compute_metric_features("ec", hours, ec, 2.0)
+    # 유효한 측정값 0h, 1h, 2h -> 가중치 1, 1, 1(중앙값) 중 목표 구간은 앞의 두 개
+    assert features["EC 목표구간 비율"] == pytest.approx(2 / 3)
+
+    ph = np.array([6.0, 7.5, 6.0, 6.0])
+    features = analytics.compute_metric_features("ph", hours, ph, 2.0)
+    weights = np.array([1.0, 1.0, 10.0, 1.0])
+    assert features["pH 이탈 비율"] == pytest.approx(1.0 / weights.sum())
+    assert features["pH 평균"] == pytest.approx(ph.mean())
+
+
+def test_adding_a_school_computes_only_new_features(monkeypatch):
+    env = {"송도고": env_frame([1.0, 1.1, 0.9], [6.0, 6.1, 6.2], [0, 1, 2])}
+    first = analytics.build_feature_table(env)
+
+    calls = []
+    original = analytics.sample_weights
+    monkeypatch.setattr(analytics, "sample_weights", lambda hours: calls.append(1) or original(hours))
+    env["아라고"] = env_frame([4.0, 4.2, 3.9], [6.5, 6.9, 7.0], [0, 1, 2])
+    second = analytics.build_feature_table(env)
+    assert len(calls) == len(analytics.ENV_METRICS)            # 새 학교의 지표만 계산
+    pd.testing.assert_series_equal(second.loc["송도고"], first.loc["송도고"], check_names=False)
+
+
+def test_correlation_drops_constant_features():
+    env = {school: env_frame([ec, ec * 1.1, ec * 0.9], [6.0, 6.0, 6.0], [0, 1, 2])
+           for school, ec in [("송도고", 1.0), ("하늘고", 2.0), ("아라고", 4.0)]}
+    growth = {school: pd.DataFrame({"생중량(g)": [w, w + 1]})
+              for school, w in [("송도고", 3.0), ("하늘고", 5.0), ("아라고", 2.0)]}
+    corr = analytics.build_feature_correlation(analytics.build_feature_table(env),
+                                               analytics.build_growth_outcomes(growth))
+    assert list(corr.columns) == ["평균 생중량"]
+    assert "EC 평균" in corr.index and "온도 평균" not in corr.index   # 학교 간 같은 온도는 제외
+    assert corr.abs().le(1.0 + 1e-12).all().all()
@@ -0,0 +1,66 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+import figures
+
+
+def env_frame(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({"time": pd.date_range("2025-05-01", periods=rows, freq="min"),
+                         "ec": np.linspace(1.0, 2.0, rows)})
+
+
+def test_small_bundles_keep_rangeslider():
+    fig = figures.build_timeseries_bundle_figure({"아라고": figures.timeseries_trace_bundle(env_frame(500), "ec", "아라고")},
+                                                 "ec")
+    assert {trace.type for trace in fig.data} == {"scatter"}
+    assert fig.layout.xaxis.rangeslider.visible
+
+
+def test_large_bundles_drop_rangeslider():
+    bundles = {
+        "아라고": figures.timeseries_trace_bundle(env_frame(500), "ec", "아라고"),
+        "하늘고": figures.timeseries_trace_bundle(env_frame(figures.WEBGL_MIN_POINTS + 1), "ec", "하늘고"),
+    }
+    fig = figures.build_timeseries_bundle_figure(bundles, "ec")
+    assert "scattergl" in {trace.type for trace in fig.data}
+    assert not fig.layout.xaxis.rangeslider.visible
+    assert fig.layout.xaxis.rangeselector.buttons
+
+
+@pytest.fixture
+def registry(tmp_path):
+    def load(schools):
+        path = tmp_path / "schools.json"
+        path.write_text(json.dumps({"schools": schools}, ensure_ascii=False), encoding="utf-8")
+        analytics.load_school_registry(path)
+
+    yield load
+    analytics.load_school_registry()
+
+
+def weight_table(weights: dict[str, float]) -> pd.DataFrame:
+    return analytics.build_ec_weight_table({school: pd.DataFrame({"생중량(g)": [w]}) for school, w in weights.items()})
+
+
+def test_optimum_follows_registry_highlight(registry):
+    registry([{"name": "가", "ec_target": 0.5}, {"name": "나", "ec_target": 3.0, "highlight": True},
+              {"name": "다", "ec_target": 6.0}])
+    table = weight_table({"가": 9.0, "나": 4.0, "다": 1.0})
+    assert analytics.optimal_school(table) == "나"        # 생중량 최대값보다 설정의 highlight 가 우선
+
+    fig = figures.build_ec_weight_figure(table, analytics.fit_weight_trend(table), analytics.optimal_school(table))
+    (line,) = fig.layout.shapes
+    assert line.x0 == line.x1 == 3.0
+    assert "나" in fig.layout.annotations[0].text
+
+
+def test_optimum_falls_back_to_heaviest(registry):
+    registry([{"name": "가", "ec_target": 0.5}, {"name": "나", "ec_target": 3.0}])
+    assert analytics.optimal_school() is None
+    table = weight_table({"가": 9.0, "나": 4.0})
+    assert analytics.optimal_school(table) == "가"
+    assert not figures.build_ec_weight_figure(table, None, None).layout.shapes
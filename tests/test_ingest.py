@@ -0,0 +1,214 @@
+import asyncio
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import ingest
+from ingest import ColumnStore, IngestWriter, READING_COLUMNS
+
+SCHOOL = "아라고"
+
+
+def readings(start: str, rows: int, step: str = "1min", seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "time": pd.date_range(start, periods=rows, freq=step),
+        "temperature": rng.uniform(15, 25, rows),
+        "humidity": rng.uniform(50, 80, rows),
+        "ph": rng.uniform(5.8, 6.8, rows),
+        "ec": rng.uniform(1.0, 2.5, rows),
+    })
+
+
+def test_out_of_range_nulls_only_that_field():
+    frame = pd.DataFrame({
+        "time": ["2025-05-26 10:00", "2025-05-26 10:01", "not a time", "2025-05-26 10:03"],
+        "temperature": [20.0, 999.0, 21.0, 999.0],
+        "humidity": [60.0, 61.0, 62.0, np.nan],
+        "ph": [6.0, 6.1, 6.2, 99.0],
+        "ec": [1.5, 1.6, 1.7, np.nan],
+    })
+    accepted, stats = ingest.inspect_readings(frame)
+    assert len(accepted) == 2
+    assert np.isnan(accepted.loc[1, "temperature"])
+    assert accepted.loc[1, "humidity"] == 61.0
+    assert stats["bad_time"] == 1
+    assert stats["all_missing"] == 1           # 범위 이탈을 지우고 나면 남는 값이 없는 행
+    assert stats["out_of_range"]["temperature"] == 2 and stats["out_of_range"]["ph"] == 1
+
+
+def test_validate_requires_time_and_limits_batch():
+    with pytest.raises(ingest.IngestError) as e:
+        ingest.validate_readings(pd.DataFrame({"ec": [1.0]}))
+    assert e.value.status == 400
+    with pytest.raises(ingest.IngestError) as e:
+        ingest.validate_readings(readings("2025-05-26", ingest.MAX_BATCH_ROWS + 1))
+    assert e.value.status == 413
+
+
+def test_wal_replay_after_crash(tmp_path):
+    store = ColumnStore(tmp_path)
+    writer = IngestWriter(store)
+    batches = [(1, SCHOOL, readings("2025-05-26", 30, seed=1)), (2, SCHOOL, readings("2025-05-26 01:00", 30, seed=2))]
+    writer._append_wal(batches)                # 세그먼트 반영 전에 중단된 상황
+
+    recovered = IngestWriter(ColumnStore(tmp_path))
+    assert recovered.recover() == 2
+    assert not recovered.wal_path.exists()
+    assert recovered.store.version() == 2
+    stored = ColumnStore(tmp_path).read_school(SCHOOL)
+    expected = pd.concat([f for _, _, f in batches], ignore_index=True)
+    np.testing.assert_allclose(stored[READING_COLUMNS].to_numpy(), expected[READING_COLUMNS].to_numpy())
+    assert IngestWriter(ColumnStore(tmp_path)).recover() == 0   # 이미 반영된 묶음은 다시 적용하지 않음
+
+
+def test_load_is_idempotent(tmp_path):
+    source = tmp_path / f"{SCHOOL}_환경데이터.csv"
+    readings("2025-05-26", 500, seed=3).to_csv(source, index=False)
+    store = ColumnStore(tmp_path / "store")
+
+    first = ingest.load_file(store, source, SCHOOL, chunk_rows=128)
+    assert first["accepted"] == 500 and len(first["files"]) == 1
+    assert ingest.load_file(store, source, SCHOOL, chunk_rows=128) is None
+    copy = tmp_path / "copy.csv"
+    copy.write_bytes(source.read_bytes())
+    assert ingest.load_file(store, copy, SCHOOL) is None   # 이름만 다른 사본
+    assert len(ColumnStore(store.root).read_school(SCHOOL)) == 500
+
+    readings("2025-05-27", 10, seed=4).to_csv(source, index=False)
+    with pytest.raises(RuntimeError):
+        ingest.load_file(store, source, SCHOOL)
+
+
+@pytest.mark.parametrize("target", ["write_segment", "_write_quality", "set_version"])
+def test_load_resumes_after_mid_file_failure(tmp_path, monkeypatch, target):
+    source = tmp_path / f"{SCHOOL}.csv"
+    raw = readings("2025-05-26", 500, seed=6)
+    raw.to_csv(source, index=False)
+    store = ColumnStore(tmp_path / "store")
+
+    owner = ingest if target == "_write_quality" else ColumnStore
+    original = getattr(owner, target)
+    calls = []
+
+    def failing(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 3:
+            raise OSError("디스크 오류")
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(owner, target, failing)
+    with pytest.raises(OSError):
+        ingest.load_file(store, source, SCHOOL, chunk_rows=128)
+    monkeypatch.setattr(owner, target, original)
+
+    quality = ingest.load_file(ColumnStore(store.root), source, SCHOOL, chunk_rows=100)   # 청크 크기를 바꿔 다시 실행
+    assert quality["accepted"] == quality["rows"] == 500
+    assert "loading" not in quality and len(quality["files"]) == 1
+    reader = ColumnStore(store.root)
+    stored = reader.read_school(SCHOOL)
+    np.testing.assert_allclose(stored[READING_COLUMNS].to_numpy(), raw[READING_COLUMNS].to_numpy())
+    expected = raw.groupby(raw["time"].dt.floor("h"))[READING_COLUMNS].mean()
+    np.testing.assert_allclose(reader.read_rollup(SCHOOL)[READING_COLUMNS].to_numpy(), expected.to_numpy())
+    assert not list((store.root / "_rollups").glob("*.pending"))
+
+
+def test_rollup_means_match_raw(tmp_path):
+    source = tmp_path / f"{SCHOOL}.csv"
+    raw = readings("2025-05-26", 600, seed=5)
+    raw.loc[::7, "temperature"] = 999.0        # 범위 이탈 칸만 빠지고 나머지 측정값은 평균에 남음
+    raw.to_csv(source, index=False)
+    store = ColumnStore(tmp_path / "store")
+    ingest.load_file(store, source, SCHOOL, chunk_rows=100)
+
+    means = store.read_rollup(SCHOOL).set_index("time")
+    clean = raw.mask(raw == 999.0)
+    expected = clean.groupby(clean["time"].dt.floor("h"))[READING_COLUMNS].mean()
+    np.testing.assert_allclose(means[READING_COLUMNS].to_numpy(), expected.to_numpy())
+
+
+def test_read_recent_is_bounded(tmp_path):
+    store = ColumnStore(tmp_path)
+    writer = IngestWriter(store)
+    for seq in range(1, 11):
+        writer.commit([(seq, SCHOOL, readings(f"2025-05-26 {seq:02d}:00", 60, seed=seq))])
+
+    reader = ColumnStore(tmp_path)
+    live = reader.read_recent(tail_rows=120)[SCHOOL]
+    raw = live[live["time"] >= pd.Timestamp("2025-05-26 09:00")]
+    assert len(raw) == 120                      # 최근 두 세그먼트만 원본 해상도
+    older = live[live["time"] < pd.Timestamp("2025-05-26 09:00")]
+    assert len(older) == 8                      # 그 이전은 시간별 평균 한 행씩
+    assert len(reader._segments) == 2
+
+
+
+@pytest.mark.parametrize("body", [
+    b"42", b'"text"', b"null", b"true",
+    b'{"readings": 5}', b'{"other": []}', b"[1, 2, 3]", b'{"readings": [1, {"time": "2025-05-26"}]}',
+    b'{"readings": {"time": "2025-05-26", "ec": 1.0}}', b'{"readings": {"time": ["a", "b"], "ec": [1.0]}}',
+    b"{not json",
+])
+def test_parse_body_rejects_malformed_json(body):
+    with pytest.raises(ingest.IngestError) as e:
+        ingest.parse_body(body, "application/json")
+    assert e.value.status == 400
+
+
+def test_parse_body_accepts_rows_and_columns():
+    rows = {"readings": [{"time": "2025-05-26 10:00", "ec": 1.2}, {"time": "2025-05-26 10:01", "ec": 1.3}]}
+    columns = {"readings": {"time": ["2025-05-26 10:00", "2025-05-26 10:01"], "ec": [1.2, 1.3]}}
+    for payload in (rows, columns, rows["readings"]):
+        assert len(ingest.parse_body(json.dumps(payload).encode(), "application/json")) == 2
+    assert len(ingest.parse_body(b"time,ec\n2025-05-26 10:00,1.2\n", "text/csv")) == 1
+    with pytest.raises(ingest.IngestError):
+        ingest.parse_body(b"", "text/csv")
+
+
+def test_scalar_body_answers_400_over_http(tmp_path):
+    async def scenario():
+        writer = IngestWriter(ColumnStore(tmp_path))
+        with pytest.raises(ingest.IngestError) as e:
+            await ingest.handle_request(writer, "POST", f"/ingest/{SCHOOL}", {"content-type": "application/json"}, b"42")
+        return e.value.status
+
+    assert asyncio.run(scenario()) == 400
+
+
+def test_failed_commit_is_not_replayed(tmp_path, monkeypatch):
+    store = ColumnStore(tmp_path)
+    writer = IngestWriter(store)
+    writer.commit([(1, SCHOOL, readings("2025-05-26", 30, seed=7))])
+
+    def broken(*args, **kwargs):
+        raise OSError("디스크 오류")
+
+    monkeypatch.setattr(store, "set_version", broken)
+    with pytest.raises(OSError):
+        writer.commit([(2, SCHOOL, readings("2025-05-26 01:00", 30, seed=8)), (3, "하늘고", readings("2025-05-26", 5))])
+    monkeypatch.undo()
+
+    assert IngestWriter(ColumnStore(tmp_path)).recover() == 0     # 500 으로 응답한 묶음은 다시 적용하지 않음
+    reader = ColumnStore(tmp_path)
+    assert reader.version() == 1
+    assert len(reader.read_school(SCHOOL)) == 30 and reader.read_school("하늘고").empty
+
+
+@pytest.mark.parametrize("length", [b"abc", b"-5", b"1.5"])
+def test_bad_content_length_answers_400(tmp_path, length):
+    async def scenario():
+        server = await asyncio.start_server(ingest.make_connection_handler(IngestWriter(ColumnStore(tmp_path))),
+                                            "127.0.0.1", 0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", server.sockets[0].getsockname()[1])
+        writer.write(b"POST /ingest/x HTTP/1.1\r\nContent-Length: " + length + b"\r\n\r\n")
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        server.close()
+        await server.wait_closed()
+        return response
+
+    response = asyncio.run(scenario())
+    assert response.startswith(b"HTTP/1.1 400 ") and b"Content-Length" in response
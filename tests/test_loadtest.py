@@ -0,0 +1,45 @@
+import threading
+
+import pytest
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+from streamlit.testing.v1 import app_test, local_script_runner
+
+import analytics
+import loadtest
+
+
+def test_percentiles_pick_nearest_rank():
+    report = loadtest._percentiles([0.001 * i for i in range(1, 101)])
+    assert report["p50"] == pytest.approx(51.0) and report["p99"] == pytest.approx(99.0)
+    assert report["max"] == pytest.approx(100.0) and report["mean"] == pytest.approx(50.5)
+    assert loadtest._percentiles([]) == {}
+
+
+def test_script_covers_widgets_in_order():
+    actions = [name for name, _ in loadtest.scripted_interactions(analytics.SCHOOL_NAMES_BY_EC, analytics.PROFILE_LAYOUTS)]
+    assert actions[0] == f"ts_school={analytics.SCHOOL_NAMES_BY_EC[1]}"
+    assert "profile_metric=ec" in actions and "profile_layout" in actions
+    assert actions[-1] == "school=전체"
+
+
+def test_concurrent_sessions_replay_without_errors(monkeypatch):
+    monkeypatch.chdir(loadtest.APP_PATH.parent)
+    # run_level 과 같이 세션들이 ScriptCache 하나를 공유 (동시 ast.parse 회피)
+    shared = ScriptCache()
+    monkeypatch.setattr(app_test, "ScriptCache", lambda: shared)
+    monkeypatch.setattr(local_script_runner, "ScriptCache", lambda: shared)
+    steps = loadtest.scripted_interactions(analytics.SCHOOL_NAMES_BY_EC, analytics.PROFILE_LAYOUTS)[:2]
+    barrier = threading.Barrier(2)
+    results = [None, None]
+
+    def worker(i):
+        results[i] = loadtest.run_session(barrier, steps, timeout=120)
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(2)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    for samples in results:
+        assert [s["action"] for s in samples] == ["initial"] + [name for name, _ in steps]
+        assert not any(s["error"] for s in samples)
@@ -0,0 +1,52 @@
+import json
+import shutil
+from pathlib import Path
+
+
+import analytics
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def add_partition(root: Path, name: str) -> Path:
+    target = root / name
+    target.mkdir(parents=True)
+    for source in DATA_DIR.glob("아라고_*.csv"):
+        shutil.copy(source, target / source.name)
+    return target
+
+
+def test_current_manifest_skips_the_scan(tmp_path, monkeypatch):
+    add_partition(tmp_path, "2024")
+    written = analytics.write_manifest(tmp_path)
+
+    def no_scan(*args, **kwargs):
+        raise AssertionError("색인이 최신인데 디렉터리를 다시 훑음")
+
+    monkeypatch.setattr(analytics, "discover_partitions", no_scan)
+    assert analytics.load_manifest(tmp_path) == written
+
+
+def test_stale_manifest_is_rewritten(tmp_path):
+    first = add_partition(tmp_path, "2024")
+    analytics.write_manifest(tmp_path)
+
+    add_partition(tmp_path, "2025")
+    assert [p["id"] for p in analytics.load_manifest(tmp_path)] == ["2024", "2025"]
+    saved = json.loads((tmp_path / analytics.MANIFEST_FILE).read_text(encoding="utf-8"))
+    assert [p["id"] for p in saved["partitions"]] == ["2024", "2025"]
+
+    before = {p["id"]: p["fingerprint"] for p in saved["partitions"]}
+    env_file = next(first.glob("*환경*"))
+    env_file.write_text(env_file.read_text(encoding="utf-8-sig") + "\n", encoding="utf-8-sig")
+    after = {p["id"]: p["fingerprint"] for p in analytics.load_manifest(tmp_path)}
+    assert after["2024"] != before["2024"] and after["2025"] == before["2025"]
+
+    shutil.rmtree(first)
+    assert [p["id"] for p in analytics.load_manifest(tmp_path)] == ["2025"]
+
+
+def test_old_manifest_without_stats_is_refreshed(tmp_path):
+    add_partition(tmp_path, "2024")
+    (tmp_path / analytics.MANIFEST_FILE).write_text(json.dumps({"version": 1, "partitions": []}), encoding="utf-8")
+    assert [p["id"] for p in analytics.load_manifest(tmp_path)] == ["2024"]
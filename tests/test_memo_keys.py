@@ -0,0 +1,76 @@
+import os
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+
+SCHOOL = "아라고"
+
+
+def write_env_csv(path, rows, offset=0.0):
+    pd.DataFrame({
+        "time": pd.date_range("2025-05-26", periods=rows, freq="h").strftime("%Y-%m-%d %H:%M:%S"),
+        "temperature": np.linspace(15, 25, rows) + offset,
+        "humidity": np.linspace(50, 70, rows),
+        "ph": np.full(rows, 6.2),
+        "ec": np.linspace(1.0, 2.0, rows),
+    }).to_csv(path, index=False)
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    analytics.clear_caches()
+    yield
+    analytics.clear_caches()
+
+
+def no_hashing(*args, **kwargs):
+    raise AssertionError("원본 식별자가 있는 프레임을 내용 해시함")
+
+
+def test_loaded_frames_hit_without_hashing(tmp_path, monkeypatch):
+    write_env_csv(tmp_path / f"{SCHOOL}_환경데이터.csv", 48)
+    raw = analytics.load_environment_data(tmp_path)[SCHOOL]
+    first = analytics.prepare_env_frame(raw)
+
+    monkeypatch.setattr(analytics, "frame_fingerprint", no_hashing)
+    monkeypatch.setattr(analytics, "_prefix_fingerprints", no_hashing)
+    copy = pickle.loads(pickle.dumps(raw))           # st.cache_data 가 돌려주는 사본과 같은 상황
+    assert analytics.prepare_env_frame(copy) is first
+    cumulative = analytics.get_cumulative_indices(SCHOOL, first)
+    assert analytics.get_cumulative_indices(SCHOOL, analytics.prepare_env_frame(copy)) is cumulative
+    analytics.build_feature_table({SCHOOL: copy})
+
+
+def test_changed_file_invalidates(tmp_path):
+    path = tmp_path / f"{SCHOOL}_환경데이터.csv"
+    write_env_csv(path, 48)
+    before = analytics.prepare_env_frame(analytics.load_environment_data(tmp_path)[SCHOOL])
+    total_before = analytics.get_cumulative_indices(SCHOOL, before).iloc[-1, 1]
+
+    write_env_csv(path, 48, offset=3.0)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    after = analytics.prepare_env_frame(analytics.load_environment_data(tmp_path)[SCHOOL])
+    assert after is not before
+    assert after["temperature"].iloc[0] == pytest.approx(before["temperature"].iloc[0] + 3.0)
+    assert analytics.get_cumulative_indices(SCHOOL, after).iloc[-1, 1] > total_before
+
+
+def test_filtered_and_merged_frames_get_their_own_keys(tmp_path):
+    write_env_csv(tmp_path / f"{SCHOOL}_환경데이터.csv", 48)
+    raw = analytics.load_environment_data(tmp_path)[SCHOOL]
+    head = raw.iloc[:24]
+    assert analytics.frame_key(head) != analytics.frame_key(raw)
+    assert len(analytics.prepare_env_frame(head)) == 24
+
+    assert analytics.source_token(head) is None
+    halves = pd.concat([raw.iloc[:24], raw.iloc[:24]], ignore_index=True)   # 행 수까지 같지만 내용은 다른 프레임
+    assert analytics.frame_key(halves) != analytics.frame_key(raw)
+
+    merged = pd.concat([raw, raw.iloc[:1]], ignore_index=True)    # 실시간 병합처럼 행이 합쳐진 프레임
+    assert analytics.frame_key(merged) == analytics.frame_fingerprint(merged)
+    assert len(analytics.prepare_env_frame(merged)) == 49
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+import analytics
+
+
+def test_concurrent_memoize_stays_bounded(monkeypatch):
+    monkeypatch.setattr(analytics, "_MEMO_SIZE", 8)
+    analytics.clear_caches()
+
+    def work(i: int):
+        key = ("test", i % 32)
+        return analytics._memoize(key, lambda: i % 32)
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(work, range(20_000)))
+    assert results == [i % 32 for i in range(20_000)]
+    assert len(analytics._memo) <= 8
+    analytics.clear_caches()
+
+
+def test_memo_evicts_by_size(monkeypatch):
+    monkeypatch.setattr(analytics, "_MEMO_BYTES", 3 * 8 * 10_000)
+    analytics.clear_caches()
+    for i in range(10):
+        analytics._memoize(("frame", i), lambda: pd.DataFrame({"x": np.zeros(10_000)}))
+    assert len(analytics._memo) <= 3
+    assert analytics._memo_bytes <= 3 * 8 * 10_000
+    assert ("frame", 9) in analytics._memo
+    analytics.clear_caches()
+    assert analytics._memo_bytes == 0
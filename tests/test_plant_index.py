@@ -0,0 +1,78 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+from analytics import PLANT_ATTRIBUTES, PlantIndex, SCHOOL_NAMES_BY_EC
+
+
+def growth_frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "개체번호": np.arange(1, rows + 1),
+        "생중량(g)": rng.gamma(2.0, 5.0, rows),
+        "잎 수(장)": rng.integers(2, 12, rows).astype(float),
+        "지상부 길이(mm)": rng.normal(80, 20, rows),
+        "지하부 길이(mm)": rng.normal(60, 15, rows),
+    })
+    df.loc[rng.choice(rows, rows // 10, replace=False), "생중량(g)"] = np.nan
+    return df
+
+
+@pytest.fixture(scope="module")
+def index() -> PlantIndex:
+    growth = {school: growth_frame(300, seed) for seed, school in enumerate(SCHOOL_NAMES_BY_EC[:3])}
+    return PlantIndex(growth)
+
+
+def test_empty_index():
+    empty = PlantIndex({})
+    assert len(empty) == 0
+    assert empty.bounds("생중량") is None
+    mask = empty.select({"생중량": (0.0, 1.0)}, list(SCHOOL_NAMES_BY_EC), "전체")
+    assert mask.shape == (0,)
+    assert empty.top_k(mask, "생중량").empty
+    assert empty.page(mask, "잎 수", True, 1, 25).empty
+
+
+def test_empty_index_through_builder():
+    analytics.clear_caches()
+    assert len(analytics.build_plant_index({})) == 0
+
+
+def test_range_mask_matches_brute_force(index):
+    values = index.frame["생중량"].to_numpy(dtype=float)
+    lo, hi = np.nanpercentile(values, [20, 70])
+    with np.errstate(invalid="ignore"):
+        expected = (values >= lo) & (values <= hi)
+    np.testing.assert_array_equal(index.range_mask("생중량", lo, hi), expected)
+
+
+def test_select_combines_conditions(index):
+    frame = index.frame
+    lo, hi = 70.0, 95.0
+    school = SCHOOL_NAMES_BY_EC[1]
+    mask = index.select({"지상부 길이": (lo, hi)}, [school], "전체")
+    expected = frame["지상부 길이"].between(lo, hi).to_numpy() & (frame["학교"] == school).to_numpy() \
+        & index.any_outlier
+    np.testing.assert_array_equal(mask, expected)
+
+
+def test_full_range_keeps_missing_values(index):
+    bounds = {attr: index.bounds(attr) for attr in PLANT_ATTRIBUTES}
+    assert index.select(bounds).all()
+
+
+def test_top_k_and_paging(index):
+    mask = index.select(schools=list(SCHOOL_NAMES_BY_EC[:2]))
+    subset = index.frame[mask]
+    top = index.top_k(mask, "생중량", k=5, largest=True)
+    assert top["생중량"].tolist() == subset["생중량"].nlargest(5).tolist()
+    bottom = index.top_k(mask, "생중량", k=5, largest=False)
+    assert bottom["생중량"].tolist() == subset["생중량"].nsmallest(5).tolist()
+
+    pages = pd.concat([index.page(mask, "생중량", True, p, 50) for p in range(1, 14)])
+    assert len(pages) == mask.sum()
+    assert pages["생중량"].isna().sum() == subset["생중량"].isna().sum()
+    assert pages["생중량"].dropna().is_monotonic_decreasing
+    assert pages["생중량"].iloc[-subset["생중량"].isna().sum():].isna().all()   # 값이 없는 개체는 마지막
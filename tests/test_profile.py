@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+
+import analytics
+
+
+def minute_frame(days: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    times = pd.date_range("2025-05-01", periods=days * 24 * 60, freq="min")
+    values = rng.normal(20, 3, len(times))
+    values[rng.random(len(times)) < 0.1] = np.nan
+    return pd.DataFrame({"time": times, "temperature": values})
+
+
+def groupby_grid(frame: pd.DataFrame, rows: pd.Series) -> pd.DataFrame:
+    return frame.groupby([rows, frame["time"].dt.hour])["temperature"].mean().unstack()
+
+
+def test_weekday_grid_matches_groupby():
+    frame = minute_frame(21)
+    grid = analytics.compute_profile_grid(frame, "temperature", "시간 × 요일")
+    assert grid.shape == (7, 24) and list(grid.index) == analytics.WEEKDAY_LABELS
+    expected = groupby_grid(frame, frame["time"].dt.weekday)
+    np.testing.assert_allclose(grid.to_numpy(), expected.to_numpy(), rtol=1e-12)
+
+
+def test_date_grid_keeps_empty_days_and_hours():
+    frame = minute_frame(5)
+    frame.loc[frame["time"].dt.date == pd.Timestamp("2025-05-03").date(), "temperature"] = np.nan
+    frame.loc[frame["time"].dt.hour == 7, "temperature"] = np.nan
+    grid = analytics.compute_profile_grid(frame, "temperature", "시간 × 날짜")
+    assert list(grid.index) == ["05-01", "05-02", "05-03", "05-04", "05-05"]
+    assert grid.loc["05-03"].isna().all() and grid[7].isna().all()
+    expected = groupby_grid(frame, frame["time"].dt.normalize()).reindex(columns=range(24))
+    np.testing.assert_allclose(grid.to_numpy(), expected.to_numpy(), rtol=1e-12, equal_nan=True)
+
+
+def test_empty_frame_gives_empty_date_grid():
+    frame = pd.DataFrame({"time": pd.to_datetime([]), "temperature": []})
+    assert analytics.compute_profile_grid(frame, "temperature", "시간 × 날짜").empty
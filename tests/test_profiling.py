@@ -0,0 +1,19 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import profiling
+
+
+def test_concurrent_textfile_writes(tmp_path):
+    target = tmp_path / "dashboard.prom"
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        list(pool.map(lambda _: profiling.write_textfile(str(target)), range(200)))
+    assert "dashboard_reruns_total" in target.read_text(encoding="utf-8")
+    assert list(tmp_path.iterdir()) == [target]   # 임시 파일이 남지 않음
+
+
+def test_finish_run_swallows_export_errors(tmp_path):
+    blocker = tmp_path / "file"
+    blocker.write_text("x")
+    profiling.start_run()
+    run = profiling.finish_run(str(blocker / "metrics.prom"))   # 부모가 파일이라 쓸 수 없음
+    assert run is not None and run["total_s"] >= 0
@@ -0,0 +1,30 @@
+import shutil
+from pathlib import Path
+
+import report
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def test_report_pages_and_section_cache(tmp_path):
+    data_dir = tmp_path / "data"
+    data_dir.mkdir()
+    for source in list(DATA_DIR.glob("아라고_*.csv")) + list(DATA_DIR.glob("하늘고_*.csv")):
+        shutil.copy(source, data_dir / source.name)
+    out_dir = tmp_path / "report"
+
+    first = report.build_report(data_dir, out_dir, workers=2)
+    assert first["pages"] == 3 and first["cached"] == 0 and first["rendered"] == first["sections"]
+    index = (out_dir / "index.html").read_text(encoding="utf-8")
+    assert 'id="conclusions"' in index and 'id="ec_weight"' in index and "하늘고.html" in index
+    school_page = (out_dir / "아라고.html").read_text(encoding="utf-8")
+    assert 'id="timeseries"' in school_page and "plotly-graph-div" in school_page
+    assert (out_dir / report.PLOTLY_JS).exists()
+
+    second = report.build_report(data_dir, out_dir, workers=2)
+    assert second["rendered"] == 0 and second["cached"] == second["sections"]   # 바뀐 것이 없으면 모두 재사용
+
+    env_file = data_dir / "아라고_환경데이터.csv"
+    env_file.write_text(env_file.read_text(encoding="utf-8-sig") + "\n", encoding="utf-8-sig")
+    third = report.build_report(data_dir, out_dir, workers=2)
+    assert third["rendered"] == third["sections"]                                  # 데이터가 바뀌면 다시 렌더링
@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+import sqlstore
+from analytics import ENV_METRICS, PROFILE_LAYOUTS
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+@pytest.fixture(scope="module")
+def db(tmp_path_factory):
+    path = tmp_path_factory.mktemp("sql") / "dashboard.sqlite"
+    sqlstore.import_csv(path, DATA_DIR)
+    return path
+
+
+@pytest.fixture(scope="module")
+def env_data():
+    return analytics.load_environment_data(DATA_DIR)
+
+
+@pytest.fixture(scope="module")
+def growth_data():
+    return analytics.load_growth_data(DATA_DIR)
+
+
+def assert_tables_equal(pushdown: pd.DataFrame, memory: pd.DataFrame):
+    pd.testing.assert_frame_equal(pushdown.reset_index(drop=True), memory.reset_index(drop=True),
+                                  check_dtype=False, check_exact=False, rtol=1e-9)
+
+
+def test_env_summary(db, env_data):
+    assert_tables_equal(sqlstore.build_env_summary(db), analytics.build_env_summary(env_data))
+
+
+def test_plant_tables(db, growth_data):
+    assert_tables_equal(sqlstore.build_ec_weight_table(db), analytics.build_ec_weight_table(growth_data))
+    assert_tables_equal(sqlstore.build_length_table(db), analytics.build_length_table(growth_data))
+
+
+def test_overview_metrics(db, env_data, growth_data):
+    pushdown = sqlstore.compute_overview_metrics(db)
+    memory = analytics.compute_overview_metrics(env_data, growth_data)
+    assert pushdown["total_count"] == memory["total_count"]
+    assert pushdown["avg_temp"] == pytest.approx(memory["avg_temp"])
+    assert pushdown["avg_humid"] == pytest.approx(memory["avg_humid"])
+
+
+@pytest.mark.parametrize("metric", list(ENV_METRICS))
+@pytest.mark.parametrize("layout", PROFILE_LAYOUTS)
+def test_profile_grid(db, env_data, metric, layout):
+    school = "아라고"
+    frame = analytics.prepare_env_frame(env_data[school])
+    memory = analytics.compute_profile_grid(frame, metric, layout)
+    pushdown = sqlstore.compute_profile_grid(db, school, metric, layout)
+    np.testing.assert_allclose(pushdown.to_numpy(), memory.to_numpy(), rtol=1e-9, equal_nan=True)
+    assert list(pushdown.index) == list(memory.index)
+
+
+def test_filtered_load_matches_in_memory_filter(db, env_data):
+    frame = analytics.prepare_env_frame(env_data["아라고"])
+    first_day = frame["time"].iloc[0].date()
+    start, end = sqlstore.date_range_bounds(first_day + pd.Timedelta(days=1), first_day + pd.Timedelta(days=2))
+    pushed = sqlstore.load_environment_data(db, start, end, schools=["아라고"])
+    assert list(pushed) == ["아라고"]
+
+    expected = frame[(frame["time"] >= pd.Timestamp(start)) & (frame["time"] < pd.Timestamp(end))]   # [start, end) 반열린 구간
+    got = analytics.prepare_env_frame(pushed["아라고"])
+    assert 0 < len(got) == len(expected)
+    np.testing.assert_allclose(got[list(ENV_METRICS)].to_numpy(), expected[list(ENV_METRICS)].to_numpy(),
+                               equal_nan=True)
+
+
+@pytest.mark.parametrize("layout", PROFILE_LAYOUTS)
+def test_profile_grid_keeps_null_only_edge_days(tmp_path, layout):
+    times = pd.date_range("2025-05-26", periods=72, freq="h")
+    ec = np.linspace(1.0, 2.0, 72)
+    ec[:24] = np.nan                              # 첫날과 마지막 날 오후는 EC 값이 없음
+    ec[-6:] = np.nan
+    pd.DataFrame({"time": times.strftime("%Y-%m-%d %H:%M:%S"), "temperature": 20.0, "humidity": 60.0,
+                  "ph": 6.0, "ec": ec}).to_csv(tmp_path / "아라고_환경데이터.csv", index=False)
+    sqlstore.import_csv(tmp_path / "edge.sqlite", tmp_path)
+
+    frame = analytics.prepare_env_frame(analytics.load_environment_data(tmp_path)["아라고"])
+    memory = analytics.compute_profile_grid(frame, "ec", layout)
+    pushdown = sqlstore.compute_profile_grid(tmp_path / "edge.sqlite", "아라고", "ec", layout)
+    assert list(pushdown.index) == list(memory.index)
+    np.testing.assert_allclose(pushdown.to_numpy(), memory.to_numpy(), rtol=1e-9, equal_nan=True)
@@ -0,0 +1,19 @@
+import re
+from pathlib import Path
+
+import startup_report
+
+STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
+
+
+def test_main_import_defers_optional_modules():
+    loaded = startup_report.loaded_modules("main")
+    assert "main" in loaded
+    assert not [m for m in startup_report.DEFERRED_MODULES if m in loaded]
+
+
+def test_stylesheet_urls_are_shipped():
+    # 정적 CSS 가 참조하는 파일은 모두 저장소에 있어야 함 (없으면 브라우저가 404 를 받음)
+    css = (STATIC_DIR / "dashboard.css").read_text(encoding="utf-8")
+    for url in re.findall(r"url\(['\"]?([^'\")]+)['\"]?\)", css):
+        assert (STATIC_DIR / url).exists(), url
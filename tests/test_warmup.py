@@ -0,0 +1,27 @@
+import shutil
+from pathlib import Path
+
+import warmup
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def make_partitions(root: Path, names: list[str]):
+    for name in names:
+        target = root / name
+        target.mkdir(parents=True)
+        for source in DATA_DIR.glob("아라고_*.csv"):
+            shutil.copy(source, target / source.name)
+
+
+def test_recently_viewed_partitions_are_kept(tmp_path):
+    make_partitions(tmp_path, ["2024", "2025"])
+    worker = warmup.PrecomputeWorker(tmp_path, max_partitions=1)
+    assert worker.refresh() == 1
+    assert worker.get(tmp_path / "2024") is not None        # 아무도 보지 않았으면 발견 순서
+
+    worker.touch(tmp_path / "2025")
+    assert worker.refresh() == 1
+    assert worker.get(tmp_path / "2025") is not None
+    assert worker.get(tmp_path / "2024") is None
+    assert worker.refresh() == 0                            # 지문이 그대로면 다시 만들지 않음
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import analytics
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+
+
+def growth_with_blank_rows() -> pd.DataFrame:
+    rng = np.random.default_rng(7)
+    rows = 60
+    df = pd.DataFrame({
+        "개체번호": np.arange(1, rows + 1),
+        "잎 수(장)": rng.integers(2, 12, rows),
+        "지상부 길이(mm)": rng.integers(40, 120, rows),
+        "생중량(g)": rng.gamma(2.0, 5.0, rows).round(2),
+        "비고": np.where(rng.random(rows) < 0.2, "시듦", None),
+    })
+    df.loc[[5, 6, 30], :] = None          # 중간 빈 행
+    return pd.concat([df, pd.DataFrame([[None] * df.shape[1]] * 4, columns=df.columns)], ignore_index=True)
+
+
+@pytest.fixture
+def paired_files(tmp_path):
+    frame = growth_with_blank_rows()
+    csv_path = tmp_path / "아라고_생육결과데이터.csv"
+    xlsx_path = tmp_path / "아라고_생육결과데이터.xlsx"
+    frame.to_csv(csv_path, index=False, encoding="utf-8-sig")
+    frame.to_excel(xlsx_path, index=False)
+    return csv_path, xlsx_path
+
+
+def test_blank_rows_and_dtypes_match_csv(paired_files):
+    csv_path, xlsx_path = paired_files
+    from_csv = analytics.read_school_file(csv_path, lower_columns=False)
+    from_xlsx = analytics.read_school_file(xlsx_path, lower_columns=False)
+    assert len(from_xlsx) == len(from_csv) == 64
+    pd.testing.assert_frame_equal(from_xlsx, from_csv)
+
+
+def test_block_boundaries_do_not_change_result(paired_files, monkeypatch):
+    csv_path, xlsx_path = paired_files
+    assert len(list(analytics.iter_xlsx_blocks(xlsx_path, block_rows=7))) == 10
+    monkeypatch.setattr(analytics, "XLSX_BLOCK_ROWS", 7)
+    pd.testing.assert_frame_equal(analytics.read_school_file(xlsx_path, lower_columns=False),
+                                  analytics.read_school_file(csv_path, lower_columns=False))
+
+
+@pytest.mark.parametrize("name", ["아라고_환경데이터", "아라고_생육결과데이터"])
+def test_repository_data_round_trip(tmp_path, name):
+    from_csv = analytics.read_school_file(DATA_DIR / f"{name}.csv", lower_columns=True)
+    xlsx_path = tmp_path / f"{name}.xlsx"
+    pd.read_csv(DATA_DIR / f"{name}.csv", encoding="utf-8-sig").to_excel(xlsx_path, index=False)
+    pd.testing.assert_frame_equal(analytics.read_school_file(xlsx_path, lower_columns=True), from_csv)
+
+
+def test_header_only_sheet_yields_empty_frame(tmp_path):
+    path = tmp_path / "빈시트.xlsx"
+    pd.DataFrame(columns=["time", "ec"]).to_excel(path, index=False)
+    blocks = list(analytics.iter_xlsx_blocks(path))
+    assert len(blocks) == 1 and blocks[0].empty and list(blocks[0].columns) == ["time", "ec"]
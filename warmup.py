@@ -0,0 +1,203 @@
+# ==============================================================================
+# 🌱 극지식물 EC 연구 - 백그라운드 사전 계산 (사용자 세션과 별도 스레드)
+# 데이터셋 지문이 바뀐 파티션을 감지해 원본 · 집계 · 모델 적합 · 그래프 · 내보내기 파일을
+# 스냅숏 하나로 미리 만들고, 완성된 뒤에만 참조를 바꿔 끼움 (사용자는 항상 완성본만 읽음)
+#
+#   DASHBOARD_PRECOMPUTE=30 streamlit run main.py   # 30초마다 변경 확인 (0 이면 끔)
+#   python warmup.py --data-dir data                # 한 번 만들어 보고 단계별 시간 출력
+# ==============================================================================
+
+from pathlib import Path
+import argparse
+import logging
+import threading
+import time
+
+import analytics
+from analytics import SCHOOL_NAMES_BY_EC, ENV_METRICS, PROFILE_LAYOUTS
+
+logger = logging.getLogger("dashboard.warmup")
+
+# ==============================================================================
+# 1. 스냅숏 생성
+# ==============================================================================
+# artifacts 키는 대시보드가 조회하는 단위와 같음 - ("figure", 이름, ...) 는 완성된 plotly 그래프
+def build_snapshot(data_dir: Path, fingerprint: str | None = None) -> dict:
+    import figures  # plotly 는 백그라운드 스레드에서만 로드
+
+    timings = {}
+    artifacts = {}
+
+    def step(name: str, compute):
+        t = time.perf_counter()
+        value = compute()
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - t
+        return value
+
+    fingerprint = fingerprint or analytics.dataset_fingerprint(data_dir)
+    env_data = step("load", lambda: analytics.load_environment_data(data_dir))
+    growth_data = step("load", lambda: analytics.load_growth_data(data_dir))
+
+    # 연구 개요 · 환경 분석
+    artifacts["overview"] = step("aggregate", lambda: analytics.compute_overview_metrics(env_data, growth_data))
+    env_summary = artifacts["env_summary"] = step("aggregate", lambda: analytics.build_env_summary(env_data))
+    if not env_summary.empty:
+        artifacts["figure", "env_summary"] = step("figure", lambda: figures.build_env_summary_figure(env_summary))
+
+    frames = {school: step("aggregate", lambda: analytics.prepare_env_frame(df)) for school, df in env_data.items()}
+    cumulative = {}
+    for school, frame in frames.items():
+        if frame.empty:
+            continue
+        for metric in figures.TIMESERIES_STYLES:
+            if frame[metric].notna().any():
+                artifacts["figure", "timeseries", school, metric] = step(
+                    "figure", lambda: figures.build_timeseries_figure(frame, metric, school))
+        if frame["time"].dt.hour.nunique() >= 2:
+            for metric in ENV_METRICS:
+                for layout in PROFILE_LAYOUTS:
+                    grid = step("profile", lambda: analytics.compute_profile_grid(frame, metric, layout))
+                    artifacts["figure", "profile", school, metric, layout] = step(
+                        "figure", lambda: figures.build_profile_figure(grid, school, metric, layout))
+        cumulative[school] = step("cumulative", lambda: analytics.compute_cumulative_indices(frame))
+        artifacts["export", "env_csv", school] = step("export", lambda: analytics.export_env_csv(env_data[school]))
+
+    # 브라우저 필터 모드용 전체 학교 통합 그래프 (학교별 trace 묶음 / 프로필 격자를 조립)
+    for metric in figures.TIMESERIES_STYLES:
+        bundles = {school: figures.timeseries_trace_bundle(frames[school], metric, school)
+                   for school in SCHOOL_NAMES_BY_EC
+                   if school in frames and not frames[school].empty and frames[school][metric].notna().any()}
+        if bundles:
+            artifacts["figure", "timeseries_bundle", metric] = step(
+                "figure", lambda: figures.build_timeseries_bundle_figure(bundles, metric))
+    for metric in ENV_METRICS:
+        for layout in PROFILE_LAYOUTS:
+            profiles = {school: analytics.compute_profile_grid(frames[school], metric, layout)
+                        for school in SCHOOL_NAMES_BY_EC
+                        if school in frames and not frames[school].empty and frames[school]["time"].dt.hour.nunique() >= 2}
+            if profiles:
+                artifacts["figure", "profile_bundle", metric, layout] = step(
+                    "figure", lambda: figures.build_profile_bundle_figure(profiles, metric, layout))
+
+    # 사이드바 학교 선택("전체" 또는 학교 하나)마다 누적 지수 그래프
+    for selection in [tuple(SCHOOL_NAMES_BY_EC)] + [(school,) for school in SCHOOL_NAMES_BY_EC]:
+        subset = {school: cumulative[school] for school in selection if school in cumulative}
+        artifacts["figure", "cumulative", selection] = step("figure", lambda: figures.build_cumulative_figure(subset))
+
+    # 생육 결과
+    ec_weight = artifacts["ec_weight"] = step("aggregate", lambda: analytics.build_ec_weight_table(growth_data))
+    if not ec_weight.empty:
+        trend = step("model", lambda: analytics.fit_weight_trend(ec_weight))
+        artifacts["figure", "ec_weight"] = step("figure", lambda: figures.build_ec_weight_figure(ec_weight, trend, analytics.optimal_school(ec_weight)))
+    length = artifacts["length"] = step("aggregate", lambda: analytics.build_length_table(growth_data))
+    if not length.empty:
+        artifacts["figure", "length"] = step("figure", lambda: figures.build_length_figure(length))
+    combined = step("aggregate", lambda: analytics.build_growth_long(growth_data))
+    weight_col = analytics.get_column_safe(combined, ["생중량", "weight"]) if not combined.empty else None
+    if weight_col:
+        artifacts["figure", "weight_box"] = step("figure", lambda: figures.build_weight_box_figure(combined, weight_col))
+    artifacts["plant_index"] = step("index", lambda: analytics.build_plant_index(growth_data))
+    if growth_data:
+        artifacts["export", "growth_xlsx"] = step("export", lambda: analytics.export_growth_xlsx(growth_data))
+
+    # 상관 분석
+    if env_data and growth_data:
+        features = artifacts["features"] = step("model", lambda: analytics.build_feature_table(env_data, str(Path(data_dir).resolve())))
+        outcomes = artifacts["outcomes"] = step("model", lambda: analytics.build_growth_outcomes(growth_data))
+        corr = artifacts["correlation"] = step("model", lambda: analytics.build_feature_correlation(features, outcomes))
+        if not corr.empty:
+            artifacts["figure", "correlation"] = step("figure", lambda: figures.build_correlation_figure(corr))
+
+    return {
+        "data_dir": str(Path(data_dir).resolve()),
+        "fingerprint": fingerprint,
+        "built_at": time.time(),
+        "timings": timings,
+        "env_data": env_data,
+        "growth_data": growth_data,
+        "artifacts": artifacts,
+    }
+
+# ==============================================================================
+# 2. 백그라운드 작업자
+# ==============================================================================
+class PrecomputeWorker:
+    def __init__(self, data_dir: Path = analytics.DATA_DIR, interval: float = 30.0, max_partitions: int = 3):
+        self.data_dir = data_dir
+        self.interval = interval
+        self.max_partitions = max_partitions
+        # 파티션 경로 -> 스냅숏. 항상 새 dict 로 통째로 바꿔 끼우므로 읽는 쪽은 잠금이 필요 없음
+        self._snapshots: dict[str, dict] = {}
+        self._accessed: dict[str, float] = {}   # 파티션 경로 -> 마지막으로 사용자가 본 시각
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="precompute", daemon=True)
+
+    def start(self) -> "PrecomputeWorker":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def get(self, data_dir: Path) -> dict | None:
+        return self._snapshots.get(str(Path(data_dir).resolve()))
+
+    def touch(self, data_dir: Path):
+        # 사용자가 본 파티션을 기록 - 스냅숏이 없는 파티션이면 다음 주기를 기다리지 않고 만들도록 깨움
+        key = str(Path(data_dir).resolve())
+        self._accessed[key] = time.time()
+        if key not in self._snapshots:
+            self._wake.set()
+
+    def refresh(self) -> int:
+        # 최근에 본 파티션부터 max_partitions 개만 유지 (아직 아무도 보지 않았으면 발견 순서)
+        # 지문이 바뀐 파티션만 다시 만들고, 밀려났거나 사라진 파티션의 스냅숏은 버림 - 다시 만든 개수를 돌려줌
+        partitions = analytics.discover_partitions(self.data_dir)
+        accessed = dict(self._accessed)
+        partitions.sort(key=lambda part: -accessed.get(str(analytics.partition_dir(self.data_dir, part["id"])), 0.0))
+        partitions = partitions[:self.max_partitions]
+        keep = set()
+        rebuilt = 0
+        for part in partitions:
+            part_dir = analytics.partition_dir(self.data_dir, part["id"])
+            key = str(part_dir)
+            keep.add(key)
+            snapshot = self._snapshots.get(key)
+            if snapshot is None or snapshot["fingerprint"] != part["fingerprint"]:
+                snapshot = build_snapshot(part_dir, part["fingerprint"])
+                self._snapshots = {**self._snapshots, key: snapshot}
+                rebuilt += 1
+                logger.info("snapshot %s rebuilt in %.2fs", part["id"] or "(root)", sum(snapshot["timings"].values()))
+        self._snapshots = {key: snapshot for key, snapshot in self._snapshots.items() if key in keep}
+        return rebuilt
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wake.clear()   # 갱신 도중 들어온 touch 는 다음 대기를 바로 깨움
+            try:
+                self.refresh()
+            except Exception:
+                # 실패해도 이전 스냅숏을 계속 제공하고 다음 주기에 다시 시도
+                logger.exception("precompute failed")
+            self._wake.wait(self.interval)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대시보드 스냅숏 사전 계산 (단계별 시간 측정)")
+    parser.add_argument("--data-dir", type=Path, default=analytics.DATA_DIR)
+    args = parser.parse_args()
+
+    analytics.register_dataset_schools(args.data_dir)
+
+    t = time.perf_counter()
+    snapshot = build_snapshot(args.data_dir)
+    print(f"{snapshot['data_dir']}: {len(snapshot['artifacts'])}개 항목, {time.perf_counter() - t:.2f}s "
+          f"(지문 {snapshot['fingerprint'][:12]})")
+    for name, seconds in sorted(snapshot["timings"].items(), key=lambda x: x[1], reverse=True):
+        print(f"  {name:<12} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()